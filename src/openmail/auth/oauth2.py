@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Hashable, Optional
 
 from openmail.auth.base import AuthContext
+from openmail.auth.token_cache import TOKEN_CACHE, TokenResult, credential_key
 from openmail.errors import AuthError
 
 
@@ -12,18 +13,45 @@ from openmail.errors import AuthError
 class OAuth2Auth:
     """
     XOAUTH2-based auth. You provide a function that returns a fresh access token.
-    - token_provider() -> access_token (string)
+    - token_provider() -> access_token (string), or (access_token, expires_in)
+
+    Tokens are shared through the process-wide TOKEN_CACHE until shortly
+    before they expire, so IMAP and SMTP connects don't each hit the token
+    endpoint. A bare string is cached for token_ttl seconds (not at all when
+    token_ttl is None). A token the server rejects is dropped from the cache.
     """
 
     username: str
-    token_provider: Callable[..., str]
+    token_provider: Callable[..., TokenResult]
+    token_ttl: Optional[float] = None
+
+    def _cache_key(self) -> Optional[Hashable]:
+        key = (credential_key(self.username), self.token_provider)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _access_token(self) -> str:
+        key = self._cache_key()
+        if key is None:
+            result = self.token_provider()
+            return result[0] if isinstance(result, tuple) else result
+        return TOKEN_CACHE.get_or_fetch(key, self.token_provider, default_ttl=self.token_ttl)
+
+    def _forget_token(self) -> None:
+        key = self._cache_key()
+        if key is not None:
+            TOKEN_CACHE.invalidate(key)
 
     def _raw_xoauth2(self, access_token: str) -> str:
         return f"user={self.username}\x01auth=Bearer {access_token}\x01\x01"
 
     def apply_imap(self, conn, ctx: AuthContext) -> None:
+        token = None
         try:
-            token = self.token_provider()
+            token = self._access_token()
             if not token:
                 raise AuthError("OAuth2 token provider returned empty token")
 
@@ -36,6 +64,9 @@ class OAuth2Auth:
             if typ != "OK":
                 raise AuthError(f"IMAP XOAUTH2 auth failed (non-OK response: {typ}, {data})")
         except Exception as e:
+            # imaplib raises IMAP4.error on NO rather than returning it
+            if token:
+                self._forget_token()
             raise AuthError(f"IMAP XOAUTH2 auth failed: {e}") from e
 
     def apply_smtp(self, server, ctx: AuthContext) -> None:
@@ -44,7 +75,7 @@ class OAuth2Auth:
         so we send AUTH XOAUTH2 with a base64-encoded initial response.
         """
         try:
-            token = self.token_provider()
+            token = self._access_token()
             if not token:
                 raise AuthError("OAuth2 token provider returned empty token")
 
@@ -53,6 +84,7 @@ class OAuth2Auth:
 
             code, resp = server.docmd("AUTH", "XOAUTH2 " + auth_b64)
             if code != 235:
+                self._forget_token()
                 raise AuthError(f"SMTP XOAUTH2 auth failed: {code} {resp!r}")
         except Exception as e:
             raise AuthError(f"SMTP XOAUTH2 auth failed: {e}") from e
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 from dataclasses import dataclass
 
 from openmail.auth.base import AuthContext
 from openmail.errors import AuthError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False)
 class PasswordAuth:
+    """
+    Username/password login. The password never shows up in repr(), equality
+    compares it in constant time, and the hash is derived from a digest, so
+    instances are safe to use as cache keys.
+    """
+
     username: str
     password: str
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PasswordAuth):
+            return NotImplemented
+        same_password = hmac.compare_digest(
+            self.password.encode("utf-8", "surrogatepass"),
+            other.password.encode("utf-8", "surrogatepass"),
+        )
+        return same_password and self.username == other.username
+
+    def __hash__(self) -> int:
+        h = hashlib.sha256()
+        h.update(self.username.encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+        h.update(self.password.encode("utf-8", "surrogatepass"))
+        return int.from_bytes(h.digest()[:8], "big")
+
+    def __repr__(self) -> str:
+        return f"PasswordAuth(username={self.username!r}, password=***)"
+
     def apply_smtp(self, server, ctx: AuthContext) -> None:
         try:
             server.login(self.username, self.password)
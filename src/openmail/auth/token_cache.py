@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+# What a token provider may return: a bare token, or (token, expires_in seconds)
+TokenResult = Union[str, Tuple[str, Optional[float]]]
+
+
+@dataclass
+class _Entry:
+    token: str
+    exp: float  # time.monotonic() deadline
+
+
+class TokenCache:
+    """
+    Process-wide, thread-safe cache of access tokens.
+
+    Entries expire `skew` seconds before the provider said they would, so a
+    token is never handed out right at its deadline. Each key has its own
+    lock: concurrent connects that miss together trigger one fetch, not one
+    each.
+    """
+
+    def __init__(self, *, skew: float = 30.0) -> None:
+        self.skew = skew
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def _fresh(self, key: Hashable) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry.exp:
+            return entry.token
+        return None
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], TokenResult],
+        *,
+        default_ttl: Optional[float] = None,
+    ) -> str:
+        """
+        Cached token for key, or fetch() a new one.
+
+        fetch may return (token, expires_in); a bare token is cached for
+        default_ttl seconds, or not at all when that is None.
+        """
+        token = self._fresh(key)
+        if token is not None:
+            return token
+
+        with self._lock_for(key):
+            token = self._fresh(key)  # another thread may have just fetched
+            if token is not None:
+                return token
+
+            result = fetch()
+            if isinstance(result, tuple):
+                token, ttl = result
+            else:
+                token, ttl = result, default_ttl
+
+            if token and ttl is not None and ttl > self.skew:
+                self._entries[key] = _Entry(token, time.monotonic() + ttl - self.skew)
+            return token
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def credential_key(*parts: object) -> str:
+    """
+    Cache key derived from credential material, so secrets and usernames are
+    not kept around as plain dict keys.
+    """
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(repr(p).encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+TOKEN_CACHE = TokenCache()
@@ -15,6 +15,10 @@ class SMTPConfig:
     timeout: float = 30.0
     from_email: Optional[str] = None
     auth: Optional[SMTPAuth] = None
+    # >1 sends through an SMTPConnectionPool of this many connections
+    pool_size: int = 1
+    # with use_starttls, try implicit TLS on 465 first (saves a round trip)
+    prefer_implicit_tls: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import html as _html
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.message import EmailMessage as PyEmailMessage
-from typing import Dict, List, Optional, Sequence, Set
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
-from openmail.imap import IMAPClient, PagedSearchResult
+from openmail.imap import IMAPClient, IMAPQuery, PagedSearchResult
 from openmail.models import (
     Attachment,
     EmailMessage,
@@ -14,11 +28,18 @@ from openmail.models import (
     UnsubscribeCandidate,
 )
 from openmail.smtp import SMTPClient
+from openmail.smtp.builder import (
+    add_attachment_stream,
+    add_raw_message_attachment,
+    body_cte,
+    parsed_header,
+)
 from openmail.subscription import SubscriptionDetector, SubscriptionService
 from openmail.types import EmailRef, SendResult
 from openmail.utils import (
     build_references,
     dedup_addrs,
+    dedup_envelope,
     ensure_forward_subject,
     ensure_reply_subject,
     get_header,
@@ -38,6 +59,33 @@ FLAGGED = r"\Flagged"
 DELETED = r"\Deleted"
 DRAFT = r"\Draft"
 
+# Prebuilt flag sets for the mark_*/flag helpers
+SEEN_SET = frozenset({SEEN})
+ANSWERED_SET = frozenset({ANSWERED})
+FLAGGED_SET = frozenset({FLAGGED})
+DELETED_SET = frozenset({DELETED})
+DRAFT_SET = frozenset({DRAFT})
+
+# Headers compose() sets itself; extra_headers may not override them.
+_RESERVED_HEADERS = frozenset({"from", "to", "cc", "bcc", "subject"})
+
+# IMAPClient keeps one connection per thread, so async health checks ping
+# IMAP from this one thread rather than whichever default-executor thread is
+# free; each client then holds a single extra session however often it runs.
+_IMAP_PING_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="openmail-imap-ping")
+
+
+def _ping(ping: Callable[[], None]) -> bool:
+    try:
+        ping()
+    except Exception:
+        return False
+    return True
+
+
+def _frozen(flags: AbstractSet[str]) -> FrozenSet[str]:
+    return flags if isinstance(flags, frozenset) else frozenset(flags)
+
 
 @dataclass(frozen=True)
 class EmailManager:
@@ -49,6 +97,7 @@ class EmailManager:
         msg: PyEmailMessage,
         text: Optional[str],
         html: Optional[str],
+        fast_cte: bool = False,
     ) -> None:
         """
         Set message body as:
@@ -56,14 +105,16 @@ class EmailManager:
         - multipart/alternative if both text and html are provided
         - html-only if only html is provided
         """
+        cte = body_cte if fast_cte else lambda body: None
         if html is not None:
             if text:
-                msg.set_content(text)
-                msg.add_alternative(html, subtype="html")
+                msg.set_content(text, cte=cte(text))
+                msg.add_alternative(html, subtype="html", cte=cte(html))
             else:
-                msg.set_content(html, subtype="html")
+                msg.set_content(html, subtype="html", cte=cte(html))
         else:
-            msg.set_content(text or "")
+            text = text or ""
+            msg.set_content(text, cte=cte(text))
 
     def _add_attachment(
         self,
@@ -81,7 +132,15 @@ class EmailManager:
             maintype, _, subtype = content_type.partition("/")
             data = att.data
             filename = att.filename
-            if data is not None:
+            if att.stream is not None:
+                add_attachment_stream(
+                    msg,
+                    att.stream,
+                    maintype=maintype or "application",
+                    subtype=subtype or "octet-stream",
+                    filename=filename,
+                )
+            elif data is not None:
                 msg.add_attachment(
                     data,
                     maintype=maintype or "application",
@@ -95,16 +154,7 @@ class EmailManager:
         addr_headers.extend(msg.get_all("Cc", []))
         addr_headers.extend(msg.get_all("Bcc", []))
 
-        pairs = parse_addrs(*addr_headers)
-        # simple dedup by lowercase address
-        seen = set()
-        result: list[str] = []
-        for _, addr in pairs:
-            norm = addr.strip().lower()
-            if norm and norm not in seen:
-                seen.add(norm)
-                result.append(addr)
-        return result
+        return dedup_envelope(parse_addrs(*addr_headers))
 
     def fetch_message_by_ref(
         self,
@@ -133,6 +183,17 @@ class EmailManager:
             raise ValueError(f"No attachment found for ref: {ref!r} and part: {attachment_part!r}")
         return attachment
 
+    def fetch_attachments_by_ref(self, ref: EmailRef, parts: Sequence[str]) -> Dict[str, bytes]:
+        """
+        Fetch several attachments of one message in a single round trip.
+        Returns part -> bytes; raises ValueError if any part is missing.
+        """
+        out = self.imap.fetch_attachments(ref, parts)
+        missing = [p for p in parts if p not in out]
+        if missing:
+            raise ValueError(f"No attachment found for ref: {ref!r} and parts: {missing!r}")
+        return out
+
     def fetch_messages_by_multi_refs(
         self,
         refs: Sequence[EmailRef],
@@ -140,22 +201,67 @@ class EmailManager:
         include_attachment_meta: bool = False,
     ) -> List[EmailMessage]:
         """
-        Fetch multiple EmailMessage by EmailRef.
+        Fetch multiple EmailMessage by EmailRef. Refs may span mailboxes; each
+        mailbox is one UID FETCH, and mailboxes are fetched in parallel.
         """
         if not refs:
             return []
-        return list(self.imap.fetch(refs, include_attachment_meta=include_attachment_meta))
+        return self.imap.fetch_many(refs, include_attachment_meta=include_attachment_meta)
+
+    def iter_messages_by_multi_refs(
+        self,
+        refs: Sequence[EmailRef],
+        *,
+        include_attachment_meta: bool = False,
+        chunk_size: int = 50,
+    ) -> Iterator[EmailMessage]:
+        """
+        Like fetch_messages_by_multi_refs, but fetches chunk_size refs at a
+        time as the caller iterates, so only one chunk of messages (bodies
+        included) is held at once. Order follows refs; missing refs are skipped.
+        """
+        if chunk_size < 1:
+            raise ValueError("iter_messages_by_multi_refs(): chunk_size must be >= 1")
+        for i in range(0, len(refs), chunk_size):
+            yield from self.imap.fetch_many(
+                refs[i : i + chunk_size], include_attachment_meta=include_attachment_meta
+            )
+
+    def _envelope(self, msg: PyEmailMessage, caller: str) -> list[str]:
+        """
+        Envelope recipients from To/Cc/Bcc; Bcc is removed from msg in place.
+        """
+        # Cheap presence test before parsing any address headers.
+        if "To" not in msg and "Cc" not in msg and "Bcc" not in msg:
+            raise ValueError(f"{caller}: no recipients found in To/Cc/Bcc")
 
-    def send(self, msg: PyEmailMessage) -> SendResult:
         recipients = self._extract_envelope_recipients(msg)
 
         if "Bcc" in msg:
             del msg["Bcc"]
 
         if not recipients:
-            raise ValueError("send(): no recipients found in To/Cc/Bcc")
+            raise ValueError(f"{caller}: no recipients found in To/Cc/Bcc")
+        return recipients
+
+    def send(self, msg: PyEmailMessage) -> SendResult:
+        recipients = self._envelope(msg, "send()")
+
+        # msg is already modified in place above (Bcc), so no defensive copy.
+        return self.smtp.send(msg, recipients, mutate_ok=True)
 
-        return self.smtp.send(msg, recipients)
+    def send_many(self, msgs: Sequence[PyEmailMessage]) -> List[SendResult]:
+        """
+        Send several messages over the SMTP client's persistent connection
+        (connect + AUTH once, rotated per max_messages_per_connection).
+
+        Recipients come from each message's To/Cc/Bcc as in send(). A message
+        the server rejects gets SendResult(ok=False); the rest still go out.
+        """
+        batch = [(msg, self._envelope(msg, "send_many()")) for msg in msgs]
+        if not batch:
+            return []
+        return self.smtp.send_many(batch, mutate_ok=True)
 
     def compose(
         self,
@@ -169,6 +275,7 @@ class EmailManager:
         html: Optional[str] = None,
         attachments: Optional[Sequence[Attachment]] = None,
         extra_headers: Optional[Dict[str, str]] = None,
+        fast_cte: bool = False,
     ) -> PyEmailMessage:
         """
         Build a new outgoing email.
@@ -177,27 +284,31 @@ class EmailManager:
         - text/html: plain-text and/or HTML bodies
         - attachments: list of your Attachment models
         - extra_headers: optional extra headers (e.g. Reply-To)
+        - fast_cte: send bodies with over-long lines as base64 instead of
+          quoted-printable (faster to build, but not human-readable on the
+          wire and scored by some spam filters)
         """
 
         msg = PyEmailMessage()
 
+        # Repeated values (sender, subject, Cc lists in bulk sends) reuse
+        # their already parsed header; see parsed_header().
         if from_addr:
-            msg["From"] = from_addr
-        msg["To"] = ", ".join(to)
+            msg["From"] = parsed_header("From", from_addr)
+        msg["To"] = parsed_header("To", ", ".join(to))
         if cc:
-            msg["Cc"] = ", ".join(cc)
+            msg["Cc"] = parsed_header("Cc", ", ".join(cc))
         if bcc:
-            msg["Bcc"] = ", ".join(bcc)
+            msg["Bcc"] = parsed_header("Bcc", ", ".join(bcc))
 
-        msg["Subject"] = subject
+        msg["Subject"] = parsed_header("Subject", subject)
 
         if extra_headers:
             for k, v in extra_headers.items():
-                if k.lower() in {"from", "to", "cc", "bcc", "subject"}:
-                    continue
-                msg[k] = v
+                if k.lower() not in _RESERVED_HEADERS:
+                    msg[k] = parsed_header(k, v)
 
-        self._set_body(msg, text, html)
+        self._set_body(msg, text, html, fast_cte)
         self._add_attachment(msg, attachments)
 
         return msg
@@ -237,6 +348,84 @@ class EmailManager:
         )
         return self.send(msg)
 
+    def compose_and_send_many(self, drafts: Sequence[Mapping[str, Any]]) -> List[SendResult]:
+        """
+        Compose each draft (a dict of compose() keyword arguments) and send
+        them all as one batch over the same SMTP session.
+
+        The SMTP transport pipelines MAIL/RCPT/DATA when the server offers
+        PIPELINING, so each message costs about two round trips.
+        """
+        msgs: List[PyEmailMessage] = []
+        for d in drafts:
+            if not d.get("to") and not d.get("cc") and not d.get("bcc"):
+                raise ValueError(
+                    "compose_and_send_many(): every draft needs a recipient in to/cc/bcc"
+                )
+            msgs.append(self.compose(**d))
+        return self.send_many(msgs)
+
+    def compile_template(
+        self,
+        *,
+        subject: str,
+        from_addr: Optional[str] = None,
+        text: Optional[str] = None,
+        html: Optional[str] = None,
+        attachments: Optional[Sequence[Attachment]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Callable[..., PyEmailMessage]:
+        """
+        Prepare a message template for bulk sends and return a renderer:
+
+            render = mgr.compile_template(subject="Hi {name}", html=..., attachments=[...])
+            msgs = [render([addr], {"name": name}) for addr, name in rows]
+            mgr.send_many(msgs)
+
+        render(to, variables=None, *, cc=(), bcc=()) fills subject/text/html
+        with str.format_map(variables or {}), so literal braces are written
+        {{ and }} whether or not variables are passed, and composes the
+        message. Attachments are encoded
+        once here and the same parts are attached to every rendered message,
+        so treat them as read-only.
+        """
+        parts: List[PyEmailMessage] = []
+        if attachments:
+            scratch = PyEmailMessage()
+            scratch.set_content("")
+            self._add_attachment(scratch, attachments)
+            parts = scratch.get_payload()[1:]
+
+        def render(
+            to: Sequence[str],
+            variables: Optional[Mapping[str, Any]] = None,
+            *,
+            cc: Sequence[str] = (),
+            bcc: Sequence[str] = (),
+        ) -> PyEmailMessage:
+            values = variables if variables is not None else {}
+            subj = subject.format_map(values)
+            body_text = text.format_map(values) if text is not None else None
+            body_html = html.format_map(values) if html is not None else None
+
+            msg = self.compose(
+                subject=subj,
+                to=to,
+                from_addr=from_addr,
+                cc=cc,
+                bcc=bcc,
+                text=body_text,
+                html=body_html,
+                extra_headers=extra_headers,
+            )
+            if parts:
+                msg.make_mixed()
+                for part in parts:
+                    msg.attach(part)
+            return msg
+
+        return render
+
     def save_draft(
         self,
         *,
@@ -266,7 +455,7 @@ class EmailManager:
             attachments=attachments,
             extra_headers=extra_headers,
         )
-        return self.imap.append(mailbox, msg, flags={DRAFT})
+        return self.imap.append(mailbox, msg, flags=DRAFT_SET)
 
     def reply(
         self,
@@ -372,16 +561,15 @@ class EmailManager:
             primary = get_header(original.headers, "Reply-To") or original.from_email
             primary_pairs = parse_addrs(primary) if primary else []
 
-            to_str = ", ".join(original.to) if original.to else ""
-            cc_str = ", ".join(original.cc) if original.cc else ""
-            others_pairs = parse_addrs(to_str, cc_str)
+            # One value per address, so each hits parse_addrs' cache on its own.
+            others_pairs = parse_addrs(*map(str, original.to), *map(str, original.cc))
 
             if from_addr:
                 primary_pairs = remove_addr(primary_pairs, from_addr)
                 others_pairs = remove_addr(others_pairs, from_addr)
 
             primary_set = {addr.strip().lower() for _, addr in primary_pairs}
-            cc_pairs = [(n, a) for (n, a) in others_pairs if a.strip().lower() not in primary_set]
+            cc_pairs = [p for p in others_pairs if p[1].strip().lower() not in primary_set]
 
             to_addrs = dedup_addrs(primary_pairs)
             cc_addrs = dedup_addrs(cc_pairs)
@@ -462,17 +650,15 @@ class EmailManager:
             text_parts.append(quote_forward_text(original))
         text_body = "\n".join(text_parts)
 
-        if html is not None:
-            html_body = html
-        else:
-            html_parts: List[str] = []
-            if text:
-                html_parts.append(f"<p>{_html.escape(text)}</p>")
-            if include_original:
-                quoted_html = quote_forward_html(original)
-                if quoted_html is not None:
-                    html_parts.append(quoted_html)
-            html_body = "\n".join(html_parts) if html_parts else None
+        # Only build an HTML alternative when there is HTML to carry: the
+        # caller's, or the original's quoted HTML. Otherwise the plain-text
+        # body says it all and the message stays single-part.
+        html_body = html
+        if html is None and include_original:
+            quoted_html = quote_forward_html(original)
+            if quoted_html is not None:
+                intro = f"<p>{_html.escape(text)}</p>\n" if text else ""
+                html_body = intro + quoted_html
 
         # Subject default
         final_subject = subject or ensure_forward_subject(original.subject or "")
@@ -497,6 +683,44 @@ class EmailManager:
 
         return self.send(msg)
 
+    def forward_as_attachment(
+        self,
+        original: EmailMessage,
+        *,
+        to: Sequence[str],
+        text: Optional[str] = None,
+        html: Optional[str] = None,
+        from_addr: Optional[str] = None,
+        cc: Optional[Sequence[str]] = None,
+        bcc: Optional[Sequence[str]] = None,
+        subject: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> SendResult:
+        """
+        Forward an existing email as a message/rfc822 attachment.
+
+        The original source is fetched from IMAP and attached as-is, so its
+        attachments are never decoded and re-encoded (unlike forward()).
+        """
+        if not to:
+            raise ValueError("forward_as_attachment(): 'to' must contain at least one recipient")
+
+        raw = self.imap.fetch_raw(original.ref)
+        final_subject = subject or ensure_forward_subject(original.subject or "")
+
+        msg = self.compose(
+            subject=final_subject,
+            to=to,
+            from_addr=from_addr,
+            cc=cc or (),
+            bcc=bcc or (),
+            text=text,
+            html=html,
+            extra_headers=extra_headers,
+        )
+        add_raw_message_attachment(msg, raw, filename="forwarded.eml")
+        return self.send(msg)
+
     def imap_query(self, mailbox: str = "INBOX") -> EmailQuery:
         return EmailQuery(self, mailbox=mailbox)
 
@@ -578,71 +802,78 @@ class EmailManager:
 
         return msgs
 
-    def add_flags(self, refs: Sequence[EmailRef], flags: Set[str]) -> None:
+    def fetch_thread_overview(
+        self,
+        root: EmailMessage,
+        *,
+        mailbox: str = "INBOX",
+    ) -> List[EmailOverview]:
+        """
+        Overviews (headers + flags, no bodies or BODYSTRUCTURE) of the thread
+        rooted at `root`, in one FETCH; root's own overview comes first when
+        it lives in `mailbox`. Load a body on demand with fetch_message_by_ref.
+        """
+        refs: List[EmailRef] = []
+        if root.ref.mailbox == mailbox:
+            refs.append(root.ref)
+
+        if root.message_id:
+            q = self.imap_query(mailbox).for_thread_root(root).limit(200)
+            refs.extend(r for r in q.search().refs if r != root.ref)
+
+        if not refs:
+            return []
+        return self.imap.fetch_overview(refs)
+
+    def add_flags(self, refs: Sequence[EmailRef], flags: AbstractSet[str]) -> None:
         """Bulk add flags to refs."""
         if not refs:
             return
-        self.imap.add_flags(refs, flags=set(flags))
+        self.imap.add_flags(refs, flags=_frozen(flags))
 
-    def remove_flags(self, refs: Sequence[EmailRef], flags: Set[str]) -> None:
+    def remove_flags(self, refs: Sequence[EmailRef], flags: AbstractSet[str]) -> None:
         """Bulk remove flags from refs."""
         if not refs:
             return
-        self.imap.remove_flags(refs, flags=set(flags))
+        self.imap.remove_flags(refs, flags=_frozen(flags))
 
     def mark_seen(self, refs: Sequence[EmailRef]) -> None:
-        self.add_flags(refs, {SEEN})
+        self.add_flags(refs, SEEN_SET)
 
     def mark_all_seen(self, mailbox: str = "INBOX", *, chunk_size: int = 500) -> int:
-        total = 0
-
-        # Build a reusable EmailQuery for UNSEEN messages in this mailbox
-        q = self.imap_query(mailbox).limit(chunk_size)
-        q.query.unseen()
-
-        before_uid: Optional[int] = None
-        refresh = True  # do a real SEARCH once to build the cache
-
-        while True:
-            page = q.search(before_uid=before_uid, refresh=refresh)
-            refresh = False  # all further pages come from cache
-
-            refs = page.refs
-            if not refs:
-                break
-
-            self.add_flags(refs, {SEEN})
-            total += len(refs)
-
-            if not page.has_next or page.next_before_uid is None:
-                break
-
-            before_uid = page.next_before_uid
+        """
+        Mark every unseen message in mailbox as seen; returns how many were.
 
-        return total
+        One SEARCH UNSEEN, then silent STOREs of at most chunk_size messages
+        each, with runs of consecutive UIDs sent as ranges.
+        """
+        q = IMAPQuery().unseen()
+        return self.imap.add_flags_matching(
+            mailbox=mailbox, query=q, flags=SEEN_SET, uids_per_store=chunk_size
+        )
 
     def mark_unseen(self, refs: Sequence[EmailRef]) -> None:
-        self.remove_flags(refs, {SEEN})
+        self.remove_flags(refs, SEEN_SET)
 
     def flag(self, refs: Sequence[EmailRef]) -> None:
-        self.add_flags(refs, {FLAGGED})
+        self.add_flags(refs, FLAGGED_SET)
 
     def unflag(self, refs: Sequence[EmailRef]) -> None:
-        self.remove_flags(refs, {FLAGGED})
+        self.remove_flags(refs, FLAGGED_SET)
 
     def mark_answered(self, refs: Sequence[EmailRef]) -> None:
         if refs:
-            self.add_flags(refs, {ANSWERED})
+            self.add_flags(refs, ANSWERED_SET)
 
     def clear_answered(self, refs: Sequence[EmailRef]) -> None:
         if refs:
-            self.remove_flags(refs, {ANSWERED})
+            self.remove_flags(refs, ANSWERED_SET)
 
     def delete(self, refs: Sequence[EmailRef]) -> None:
-        self.add_flags(refs, {DELETED})
+        self.add_flags(refs, DELETED_SET)
 
     def undelete(self, refs: Sequence[EmailRef]) -> None:
-        self.remove_flags(refs, {DELETED})
+        self.remove_flags(refs, DELETED_SET)
 
     def expunge(self, mailbox: str = "INBOX") -> None:
         """
@@ -709,9 +940,11 @@ class EmailManager:
         limit: int = 200,
         since: Optional[str] = None,
         unseen_only: bool = False,
+        parallelism: int = 1,
     ) -> List[UnsubscribeCandidate]:
         """
-        Returns emails that expose List-Unsubscribe.
+        Returns emails that expose List-Unsubscribe. parallelism > 1 fetches
+        their headers over that many IMAP connections at once.
         """
         detector = SubscriptionDetector(self.imap)
         return detector.find(
@@ -719,6 +952,7 @@ class EmailManager:
             limit=limit,
             since=since,
             unseen_only=unseen_only,
+            parallelism=parallelism,
         )
 
     def unsubscribe_selected(
@@ -740,23 +974,27 @@ class EmailManager:
 
     def health_check(self) -> Dict[str, bool]:
         """
-        Run minimal IMAP + SMTP checks.
+        Run minimal IMAP + SMTP checks, concurrently: the SMTP ping runs on a
+        helper thread while IMAP pings on this thread's own connection.
         """
-        imap_ok = False
-        smtp_ok = False
-
-        try:
-            self.imap.ping()  # or list_mailboxes(), or NOOP
-            imap_ok = True
-        except Exception:
-            pass
+        smtp_ok: List[bool] = []
+        t = threading.Thread(target=lambda: smtp_ok.append(_ping(self.smtp.ping)), daemon=True)
+        t.start()
+        imap_ok = _ping(self.imap.ping)
+        t.join()
 
-        try:
-            self.smtp.ping()  # or EHLO/NOOP
-            smtp_ok = True
-        except Exception:
-            pass
+        return {"imap": imap_ok, "smtp": bool(smtp_ok and smtp_ok[0])}
 
+    async def health_check_async(self) -> Dict[str, bool]:
+        """
+        health_check() for asyncio callers; both pings run at the same time,
+        IMAP on a dedicated thread and SMTP in the loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        imap_ok, smtp_ok = await asyncio.gather(
+            loop.run_in_executor(_IMAP_PING_EXECUTOR, _ping, self.imap.ping),
+            loop.run_in_executor(None, _ping, self.smtp.ping),
+        )
         return {"imap": imap_ok, "smtp": smtp_ok}
 
     def close(self) -> None:
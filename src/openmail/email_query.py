@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
 
 from openmail.imap import IMAPQuery, PagedSearchResult
 from openmail.models import EmailMessage, EmailOverview
@@ -10,6 +11,60 @@ if TYPE_CHECKING:
     from openmail.email_manager import EmailManager
 
 
+@lru_cache(maxsize=256)
+def _any_of(method: str, values: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Tokens matching any of values through IMAPQuery.<method>: a single term,
+    or a balanced OR of them, most selective first. Triage loops ask for
+    the same sender/subject lists over and over, so the tokens are built
+    once per (method, values).
+    """
+    # Servers try OR operands left to right: full addresses before bare
+    # domains/fragments, longer (rarer) substrings before shorter ones.
+    ordered = sorted(values, key=lambda v: ("@" not in v or v.startswith("@"), -len(v)))
+    qs = [getattr(IMAPQuery(), method)(v) for v in ordered]
+    if len(qs) == 1:
+        return tuple(qs[0].parts)
+    return tuple(qs[0].or_(*qs[1:]).parts)
+
+
+# Fixed sub-queries, built once at import.
+_TRIAGE_OR = IMAPQuery().or_(IMAPQuery().unseen(), IMAPQuery().flagged()).build()
+_NEWSLETTER = IMAPQuery().header("List-Unsubscribe", "").build()
+_INVOICES = (
+    IMAPQuery()
+    .raw(*_any_of("subject", ("invoice", "receipt", "payment", "order confirmation")))
+    .build()
+)
+_SECURITY_ALERTS = (
+    IMAPQuery()
+    .raw(
+        *_any_of(
+            "subject",
+            (
+                "security alert",
+                "new sign-in",
+                "new login",
+                "password",
+                "verification code",
+                "one-time",
+                "2fa",
+            ),
+        )
+    )
+    .build()
+)
+_ATTACHMENT_HINT = (
+    IMAPQuery()
+    .or_(
+        IMAPQuery().header("Content-Disposition", "attachment"),
+        IMAPQuery().header("Content-Type", "name="),
+        IMAPQuery().header("Content-Type", "filename="),
+    )
+    .build()
+)
+
+
 class EmailQuery:
     """
     Builder that composes filters and only hits IMAP when you call .search() or .fetch().
@@ -68,49 +123,27 @@ class EmailQuery:
         self._q.since(iso_days_ago(days))
         return self
 
+    def _add_any(self, method: str, values: Iterable[str]) -> EmailQuery:
+        vals = tuple(v for v in values if v)
+        if vals:
+            self._q.parts += _any_of(method, vals)
+        return self
+
     def from_any(self, *senders: str) -> EmailQuery:
         """
-        FROM any of the senders (nested OR). Equivalent to:
-            OR FROM a OR FROM b FROM c ...
+        FROM any of the senders (balanced OR, full addresses first). E.g.:
+            OR (OR (FROM a) (FROM b)) (FROM c)
         """
-        qs = [IMAPQuery().from_(s) for s in senders if s]
-        if len(qs) == 0:
-            return self
-        if len(qs) == 1:
-            self._q.parts += qs[0].parts
-            return self
-        self._q.or_(*qs)
-        return self
+        return self._add_any("from_", senders)
 
     def to_any(self, *recipients: str) -> EmailQuery:
-        qs = [IMAPQuery().to(s) for s in recipients if s]
-        if len(qs) == 0:
-            return self
-        if len(qs) == 1:
-            self._q.parts += qs[0].parts
-            return self
-        self._q.or_(*qs)
-        return self
+        return self._add_any("to", recipients)
 
     def subject_any(self, *needles: str) -> EmailQuery:
-        qs = [IMAPQuery().subject(s) for s in needles if s]
-        if len(qs) == 0:
-            return self
-        if len(qs) == 1:
-            self._q.parts += qs[0].parts
-            return self
-        self._q.or_(*qs)
-        return self
+        return self._add_any("subject", needles)
 
     def text_any(self, *needles: str) -> EmailQuery:
-        qs = [IMAPQuery().text(s) for s in needles if s]
-        if len(qs) == 0:
-            return self
-        if len(qs) == 1:
-            self._q.parts += qs[0].parts
-            return self
-        self._q.or_(*qs)
-        return self
+        return self._add_any("text", needles)
 
     def recent_unread(self, days: int = 7) -> EmailQuery:
         """UNSEEN AND SINCE (days ago)."""
@@ -125,13 +158,9 @@ class EmailQuery:
         - recent window
         - and either unseen OR flagged
         """
-        triage_or = IMAPQuery().or_(
-            IMAPQuery().unseen(),
-            IMAPQuery().flagged(),
-        )
         self._q.undeleted().undraft()
         self.last_days(days)
-        self._q.raw(triage_or.build())
+        self._q.raw(_TRIAGE_OR)
         return self
 
     def header_contains(self, name: str, needle: str) -> EmailQuery:
@@ -182,7 +211,7 @@ class EmailQuery:
         Common newsletter identification:
         - has List-Unsubscribe header
         """
-        self._q.header("List-Unsubscribe", "")
+        self._q.raw(_NEWSLETTER)
         return self
 
     def from_domain(self, domain: str) -> EmailQuery:
@@ -198,31 +227,19 @@ class EmailQuery:
 
     def invoices_or_receipts(self) -> EmailQuery:
         """Common finance mailbox query."""
-        return self.subject_any("invoice", "receipt", "payment", "order confirmation")
+        self._q.raw(_INVOICES)
+        return self
 
     def security_alerts(self) -> EmailQuery:
         """Common security / auth notifications."""
-        return self.subject_any(
-            "security alert",
-            "new sign-in",
-            "new login",
-            "password",
-            "verification code",
-            "one-time",
-            "2fa",
-        )
+        self._q.raw(_SECURITY_ALERTS)
+        return self
 
     def with_attachments_hint(self) -> EmailQuery:
         """
         IMAP SEARCH cannot reliably filter 'has attachment' across servers.
         """
-        hint = IMAPQuery().or_(
-            IMAPQuery().header("Content-Disposition", "attachment"),
-            IMAPQuery().header("Content-Type", "name="),
-            IMAPQuery().header("Content-Type", "filename="),
-        )
-
-        self._q.raw(hint.build())
+        self._q.raw(_ATTACHMENT_HINT)
         return self
 
     def raw(self, *tokens: str) -> EmailQuery:
@@ -245,6 +262,19 @@ class EmailQuery:
             refresh=refresh,
         )
 
+    def search_many(
+        self, others: Sequence[EmailQuery], *, refresh: bool = False
+    ) -> List[PagedSearchResult]:
+        """
+        First page of this query and each of others (typically other
+        mailboxes), searched concurrently. Results are in the order
+        [self, *others].
+        """
+        queries = [self, *others]
+        return self._m.imap.search_pages_cached(
+            [(q._mailbox, q._q, q._limit) for q in queries], refresh=refresh
+        )
+
     def fetch(
         self,
         *,
@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import imaplib
-from email.parser import BytesParser
-from email.policy import default as default_policy
-from typing import Optional
+from email.parser import BytesHeaderParser
+from email.policy import compat32
+from typing import Dict, Sequence
 
 from openmail.errors import IMAPError
+from openmail.imap.fetch_response import iter_fetch_pieces, scan_section
 from openmail.imap.parser import decode_transfer
 
+# Only MIME headers are ever parsed here, and only for their raw values.
+_HDR_PARSER = BytesHeaderParser(policy=compat32)
+
 
 def fetch_part_bytes(
     conn: imaplib.IMAP4,
@@ -24,32 +28,54 @@ def fetch_part_bytes(
       - downloading attachments
       - fetching inline CID images for HTML rewriting
     """
-    typ, mime_data = conn.uid("FETCH", str(uid), f"(UID BODY.PEEK[{part}.MIME])")
-    if typ != "OK" or not mime_data:
-        raise IMAPError(f"FETCH attachment MIME failed uid={uid} part={part}: {mime_data}")
-
-    mime_bytes: Optional[bytes] = None
-    for item in mime_data:
-        if isinstance(item, tuple) and len(item) > 1 and isinstance(item[1], (bytes, bytearray)):
-            mime_bytes = bytes(item[1])
-            break
-
-    cte = None
-    if mime_bytes:
-        msg = BytesParser(policy=default_policy).parsebytes(mime_bytes)
-        cte = msg.get("Content-Transfer-Encoding")
-
-    typ, body_data = conn.uid("FETCH", str(uid), f"(UID BODY.PEEK[{part}])")
-    if typ != "OK" or not body_data:
-        raise IMAPError(f"FETCH attachment failed uid={uid} part={part}: {body_data}")
-
-    payload: Optional[bytes] = None
-    for item in body_data:
-        if isinstance(item, tuple) and len(item) > 1 and isinstance(item[1], (bytes, bytearray)):
-            payload = bytes(item[1])
-            break
-
+    # One FETCH for both the MIME headers and the payload; see fetch_parts_bytes.
+    payload = fetch_parts_bytes(conn, uid=uid, parts=[part]).get(part)
     if payload is None:
         raise IMAPError(f"Attachment payload not found uid={uid} part={part}")
+    return payload
+
+
+def fetch_parts_bytes(
+    conn: imaplib.IMAP4,
+    *,
+    uid: int,
+    parts: Sequence[str],
+) -> Dict[str, bytes]:
+    """
+    Fetch several BODY parts of one message in a single round trip and decode
+    each according to its MIME headers' Content-Transfer-Encoding.
+
+    Returns part -> decoded bytes; parts the server did not return are absent.
+    """
+    parts = list(dict.fromkeys(parts))
+    if not parts:
+        return {}
+
+    want = " ".join(f"BODY.PEEK[{p}.MIME] BODY.PEEK[{p}]" for p in parts)
+    typ, data = conn.uid("FETCH", str(uid), f"(UID {want})")
+    if typ != "OK" or not data:
+        raise IMAPError(f"FETCH parts failed uid={uid} parts={parts}: {data}")
+
+    mimes: Dict[str, bytes] = {}
+    bodies: Dict[str, bytes] = {}
+    for piece in iter_fetch_pieces(data):
+        if piece.payload is None:
+            continue
+        sec, is_mime = scan_section(piece.meta)
+        if sec is None:
+            continue
+        if is_mime:
+            mimes[sec] = piece.payload
+        else:
+            bodies[sec] = piece.payload
 
-    return decode_transfer(payload, cte)
+    out: Dict[str, bytes] = {}
+    for part, payload in bodies.items():
+        mime_bytes = mimes.get(part)
+        cte = (
+            str(_HDR_PARSER.parsebytes(mime_bytes).get("Content-Transfer-Encoding") or "")
+            if mime_bytes
+            else None
+        )
+        out[part] = decode_transfer(payload, cte)
+    return out
@@ -5,18 +5,21 @@ import imaplib
 import re
 import threading
 import time
+import weakref
 from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from email.message import EmailMessage as PyEmailMessage
-from email.parser import BytesParser
-from email.policy import default as default_policy
-from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+from functools import lru_cache, partial
+from typing import AbstractSet, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from openmail import IMAPConfig
 from openmail.auth import AuthContext
 from openmail.errors import ConfigError, IMAPError
-from openmail.imap.attachment_parts import fetch_part_bytes
+from openmail.imap.attachment_parts import fetch_part_bytes, fetch_parts_bytes
 from openmail.imap.bodystructure import (
+    TextPartRef,
     extract_bodystructure_from_fetch_meta,
     extract_text_and_attachments,
     parse_bodystructure,
@@ -25,40 +28,116 @@ from openmail.imap.bodystructure import (
 from openmail.imap.fetch_response import (
     has_header_peek,
     iter_fetch_pieces,
-    match_section_body,
-    match_section_mime,
-    parse_flags,
-    parse_internaldate,
-    parse_uid,
+    parse_flag_list,
+    parse_literal_size,
+    scan_meta,
+    scan_section,
 )
 from openmail.imap.inline_cid import inline_cids_as_data_uris
 from openmail.imap.pagination import PagedSearchResult
 from openmail.imap.parser import (
-    decode_body_chunk,
+    decode_section,
     parse_headers_and_bodies,
     parse_overview,
+    parse_overview_batch,
+    parse_rfc822,
 )
 from openmail.imap.query import IMAPQuery
-from openmail.models import AttachmentMeta, EmailMessage, EmailOverview
+from openmail.imap.transport import TunedIMAP4, TunedIMAP4_SSL
+from openmail.logger import get_logger
+from openmail.models import AttachmentMeta, EmailMessage, EmailOverview, EmailOverviewBatch
 from openmail.types import EmailRef
 from openmail.utils import parse_list_mailbox_name
 
+logger = get_logger()
+
+
+@lru_cache(maxsize=64)
+def _frozen_flag_list(flags: FrozenSet[str]) -> str:
+    return "(" + " ".join(sorted(flags)) + ")"
+
+
+def _flag_list(flags: AbstractSet[str]) -> str:
+    """Parenthesised flag list for STORE/APPEND; memoised for frozensets."""
+    if isinstance(flags, frozenset):
+        return _frozen_flag_list(flags)
+    return "(" + " ".join(sorted(flags)) + ")"
+
+
+def _uid_ranges(uids: Sequence[int]) -> List[str]:
+    """Ascending UIDs collapsed into IMAP set items: [1, 2, 3, 7] -> ["1:3", "7"]."""
+    out: List[str] = []
+    if not uids:
+        return out
+    start = prev = uids[0]
+    for uid in uids[1:]:
+        if uid != prev + 1:
+            out.append(f"{start}:{prev}" if prev != start else str(start))
+            start = uid
+        prev = uid
+    out.append(f"{start}:{prev}" if prev != start else str(start))
+    return out
+
+
+def _uid_set(refs: Sequence[EmailRef]) -> str:
+    """
+    UID set for UID FETCH/STORE/COPY/MOVE, with runs of consecutive UIDs
+    collapsed into ranges so large selections stay a short command line.
+    """
+    return ",".join(_uid_ranges(sorted({r.uid for r in refs})))
+
+
+# Headers fetched for overviews; List-Unsubscribe lets newsletter/unsubscribe
+# scans work from overviews instead of full messages.
+_OVERVIEW_FIELDS = (
+    "From To Subject Date Message-ID Content-Type Content-Transfer-Encoding List-Unsubscribe"
+)
+
+
+def _parse_rfc822_job(
+    job: Tuple[EmailRef, bytes, Optional[str]], *, include_attachments: bool
+) -> EmailMessage:
+    """parse_rfc822 for one (ref, raw, internaldate); module-level so it pickles."""
+    ref, raw, internaldate_raw = job
+    return parse_rfc822(
+        ref, raw, include_attachments=include_attachments, internaldate_raw=internaldate_raw
+    )
+
 
 @dataclass
 class IMAPClient:
     config: IMAPConfig
-    _conn: imaplib.IMAP4 | None = field(default=None, init=False, repr=False)
+    # Each calling thread gets its own connection and selected-mailbox state
+    # (see _state()); _lock only guards the registry and shared caches.
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _conns: weakref.WeakSet = field(default_factory=weakref.WeakSet, init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+    _capabilities: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False)
     _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
-    _selected_mailbox: str | None = field(default=None, init=False, repr=False)
-    _selected_readonly: bool | None = field(default=None, init=False, repr=False)
 
-    # cache key: (mailbox, criteria_str) -> ascending UID list
-    _search_cache: Dict[tuple[str, str], List[int]] = field(
-        default_factory=dict, init=False, repr=False
+    # cache key: (mailbox, criteria_str) -> (monotonic time stored, ascending UID list);
+    # least recently used first.
+    _search_cache: OrderedDict[tuple[str, str], Tuple[float, List[int]]] = field(
+        default_factory=OrderedDict, init=False, repr=False
     )
 
+    # Worker threads (each with its own connection) for fetch_many(),
+    # fetch_overview_parallel() and search_pages_cached(); created lazily.
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    # Worker processes for fetch_rfc822() parsing; created lazily.
+    _parse_pool: Optional[ProcessPoolExecutor] = field(default=None, init=False, repr=False)
+
     max_retries: int = 1
     backoff_seconds: float = 0.0
+    max_parallel_mailboxes: int = 4
+    # fetch() issues one UID FETCH per this many refs, bounding response size
+    fetch_batch_size: int = 100
+    # >0: fetch_rfc822() parses messages in this many worker processes
+    parse_processes: int = 0
+    # Cached SEARCH results: at most search_cache_size queries, each reused for
+    # search_cache_ttl seconds (None: until invalidated or refreshed).
+    search_cache_size: int = 512
+    search_cache_ttl: Optional[float] = None
 
     @classmethod
     def from_config(cls, config: IMAPConfig) -> IMAPClient:
@@ -76,9 +155,9 @@ class IMAPClient:
         cfg = self.config
         try:
             conn = (
-                imaplib.IMAP4_SSL(cfg.host, cfg.port, timeout=cfg.timeout)
+                TunedIMAP4_SSL(cfg.host, cfg.port, timeout=cfg.timeout)
                 if cfg.use_ssl
-                else imaplib.IMAP4(cfg.host, cfg.port, timeout=cfg.timeout)
+                else TunedIMAP4(cfg.host, cfg.port, timeout=cfg.timeout)
             )
 
             if cfg.auth is None:
@@ -92,43 +171,80 @@ class IMAPClient:
         except OSError as e:
             raise IMAPError(f"IMAP network error: {e}") from e
 
+    def _state(self) -> threading.local:
+        """
+        Per-thread connection state: conn, selected_mailbox, selected_readonly
+        and the client generation the connection was opened under.
+        """
+        st = self._local
+        if getattr(st, "generation", None) != self._generation:
+            st.conn = None
+            st.selected_mailbox = None
+            st.selected_readonly = None
+            st.generation = self._generation
+        return st
+
     def _get_conn(self) -> imaplib.IMAP4:
-        # Must be called with self._lock held
-        if self._conn is not None:
-            return self._conn
-        self._conn = self._open_new_connection()
-        self._selected_mailbox = None
-        self._selected_readonly = None
-        return self._conn
+        st = self._state()
+        if st.conn is not None:
+            return st.conn
+        conn = self._open_new_connection()
+        with self._lock:
+            self._conns.add(conn)
+        if self._capabilities is None:
+            self._capabilities = self._load_capabilities(conn)
+        st.conn = conn
+        st.selected_mailbox = None
+        st.selected_readonly = None
+        return conn
+
+    def _load_capabilities(self, conn: imaplib.IMAP4) -> FrozenSet[str]:
+        """
+        Post-authentication CAPABILITY list (servers often advertise more after
+        login than in the greeting imaplib records).
+        """
+        caps: Sequence[str] = getattr(conn, "capabilities", ()) or ()
+        try:
+            typ, data = conn.capability()
+            if typ == "OK" and data and isinstance(data[-1], (bytes, bytearray)):
+                caps = data[-1].decode(errors="ignore").split()
+        except imaplib.IMAP4.error:
+            pass
+        return frozenset(c.upper() for c in caps)
+
+    def _has_capability(self, name: str) -> bool:
+        return name in (self._capabilities or ())
 
     def _reset_conn(self) -> None:
-        # Must be called with self._lock held
-        if self._conn is not None:
+        st = self._state()
+        conn = st.conn
+        if conn is not None:
+            with self._lock:
+                self._conns.discard(conn)
             try:
-                self._conn.logout()
+                conn.logout()
             except Exception:
                 pass
-        self._conn = None
-        self._selected_mailbox = None
-        self._selected_readonly = None
+        st.conn = None
+        st.selected_mailbox = None
+        st.selected_readonly = None
 
     def _run_with_conn(self, op: Callable[[imaplib.IMAP4], object]):
         """
-        Run an operation with thread-safety and reconnect-on-abort retry.
+        Run an operation on this thread's connection with reconnect-on-abort retry.
         """
         last_exc: Optional[BaseException] = None
         attempts = self.max_retries + 1
 
         for attempt in range(attempts):
-            with self._lock:
-                conn = self._get_conn()
-                try:
-                    return op(conn)
-                except imaplib.IMAP4.abort as e:
-                    last_exc = e
-                    self._reset_conn()
-                except imaplib.IMAP4.error as e:
-                    raise IMAPError(f"IMAP operation failed: {e}") from e
+            conn = self._get_conn()
+            try:
+                return op(conn)
+            except imaplib.IMAP4.abort as e:
+                last_exc = e
+                self._reset_conn()
+            except imaplib.IMAP4.error as e:
+                raise IMAPError(f"IMAP operation failed: {e}") from e
 
             if attempt < attempts - 1 and self.backoff_seconds > 0:
                 time.sleep(self.backoff_seconds)
@@ -152,11 +268,11 @@ class IMAPClient:
         RW selection satisfies both RW and RO operations.
         RO selection satisfies only RO operations.
         """
-        # Must be called with self._lock held.
-        if self._selected_mailbox == mailbox:
-            if self._selected_readonly is False:
+        st = self._state()
+        if st.selected_mailbox == mailbox:
+            if st.selected_readonly is False:
                 return  # already RW
-            if readonly and self._selected_readonly is True:
+            if readonly and st.selected_readonly is True:
                 return  # already RO and RO requested
 
         imap_mailbox = self._format_mailbox_arg(mailbox)
@@ -164,8 +280,8 @@ class IMAPClient:
         if typ != "OK":
             raise IMAPError(f"select({mailbox!r}, readonly={readonly}) failed")
 
-        self._selected_mailbox = mailbox
-        self._selected_readonly = readonly
+        st.selected_mailbox = mailbox
+        st.selected_readonly = readonly
 
     def _assert_same_mailbox(self, refs: Sequence[EmailRef], op_name: str) -> str:
         if not refs:
@@ -200,27 +316,36 @@ class IMAPClient:
     # LIST parsing
     # -----------------------
 
-    def _parse_list_flags(self, raw: bytes) -> Set[str]:
+    def _parse_list_flags(self, raw: bytes) -> FrozenSet[str]:
         try:
             s = raw.decode(errors="ignore")
         except Exception:
-            return set()
+            return frozenset()
 
         start = s.find("(")
         end = s.find(")", start + 1)
         if start == -1 or end == -1 or end <= start + 1:
-            return set()
+            return frozenset()
 
-        flags_str = s[start + 1 : end].strip()
-        if not flags_str:
-            return set()
-
-        return {f.upper() for f in flags_str.split() if f.strip()}
+        return parse_flag_list(s[start + 1 : end].upper())
 
     # -----------------------
     # SEARCH + pagination
     # -----------------------
 
+    def _cached_uids(self, cache_key: tuple[str, str]) -> Optional[List[int]]:
+        with self._lock:
+            hit = self._search_cache.get(cache_key)
+            if hit is None:
+                return None
+            stored_at, uids = hit
+            ttl = self.search_cache_ttl
+            if ttl is not None and time.monotonic() - stored_at >= ttl:
+                del self._search_cache[cache_key]
+                return None
+            self._search_cache.move_to_end(cache_key)
+            return uids
+
     def refresh_search_cache(self, *, mailbox: str, query: IMAPQuery) -> List[int]:
         criteria = query.build() or "ALL"
         cache_key = (mailbox, criteria)
@@ -232,9 +357,13 @@ class IMAPClient:
                 raise IMAPError(f"SEARCH failed: {data}")
 
             raw = data[0] or b""
-            uids = [int(x) for x in raw.split()]
+            uids = list(map(int, raw.split()))
 
-            self._search_cache[cache_key] = uids
+            with self._lock:
+                self._search_cache[cache_key] = (time.monotonic(), uids)
+                self._search_cache.move_to_end(cache_key)
+                while len(self._search_cache) > self.search_cache_size:
+                    self._search_cache.popitem(last=False)
             return uids
 
         return self._run_with_conn(_impl)
@@ -255,8 +384,7 @@ class IMAPClient:
         criteria = query.build() or "ALL"
         cache_key = (mailbox, criteria)
 
-        with self._lock:
-            uids = None if refresh else self._search_cache.get(cache_key)
+        uids = None if refresh else self._cached_uids(cache_key)
 
         if uids is None:
             uids = self.refresh_search_cache(mailbox=mailbox, query=query)
@@ -304,6 +432,39 @@ class IMAPClient:
             has_prev=has_newer,
         )
 
+    def search_pages_cached(
+        self,
+        searches: Sequence[Tuple[str, IMAPQuery, int]],
+        *,
+        refresh: bool = False,
+    ) -> List[PagedSearchResult]:
+        """
+        search_page_cached() for several (mailbox, query, page_size) searches,
+        run concurrently on separate connections (up to
+        max_parallel_mailboxes), so the wait is the slowest search rather than
+        the sum. Results follow the order of searches.
+        """
+        if len(searches) <= 1:
+            return [
+                self.search_page_cached(
+                    mailbox=mailbox, query=query, page_size=page_size, refresh=refresh
+                )
+                for mailbox, query, page_size in searches
+            ]
+
+        pool = self._get_executor()
+        futures = [
+            pool.submit(
+                self.search_page_cached,
+                mailbox=mailbox,
+                query=query,
+                page_size=page_size,
+                refresh=refresh,
+            )
+            for mailbox, query, page_size in searches
+        ]
+        return [fut.result() for fut in futures]
+
     def search(self, *, mailbox: str, query: IMAPQuery, limit: int = 50) -> List[EmailRef]:
         page = self.search_page_cached(
             mailbox=mailbox,
@@ -317,42 +478,86 @@ class IMAPClient:
     # FETCH helpers
     # -----------------------
 
-    def _fetch_section_mime_and_body(
-        self, conn: imaplib.IMAP4, *, uid: int, section: str
-    ) -> Tuple[Optional[bytes], Optional[bytes]]:
-        want = f"(UID BODY.PEEK[{section}.MIME] BODY.PEEK[{section}])"
-        typ, data = conn.uid("FETCH", str(uid), want)
-        if typ != "OK":
-            raise IMAPError(f"FETCH body section failed uid={uid}: {data}")
-
-        mime_bytes: Optional[bytes] = None
-        body_bytes: Optional[bytes] = None
-
-        for piece in iter_fetch_pieces(data or []):
-            sec_mime = match_section_mime(piece.meta)
-            sec_body = match_section_body(piece.meta)
-
-            if piece.payload is None:
+    def _uid_fetch_pipelined(
+        self, conn: imaplib.IMAP4, commands: Sequence[Tuple[str, str]]
+    ) -> Tuple[List[object], List[str]]:
+        """
+        Send UID FETCH <uid set> <attrs> for every command before reading any
+        reply, so n commands cost one round trip instead of n. Returns the
+        FETCH response data and the uid sets of the commands the server
+        answered BAD; responses carry their UID, so callers demultiplex them
+        as for a single FETCH and skip the failed ones.
+        """
+        failed: List[str] = []
+        if len(commands) == 1 or not hasattr(conn, "_command"):
+            data: List[object] = []
+            for uid_set, attrs in commands:
+                try:
+                    typ, part = conn.uid("FETCH", uid_set, attrs)
+                except imaplib.IMAP4.abort:
+                    raise
+                except imaplib.IMAP4.error as e:
+                    logger.warning("UID FETCH %s failed: %s", uid_set, e)
+                    failed.append(uid_set)
+                    continue
+                if typ == "OK":
+                    data.extend(part or [])
+            return data, failed
+
+        # imaplib has no public pipelining API; these are the steps uid()
+        # takes, split so all commands are written first. Every tag is
+        # completed before returning so none is left pending on the connection.
+        tags = [conn._command("UID", "FETCH", uid_set, attrs) for uid_set, attrs in commands]
+        for tag, (uid_set, _) in zip(tags, commands):
+            try:
+                conn._command_complete("UID", tag)
+            except imaplib.IMAP4.abort:
+                raise
+            except imaplib.IMAP4.error as e:  # BAD; NO just yields no data
+                logger.warning("UID FETCH %s failed: %s", uid_set, e)
+                failed.append(uid_set)
+        _, data = conn._untagged_response("OK", [None], "FETCH")
+        return [d for d in data if d is not None], failed
+
+    def _fetch_sections_many(
+        self, conn: imaplib.IMAP4, wanted: Dict[int, Sequence[str]]
+    ) -> Dict[int, Dict[str, Tuple[Optional[bytes], Optional[bytes]]]]:
+        """
+        uid -> section -> (MIME header bytes, body bytes) for the requested
+        sections of every uid, with one pipelined UID FETCH per message; a
+        section the server did not return maps to (None, None).
+        """
+        commands = [
+            (
+                str(uid),
+                "(UID " + " ".join(f"BODY.PEEK[{s}.MIME] BODY.PEEK[{s}]" for s in secs) + ")",
+            )
+            for uid, secs in wanted.items()
+        ]
+        mimes: Dict[Tuple[int, str], bytes] = {}
+        bodies: Dict[Tuple[int, str], bytes] = {}
+        data, failed = self._uid_fetch_pipelined(conn, commands)
+        skip = {int(uid_set) for uid_set in failed}
+        current_uid: Optional[int] = None
+        for piece in iter_fetch_pieces(data):
+            uid, _, _ = scan_meta(piece.meta)
+            if uid is not None:
+                current_uid = None if uid in skip else uid
+            if piece.payload is None or current_uid is None:
                 continue
 
-            if sec_mime:
-                mime_bytes = piece.payload
-            elif sec_body:
-                body_bytes = piece.payload
-
-        return mime_bytes, body_bytes
-
-    def _decode_section(self, *, mime_bytes: Optional[bytes], body_bytes: Optional[bytes]) -> str:
-        if not body_bytes:
-            return ""
-        if not mime_bytes:
-            try:
-                return body_bytes.decode("utf-8", errors="replace")
-            except Exception:
-                return body_bytes.decode("latin-1", errors="replace")
+            sec, is_mime = scan_section(piece.meta)
+            if sec is None:
+                continue
+            if is_mime:
+                mimes[(current_uid, sec)] = piece.payload
+            else:
+                bodies[(current_uid, sec)] = piece.payload
 
-        msg = BytesParser(policy=default_policy).parsebytes(mime_bytes)
-        return decode_body_chunk(body_bytes, msg)
+        return {
+            uid: {s: (mimes.get((uid, s)), bodies.get((uid, s))) for s in secs}
+            for uid, secs in wanted.items()
+        }
 
     # -----------------------
     # FETCH full message (headers + best text/html via BODYSTRUCTURE)
@@ -365,12 +570,21 @@ class IMAPClient:
             return []
 
         mailbox = self._assert_same_mailbox(refs, "fetch")
+        bs = self.fetch_batch_size
+        if 0 < bs < len(refs):
+            return [
+                m
+                for i in range(0, len(refs), bs)
+                for m in self.fetch(
+                    refs[i : i + bs], include_attachment_meta=include_attachment_meta
+                )
+            ]
+
         required_uids = {r.uid for r in refs}
+        uid_str = _uid_set(refs)
 
         def _impl(conn: imaplib.IMAP4) -> List[EmailMessage]:
             self._ensure_selected(conn, mailbox, readonly=True)
-
-            uid_str = ",".join(str(r.uid) for r in refs)
             attrs = "(UID INTERNALDATE BODYSTRUCTURE BODY.PEEK[HEADER])"
             typ, data = conn.uid("FETCH", uid_str, attrs)
             if typ != "OK":
@@ -383,7 +597,7 @@ class IMAPClient:
             current_uid: Optional[int] = None
 
             for piece in iter_fetch_pieces(data):
-                uid = parse_uid(piece.meta)
+                uid, internal, _ = scan_meta(piece.meta)
                 if uid is not None:
                     current_uid = uid if uid in required_uids else None
 
@@ -395,7 +609,6 @@ class IMAPClient:
                     {"headers": None, "internaldate": None, "bodystructure": None},
                 )
 
-                internal = parse_internaldate(piece.meta)
                 if internal:
                     bucket["internaldate"] = internal
 
@@ -406,6 +619,34 @@ class IMAPClient:
                 if bs:
                     bucket["bodystructure"] = bs
 
+            # Work out every message's text parts first, so their bodies can
+            # be fetched with pipelined commands rather than one round trip each.
+            plans: Dict[
+                int, Tuple[Optional[TextPartRef], Optional[TextPartRef], List[AttachmentMeta]]
+            ] = {}
+            for r in refs:
+                info = partial.get(r.uid)
+                bs_raw = info.get("bodystructure") if info else None
+                if isinstance(bs_raw, str) and bs_raw:
+                    try:
+                        tree = parse_bodystructure(bs_raw)
+                        text_parts, atts = extract_text_and_attachments(tree)
+                        plans[r.uid] = (*pick_best_text_parts(text_parts), atts)
+                    except Exception:
+                        pass  # best-effort: headers still returned; bodies left empty
+
+            wanted = {
+                uid: [p.part for p in (plain_ref, html_ref) if p is not None]
+                for uid, (plain_ref, html_ref, _) in plans.items()
+            }
+            wanted = {uid: secs for uid, secs in wanted.items() if secs}
+            try:
+                sections = self._fetch_sections_many(conn, wanted) if wanted else {}
+            except imaplib.IMAP4.abort:
+                raise
+            except Exception:
+                sections = {}  # best-effort, as above
+
             out: List[EmailMessage] = []
             for r in refs:
                 info = partial.get(r.uid)
@@ -414,35 +655,27 @@ class IMAPClient:
 
                 header_bytes = info.get("headers") or b""
                 internaldate_raw = info.get("internaldate")
-                bs_raw = info.get("bodystructure")
 
                 text = ""
                 html = ""
                 attachment_metas: List[AttachmentMeta] = []
 
-                if isinstance(bs_raw, str) and bs_raw:
+                plan = plans.get(r.uid)
+                if plan is not None:
+                    plain_ref, html_ref, atts = plan
                     try:
-                        tree = parse_bodystructure(bs_raw)
-                        text_parts, atts = extract_text_and_attachments(tree)
-                        plain_ref, html_ref = pick_best_text_parts(text_parts)
-
                         if include_attachment_meta:
                             attachment_metas = atts
 
-                        if plain_ref is not None:
-                            mime_b, body_b = self._fetch_section_mime_and_body(
-                                conn, uid=r.uid, section=plain_ref.part
-                            )
-                            text = self._decode_section(mime_bytes=mime_b, body_bytes=body_b)
-
-                        if html_ref is not None:
-                            mime_b, body_b = self._fetch_section_mime_and_body(
-                                conn, uid=r.uid, section=html_ref.part
-                            )
-                            html = self._decode_section(mime_bytes=mime_b, body_bytes=body_b)
+                        got = sections.get(r.uid)
+                        if got:
+                            if plain_ref is not None:
+                                text = decode_section(*got[plain_ref.part])
+                            if html_ref is not None:
+                                html = decode_section(*got[html_ref.part])
 
                         if html and attachment_metas:
-
+                            # One batched FETCH for every referenced CID part.
                             html = inline_cids_as_data_uris(
                                 conn=conn,
                                 uid=r.uid,
@@ -470,23 +703,65 @@ class IMAPClient:
 
         return self._run_with_conn(_impl)
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_parallel_mailboxes,
+                    thread_name_prefix="openmail-imap",
+                )
+            return self._executor
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes)
+            return self._parse_pool
+
+    def fetch_many(
+        self, refs: Sequence[EmailRef], *, include_attachment_meta: bool = False
+    ) -> List[EmailMessage]:
+        """
+        fetch() for refs that may span mailboxes: one UID FETCH per mailbox,
+        with different mailboxes fetched concurrently on separate connections
+        (up to max_parallel_mailboxes). Results follow the order of refs;
+        refs not found are skipped.
+        """
+        groups: Dict[str, List[EmailRef]] = {}
+        for r in refs:
+            groups.setdefault(r.mailbox, []).append(r)
+        if len(groups) <= 1:
+            return self.fetch(refs, include_attachment_meta=include_attachment_meta)
+
+        pool = self._get_executor()
+        futures = [
+            pool.submit(self.fetch, group, include_attachment_meta=include_attachment_meta)
+            for group in groups.values()
+        ]
+        by_ref: Dict[Tuple[str, int], EmailMessage] = {}
+        for fut in futures:
+            for m in fut.result():
+                by_ref[(m.ref.mailbox, m.ref.uid)] = m
+        return [by_ref[k] for k in ((r.mailbox, r.uid) for r in refs) if k in by_ref]
+
     # -----------------------
     # FETCH overview
     # -----------------------
 
-    def fetch_overview(self, refs: Sequence[EmailRef]) -> List[EmailOverview]:
-        if not refs:
-            return []
+    def _fetch_overview_items(
+        self, refs: Sequence[EmailRef]
+    ) -> List[Tuple[EmailRef, FrozenSet[str], bytes, Optional[str]]]:
+        """
+        (ref, flags, header_bytes, internaldate_raw) per ref found, in ref order.
+        """
         mailbox = self._assert_same_mailbox(refs, "fetch_overview")
+        uid_str = _uid_set(refs)
 
-        def _impl(conn: imaplib.IMAP4) -> List[EmailOverview]:
+        def _impl(
+            conn: imaplib.IMAP4,
+        ) -> List[Tuple[EmailRef, FrozenSet[str], bytes, Optional[str]]]:
             self._ensure_selected(conn, mailbox, readonly=True)
-
-            uid_str = ",".join(str(r.uid) for r in refs)
-            attrs = (
-                "(UID FLAGS INTERNALDATE "
-                "BODY.PEEK[HEADER.FIELDS (From To Subject Date Message-ID Content-Type Content-Transfer-Encoding)])"
-            )
+            attrs = f"(UID FLAGS INTERNALDATE BODY.PEEK[HEADER.FIELDS ({_OVERVIEW_FIELDS})])"
             typ, data = conn.uid("FETCH", uid_str, attrs)
             if typ != "OK":
                 raise IMAPError(f"FETCH overview failed: {data}")
@@ -497,7 +772,7 @@ class IMAPClient:
             current_uid: Optional[int] = None
 
             for piece in iter_fetch_pieces(data):
-                uid = parse_uid(piece.meta)
+                uid, internal, flags = scan_meta(piece.meta)
                 if uid is not None:
                     current_uid = uid
 
@@ -506,43 +781,143 @@ class IMAPClient:
 
                 bucket = partial.setdefault(
                     current_uid,
-                    {"flags": set(), "headers": None, "internaldate": None},
+                    {"flags": frozenset(), "headers": None, "internaldate": None},
                 )
 
-                bucket["flags"] = parse_flags(piece.meta) or bucket["flags"]
+                if flags:
+                    bucket["flags"] = flags
 
-                internal = parse_internaldate(piece.meta)
                 if internal:
                     bucket["internaldate"] = internal
 
                 if piece.payload is not None:
                     bucket["headers"] = piece.payload
 
-            overviews: List[EmailOverview] = []
+            items: List[Tuple[EmailRef, FrozenSet[str], bytes, Optional[str]]] = []
             for r in refs:
                 info = partial.get(r.uid)
                 if not info:
                     continue
 
-                flags = set(info["flags"]) if isinstance(info["flags"], set) else set()
+                flags = info["flags"] if isinstance(info["flags"], frozenset) else frozenset()
                 header_bytes = info.get("headers") or b""
                 internaldate_raw = info.get("internaldate")
-
-                overviews.append(
-                    parse_overview(
+                items.append(
+                    (
                         r,
                         flags,
                         header_bytes,
-                        internaldate_raw=(
-                            internaldate_raw if isinstance(internaldate_raw, str) else None
-                        ),
+                        internaldate_raw if isinstance(internaldate_raw, str) else None,
                     )
                 )
 
-            return overviews
+            return items
 
         return self._run_with_conn(_impl)
 
+    def fetch_overview(self, refs: Sequence[EmailRef]) -> List[EmailOverview]:
+        if not refs:
+            return []
+        return [
+            parse_overview(r, flags, header_bytes, internaldate_raw=internaldate_raw)
+            for r, flags, header_bytes, internaldate_raw in self._fetch_overview_items(refs)
+        ]
+
+    def fetch_overview_parallel(
+        self, refs: Sequence[EmailRef], *, parallelism: int
+    ) -> List[EmailOverview]:
+        """
+        fetch_overview() split into up to parallelism contiguous slices of refs,
+        fetched concurrently on separate connections (capped by
+        max_parallel_mailboxes). Results follow the order of refs.
+        """
+        n = min(parallelism, len(refs))
+        if n <= 1:
+            return self.fetch_overview(refs)
+
+        self._assert_same_mailbox(refs, "fetch_overview_parallel")
+        step = -(-len(refs) // n)
+        pool = self._get_executor()
+        futures = [
+            pool.submit(self.fetch_overview, refs[i : i + step]) for i in range(0, len(refs), step)
+        ]
+        return [ov for fut in futures for ov in fut.result()]
+
+    def fetch_overview_batch(self, refs: Sequence[EmailRef]) -> EmailOverviewBatch:
+        """
+        Same data as fetch_overview, returned column-wise (see EmailOverviewBatch).
+        """
+        if not refs:
+            return EmailOverviewBatch()
+        return parse_overview_batch(self._fetch_overview_items(refs))
+
+    # -----------------------
+    # FETCH raw RFC822 source
+    # -----------------------
+
+    def _fetch_raw_many(self, refs: Sequence[EmailRef]) -> Dict[int, Tuple[bytes, Optional[str]]]:
+        """
+        UID -> (raw RFC822 bytes, INTERNALDATE) via BODY.PEEK[], which unlike
+        RFC822 does not set \\Seen as a side effect.
+        """
+        mailbox = self._assert_same_mailbox(refs, "fetch_raw")
+        required_uids = {r.uid for r in refs}
+        uid_str = _uid_set(refs)
+
+        def _impl(conn: imaplib.IMAP4) -> Dict[int, Tuple[bytes, Optional[str]]]:
+            self._ensure_selected(conn, mailbox, readonly=True)
+            typ, data = conn.uid("FETCH", uid_str, "(UID INTERNALDATE BODY.PEEK[])")
+            if typ != "OK":
+                raise IMAPError(f"FETCH raw failed: {data}")
+
+            out: Dict[int, Tuple[bytes, Optional[str]]] = {}
+            for piece in iter_fetch_pieces(data or []):
+                uid, internal, _ = scan_meta(piece.meta)
+                if uid is None or uid not in required_uids or piece.payload is None:
+                    continue
+
+                # imaplib reads each literal in one go; the announced size
+                # only serves to catch a truncated read.
+                size = parse_literal_size(piece.meta)
+                if size is not None and len(piece.payload) != size:
+                    raise IMAPError(
+                        f"FETCH raw for UID {uid} returned {len(piece.payload)} of {size} bytes"
+                    )
+                out[uid] = (piece.payload, internal)
+            return out
+
+        return self._run_with_conn(_impl)
+
+    def fetch_raw(self, ref: EmailRef) -> bytes:
+        """
+        Full RFC822 source of a single message, without marking it \\Seen.
+        """
+        got = self._fetch_raw_many([ref]).get(ref.uid)
+        if got is None:
+            raise IMAPError(f"FETCH raw: UID {ref.uid} not found in {ref.mailbox!r}")
+        return got[0]
+
+    def fetch_rfc822(
+        self, refs: Sequence[EmailRef], *, include_attachments: bool = False
+    ) -> List[EmailMessage]:
+        """
+        Fetch and parse full messages from their raw source (one round-trip),
+        including attachment payloads when include_attachments is True.
+        """
+        if not refs:
+            return []
+        raws = self._fetch_raw_many(refs)
+
+        jobs = [(r, *raws[r.uid]) for r in refs if r.uid in raws]
+        parse = partial(_parse_rfc822_job, include_attachments=include_attachments)
+        if self.parse_processes <= 0 or len(jobs) < 2:
+            return [parse(job) for job in jobs]
+
+        # email.parser is pure Python and holds the GIL throughout, so only
+        # separate processes parse in parallel; map() keeps the ref order.
+        chunksize = max(1, len(jobs) // (4 * self.parse_processes))
+        return list(self._get_parse_pool().map(parse, jobs, chunksize=chunksize))
+
     # -----------------------
     # Attachment fetch
     # -----------------------
@@ -558,6 +933,21 @@ class IMAPClient:
 
         return self._run_with_conn(_impl)
 
+    def fetch_attachments(self, ref: EmailRef, parts: Sequence[str]) -> Dict[str, bytes]:
+        """
+        Decoded bytes of several parts of one message from a single UID FETCH;
+        part -> bytes, parts the server did not return are absent.
+        """
+        if not parts:
+            return {}
+        mailbox = ref.mailbox
+
+        def _impl(conn: imaplib.IMAP4) -> Dict[str, bytes]:
+            self._ensure_selected(conn, mailbox, readonly=True)
+            return fetch_parts_bytes(conn, uid=ref.uid, parts=parts)
+
+        return self._run_with_conn(_impl)
+
     # -----------------------
     # Mutations
     # -----------------------
@@ -567,14 +957,30 @@ class IMAPClient:
         mailbox: str,
         msg: PyEmailMessage,
         *,
-        flags: Optional[Set[str]] = None,
+        flags: Optional[AbstractSet[str]] = None,
     ) -> EmailRef:
+        # Serialised with CRLF line endings, as the message goes on the wire.
+        raw = msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+        return self.append_raw(mailbox, raw, flags=flags)
+
+    def append_raw(
+        self,
+        mailbox: str,
+        raw: bytes,
+        *,
+        flags: Optional[AbstractSet[str]] = None,
+    ) -> EmailRef:
+        """
+        APPEND an already serialised RFC822 message (e.g. from fetch_raw),
+        without parsing it into an email.message object first.
+        """
+
         def _impl(conn: imaplib.IMAP4) -> EmailRef:
             self._ensure_selected(conn, mailbox, readonly=False)
 
-            flags_arg = "(" + " ".join(sorted(flags)) + ")" if flags else None
+            flags_arg = _flag_list(flags) if flags else None
             date_time = imaplib.Time2Internaldate(time.time())
-            raw_bytes = msg.as_bytes()
+            raw_bytes = raw
             imap_mailbox = self._format_mailbox_arg(mailbox)
 
             typ, data = conn.append(imap_mailbox, flags_arg, date_time, raw_bytes)
@@ -593,7 +999,7 @@ class IMAPClient:
             if uid is None:
                 typ_search, data_search = conn.uid("SEARCH", None, "ALL")
                 if typ_search == "OK" and data_search and data_search[0]:
-                    all_uids = [int(x) for x in data_search[0].split() if x.strip()]
+                    all_uids = list(map(int, data_search[0].split()))
                     uid = max(all_uids) if all_uids else None
 
             if uid is None:
@@ -605,21 +1011,21 @@ class IMAPClient:
         self._invalidate_search_cache(mailbox)
         return ref
 
-    def add_flags(self, refs: Sequence[EmailRef], *, flags: Set[str]) -> None:
+    def add_flags(self, refs: Sequence[EmailRef], *, flags: AbstractSet[str]) -> None:
         self._store(refs, mode="+FLAGS", flags=flags)
 
-    def remove_flags(self, refs: Sequence[EmailRef], *, flags: Set[str]) -> None:
+    def remove_flags(self, refs: Sequence[EmailRef], *, flags: AbstractSet[str]) -> None:
         self._store(refs, mode="-FLAGS", flags=flags)
 
-    def _store(self, refs: Sequence[EmailRef], *, mode: str, flags: Set[str]) -> None:
+    def _store(self, refs: Sequence[EmailRef], *, mode: str, flags: AbstractSet[str]) -> None:
         if not refs:
             return
         mailbox = self._assert_same_mailbox(refs, "_store")
+        uids = _uid_set(refs)
+        flag_list = _flag_list(flags)
 
         def _impl(conn: imaplib.IMAP4) -> None:
             self._ensure_selected(conn, mailbox, readonly=False)
-            uids = ",".join(str(r.uid) for r in refs)
-            flag_list = "(" + " ".join(sorted(flags)) + ")"
             typ, data = conn.uid("STORE", uids, mode, flag_list)
             if typ != "OK":
                 raise IMAPError(f"STORE failed: {data}")
@@ -628,6 +1034,48 @@ class IMAPClient:
         # flags can change search results depending on query criteria
         self._invalidate_search_cache(mailbox)
 
+    def add_flags_matching(
+        self,
+        *,
+        mailbox: str,
+        query: IMAPQuery,
+        flags: AbstractSet[str],
+        ranges_per_store: int = 500,
+        uids_per_store: Optional[int] = None,
+    ) -> int:
+        """
+        Add flags to every message matching query; returns how many matched.
+
+        One UID SEARCH, then UID STORE +FLAGS.SILENT over the matches as
+        compact ranges (a:b), at most ranges_per_store per command and, if
+        set, at most uids_per_store messages. .SILENT spares the server from
+        echoing an untagged FETCH per message.
+        """
+        criteria = query.build() or "ALL"
+        flag_list = _flag_list(flags)
+
+        def _impl(conn: imaplib.IMAP4) -> int:
+            self._ensure_selected(conn, mailbox, readonly=False)
+            typ, data = conn.uid("SEARCH", None, criteria)
+            if typ != "OK":
+                raise IMAPError(f"SEARCH failed: {data}")
+            uids = sorted(map(int, (data[0] or b"").split()))
+
+            step = uids_per_store or len(uids) or 1
+            for start in range(0, len(uids), step):
+                ranges = _uid_ranges(uids[start : start + step])
+                for i in range(0, len(ranges), ranges_per_store):
+                    uid_set = ",".join(ranges[i : i + ranges_per_store])
+                    typ, data = conn.uid("STORE", uid_set, "+FLAGS.SILENT", flag_list)
+                    if typ != "OK":
+                        raise IMAPError(f"STORE failed: {data}")
+            return len(uids)
+
+        try:
+            return self._run_with_conn(_impl)
+        finally:
+            self._invalidate_search_cache(mailbox)
+
     def expunge(self, mailbox: str = "INBOX") -> None:
         def _impl(conn: imaplib.IMAP4) -> None:
             self._ensure_selected(conn, mailbox, readonly=False)
@@ -721,15 +1169,16 @@ class IMAPClient:
         for r in refs:
             if r.mailbox != src_mailbox:
                 raise IMAPError("All EmailRef.mailbox must match src_mailbox for move()")
+        uids = _uid_set(refs)
+        dst_arg = self._format_mailbox_arg(dst_mailbox)
 
         def _impl(conn: imaplib.IMAP4) -> None:
             self._ensure_selected(conn, src_mailbox, readonly=False)
 
-            uids = ",".join(str(r.uid) for r in refs)
-            dst_arg = self._format_mailbox_arg(dst_mailbox)
-
-            typ, data = conn.uid("MOVE", uids, dst_arg)
-            if typ == "OK":
+            if self._has_capability("MOVE"):
+                typ, data = conn.uid("MOVE", uids, dst_arg)
+                if typ != "OK":
+                    raise IMAPError(f"MOVE failed: {data}")
                 return
 
             typ_copy, data_copy = conn.uid("COPY", uids, dst_arg)
@@ -740,7 +1189,12 @@ class IMAPClient:
             if typ_store != "OK":
                 raise IMAPError(f"STORE +FLAGS.SILENT \\Deleted failed: {data_store}")
 
-            typ_expunge, data_expunge = conn.expunge()
+            # UID EXPUNGE (UIDPLUS) only removes the messages we moved; a plain
+            # EXPUNGE would also remove anything else flagged \Deleted.
+            if self._has_capability("UIDPLUS"):
+                typ_expunge, data_expunge = conn.uid("EXPUNGE", uids)
+            else:
+                typ_expunge, data_expunge = conn.expunge()
             if typ_expunge != "OK":
                 raise IMAPError(f"EXPUNGE (after MOVE fallback) failed: {data_expunge}")
 
@@ -754,12 +1208,11 @@ class IMAPClient:
         for r in refs:
             if r.mailbox != src_mailbox:
                 raise IMAPError("All EmailRef.mailbox must match src_mailbox for copy()")
+        uids = _uid_set(refs)
+        dst_arg = self._format_mailbox_arg(dst_mailbox)
 
         def _impl(conn: imaplib.IMAP4) -> None:
             self._ensure_selected(conn, src_mailbox, readonly=False)
-
-            uids = ",".join(str(r.uid) for r in refs)
-            dst_arg = self._format_mailbox_arg(dst_mailbox)
             typ, data = conn.uid("COPY", uids, dst_arg)
             if typ != "OK":
                 raise IMAPError(f"COPY failed: {data}")
@@ -796,8 +1249,25 @@ class IMAPClient:
         self._run_with_conn(_impl)
 
     def close(self) -> None:
+        """
+        Log out every connection opened by this client, from any thread.
+        Threads still holding a connection reopen lazily on next use.
+        """
         with self._lock:
-            self._reset_conn()
+            conns = list(self._conns)
+            self._conns.clear()
+            self._generation += 1
+            executor, self._executor = self._executor, None
+            parse_pool, self._parse_pool = self._parse_pool, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=False)
+        for conn in conns:
+            try:
+                conn.logout()
+            except Exception:
+                pass
 
     def __enter__(self) -> IMAPClient:
         return self
@@ -3,19 +3,32 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Iterator, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Iterator, Optional, Sequence, Tuple
+
+from openmail.models._compat import DATACLASS_SLOTS
 
 UID_RE = re.compile(r"UID\s+(\d+)", re.IGNORECASE)
 INTERNALDATE_RE = re.compile(r'INTERNALDATE\s+"([^"]+)"', re.IGNORECASE)
 FLAGS_RE = re.compile(r"FLAGS\s*\(([^)]*)\)", re.IGNORECASE)
 
+# UID / INTERNALDATE / FLAGS in one alternation so meta is scanned once
+META_RE = re.compile(
+    r'UID\s+(?P<uid>\d+)|INTERNALDATE\s+"(?P<idate>[^"]+)"|FLAGS\s*\((?P<flags>[^)]*)\)',
+    re.IGNORECASE,
+)
+
+# Trailing "{N}" literal marker: imaplib leaves it at the end of the meta
+LITERAL_RE = re.compile(r"\{(\d+)\}\s*$")
+
 # Used for parsing FETCH section results
-MIME_TOKEN_RE = re.compile(r"BODY\[(\d+(?:\.\d+)*)\.MIME\]", re.IGNORECASE)
-BODY_TOKEN_RE = re.compile(r"BODY\[(\d+(?:\.\d+)*)\]", re.IGNORECASE)
-HEADER_PEEK_RE = re.compile(r"BODY\[HEADER\]", re.IGNORECASE)
+# BODY[n] and BODY[n.MIME] in one pattern, so a piece is scanned once
+SECTION_RE = re.compile(r"BODY\[(?P<sec>\d+(?:\.\d+)*)(?P<mime>\.MIME)?\]", re.IGNORECASE)
+# Literal token; a substring test is cheaper than a regex search here
+HEADER_PEEK_TOKEN = "BODY[HEADER]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FetchPiece:
     """
     A normalized piece of a FETCH response.
@@ -28,54 +41,36 @@ class FetchPiece:
     payload: Optional[bytes]
 
 
-def _extract_payload_from_fetch_item(
-    item: tuple, data: Sequence[object], i: int
-) -> Tuple[Optional[bytes], bool]:
-    """
-    Returns (payload_bytes, used_next_element).
-
-    imaplib can return:
-      - (meta, payload)
-      - (meta, None) then payload as next bytes item
-    """
-    raw = item[1] if len(item) > 1 and isinstance(item[1], (bytes, bytearray)) else None
-    used_next = False
-    if raw is None and i + 1 < len(data) and isinstance(data[i + 1], (bytes, bytearray)):
-        raw = data[i + 1]
-        used_next = True
-    return (bytes(raw) if isinstance(raw, (bytes, bytearray)) else None), used_next
-
-
 def iter_fetch_pieces(data: Sequence[object]) -> Iterator[FetchPiece]:
     """
     Normalize imaplib FETCH response data into (meta_str, payload_bytes?) pieces.
 
-    Skips non-tuple elements except tuple metadata; ignores the b")" terminators.
+    imaplib returns a literal as (meta ending in "{N}", payload); a payload
+    left as None is taken from the next element only when meta announced a
+    literal. Other raw bytes elements (the b")" terminators) are skipped.
     """
     i = 0
     n = len(data)
     while i < n:
         item = data[i]
-
-        # b")" terminator or other raw bytes => skip
-        if isinstance(item, (bytes, bytearray)):
-            i += 1
-            continue
-
+        i += 1
         if not isinstance(item, tuple) or not item:
-            i += 1
             continue
 
         meta_raw = item[0]
         if not isinstance(meta_raw, (bytes, bytearray)):
-            i += 1
             continue
-
         meta_str = meta_raw.decode(errors="ignore")
-        payload, used_next = _extract_payload_from_fetch_item(item, data, i)
-        yield FetchPiece(meta=meta_str, payload=payload)
 
-        i += 2 if used_next else 1
+        raw = item[1] if len(item) > 1 else None
+        if raw is None and i < n and LITERAL_RE.search(meta_str):
+            raw = data[i]
+            if isinstance(raw, (bytes, bytearray)):
+                i += 1
+            else:
+                raw = None
+        payload = bytes(raw) if isinstance(raw, (bytes, bytearray)) else None
+        yield FetchPiece(meta=meta_str, payload=payload)
 
 
 def parse_uid(meta: str) -> Optional[int]:
@@ -88,28 +83,112 @@ def parse_internaldate(meta: str) -> Optional[str]:
     return m.group(1) if m else None
 
 
-def parse_flags(meta: str) -> set[str]:
+_NO_FLAGS: FrozenSet[str] = frozenset()
+
+
+@lru_cache(maxsize=256)
+def parse_flag_list(flags_str: str) -> FrozenSet[str]:
+    """
+    Parse the inside of a flag list, e.g. '\\Seen \\Flagged'.
+
+    The set of distinct flag strings seen on a server is tiny, so results are
+    cached and shared between messages.
+    """
+    return frozenset(flags_str.split())
+
+
+# Bits for the RFC 3501 system flags, for callers filtering large pages.
+FLAG_SEEN = 1 << 0
+FLAG_ANSWERED = 1 << 1
+FLAG_FLAGGED = 1 << 2
+FLAG_DELETED = 1 << 3
+FLAG_DRAFT = 1 << 4
+FLAG_RECENT = 1 << 5
+_FLAG_BITS = {
+    "\\SEEN": FLAG_SEEN,
+    "\\ANSWERED": FLAG_ANSWERED,
+    "\\FLAGGED": FLAG_FLAGGED,
+    "\\DELETED": FLAG_DELETED,
+    "\\DRAFT": FLAG_DRAFT,
+    "\\RECENT": FLAG_RECENT,
+}
+
+
+@lru_cache(maxsize=256)
+def flag_mask(flags: FrozenSet[str]) -> int:
+    """
+    System flags of a message's flag set as FLAG_* bits; keywords are
+    ignored. Flag sets are shared between messages (see parse_flag_list),
+    so the mask is computed once per distinct set.
+    """
+    mask = 0
+    for flag in flags:
+        mask |= _FLAG_BITS.get(flag.upper(), 0)
+    return mask
+
+
+def parse_flags(meta: str) -> FrozenSet[str]:
     m = FLAGS_RE.search(meta)
     if not m:
-        return set()
-    flags_str = m.group(1).strip()
-    return {f for f in flags_str.split() if f} if flags_str else set()
+        return _NO_FLAGS
+    return parse_flag_list(m.group(1))
+
+
+def parse_literal_size(meta: str) -> Optional[int]:
+    m = LITERAL_RE.search(meta)
+    return int(m.group(1)) if m else None
+
+
+def scan_meta(meta: str) -> Tuple[Optional[int], Optional[str], Optional[FrozenSet[str]]]:
+    """
+    Single pass over a FETCH meta string.
+
+    Returns (uid, internaldate, flags); each is None when absent. When an
+    item occurs more than once, the first occurrence wins (as with the
+    individual parse_* helpers).
+    """
+    uid: Optional[int] = None
+    idate: Optional[str] = None
+    flags: Optional[FrozenSet[str]] = None
+
+    for m in META_RE.finditer(meta):
+        kind = m.lastgroup
+        if kind == "uid":
+            if uid is None:
+                uid = int(m.group("uid"))
+        elif kind == "idate":
+            if idate is None:
+                idate = m.group("idate")
+        elif kind == "flags":
+            if flags is None:
+                flags = parse_flag_list(m.group("flags"))
+
+    return uid, idate, flags
 
 
 def has_header_peek(meta: str) -> bool:
-    return bool(HEADER_PEEK_RE.search(meta))
+    return HEADER_PEEK_TOKEN in meta.upper()
+
+
+def scan_section(meta: str) -> Tuple[Optional[str], bool]:
+    """
+    (section id, is_mime) for the BODY[n] or BODY[n.MIME] item a piece
+    carries, in one regex pass; (None, False) when there is none.
+    """
+    m = SECTION_RE.search(meta)
+    if m is None:
+        return None, False
+    return m.group("sec"), m.group("mime") is not None
 
 
 def match_section_mime(meta: str) -> Optional[str]:
-    m = MIME_TOKEN_RE.search(meta)
-    return m.group(1) if m else None
+    sec, is_mime = scan_section(meta)
+    return sec if is_mime else None
 
 
 def match_section_body(meta: str) -> Optional[str]:
     """
     Returns section id for BODY[...] but NOT BODY[...MIME].
     """
-    if MIME_TOKEN_RE.search(meta):
-        return None
-    m = BODY_TOKEN_RE.search(meta)
-    return m.group(1) if m else None
+    sec, is_mime = scan_section(meta)
+    return None if is_mime else sec
@@ -3,29 +3,53 @@ from __future__ import annotations
 import base64
 import imaplib
 import re
-from typing import Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import unquote
 
+from openmail.imap.attachment_parts import fetch_parts_bytes as _fetch_parts_batched
 from openmail.models import AttachmentMeta
 
-_IMG_SRC_RE = re.compile(r'(<img\b[^>]*\bsrc=["\'])([^"\']+)(["\'])', re.IGNORECASE)
+try:  # encodes straight to str in C (pip install "openmail[speedups]")
+    from pybase64 import b64encode_as_string as _b64encode_str
+except ImportError:
 
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
 
-def _cid_variants(cid_src: str) -> list[str]:
+
+# callable(conn, *, uid, parts) -> {part: decoded bytes}
+PartsFetcher = Callable[..., Dict[str, bytes]]
+
+try:  # linear-time DFA matching for large HTML (pip install "openmail[speedups]")
+    import re2 as _img_re
+except ImportError:
+    _img_re = re
+
+# Only <img> tags whose src is a cid: reference; other images never match.
+# Case-insensitivity is inline so the pattern means the same to re and re2.
+_IMG_SRC_RE = _img_re.compile(r'(?i)<img\b[^>]*\bsrc=["\'](\s*cid:[^"\']+)["\']')
+_CID_HINT_RE = re.compile(r"cid:", re.IGNORECASE)
+
+
+def _normalize_cid(cid_src: str) -> str:
+    s = cid_src.strip()
+    if s[:4].lower() == "cid:":
+        s = s[4:].strip()
+    return unquote(s).strip().strip("<>").strip()
+
+
+@lru_cache(maxsize=128)
+def _cid_variants(cid_src: str) -> Tuple[str, ...]:
     """
     Turn 'cid:image001.png@01DC....' into candidates:
       - image001.png@01DC...
       - image001.png
     Also handles <...> and urlencoding.
     """
-    s = cid_src.strip()
-    if s.lower().startswith("cid:"):
-        s = s[4:].strip()
-
-    s = unquote(s)
-    s = s.strip().strip("<>").strip()
+    s = _normalize_cid(cid_src)
     if not s:
-        return []
+        return ()
 
     out = [s, s.lower()]
     if "@" in s:
@@ -33,13 +57,7 @@ def _cid_variants(cid_src: str) -> list[str]:
         out.extend([base, base.lower()])
 
     # de-dupe preserving order
-    seen = set()
-    uniq: list[str] = []
-    for x in out:
-        if x and x not in seen:
-            seen.add(x)
-            uniq.append(x)
-    return uniq
+    return tuple(dict.fromkeys(x for x in out if x))
 
 
 def build_inline_index(atts: Iterable[AttachmentMeta]) -> Dict[str, AttachmentMeta]:
@@ -48,7 +66,7 @@ def build_inline_index(atts: Iterable[AttachmentMeta]) -> Dict[str, AttachmentMe
     """
     idx: Dict[str, AttachmentMeta] = {}
     for a in atts:
-        if not a.content_type.lower().startswith("image/"):
+        if not a.is_image:
             continue
         # Use your is_inline signal OR content_id presence (both are useful)
         if not (a.is_inline or a.content_id):
@@ -67,40 +85,88 @@ def inline_cids_as_data_uris(
     uid: int,
     html: str,
     attachment_metas: list[AttachmentMeta],
-    fetch_part_bytes,  # callable(part: str) -> bytes
+    fetch_parts_bytes: Optional[PartsFetcher] = None,
+    fetch_part_bytes=None,  # legacy: callable(conn, *, uid, part) -> bytes
 ) -> str:
     """
     Rewrite <img src="cid:..."> to data: URIs by fetching the bytes via IMAP.
+
+    All referenced parts are fetched in one call to fetch_parts_bytes
+    (defaults to a single batched UID FETCH); a legacy per-part
+    fetch_part_bytes callable is still accepted.
     """
     if not html or not attachment_metas:
         return html
+    # Cheap metadata check before touching the (possibly large) HTML.
+    if not any(a.is_image and (a.is_inline or a.content_id) for a in attachment_metas):
+        return html
+    if not _CID_HINT_RE.search(html):
+        return html
 
     idx = build_inline_index(attachment_metas)
+    if not idx:
+        return html
 
-    def repl(m: re.Match) -> str:
-        prefix, src, suffix = m.group(1), m.group(2), m.group(3)
-        if not src.lower().startswith("cid:"):
-            return m.group(0)
-
-        hit: Optional[AttachmentMeta] = None
-        for k in _cid_variants(src):
-            hit = idx.get(k)
-            if hit:
-                break
-        if not hit:
-            return m.group(0)
+    # First pass: resolve every cid: src, so the parts can be fetched at once.
+    hits: List[Tuple[Any, AttachmentMeta]] = []
+    for m in _IMG_SRC_RE.finditer(html):
+        # Common case: the full content id matches directly.
+        s = _normalize_cid(m.group(1))
+        hit: Optional[AttachmentMeta] = idx.get(s) or idx.get(s.lower())
+        if not hit and "@" in s:
+            base = s.split("@", 1)[0]
+            hit = idx.get(base) or idx.get(base.lower())
+        if hit:
+            hits.append((m, hit))
+    if not hits:
+        return html
 
-        try:
-            data = fetch_part_bytes(conn, uid=uid, part=hit.part)
-        except Exception:
-            return m.group(0)
+    if fetch_parts_bytes is None:
+        fetch_parts_bytes = (
+            _per_part_fetcher(fetch_part_bytes)
+            if fetch_part_bytes is not None
+            else _fetch_parts_batched
+        )
+    try:
+        blobs = fetch_parts_bytes(conn, uid=uid, parts=[hit.part for _, hit in hits])
+    except Exception:
+        return html
 
+    out: list[str] = []
+    pos = 0
+    encoded: Dict[str, str] = {}
+    for m, hit in hits:
+        data = blobs.get(hit.part)
         if not data:
-            return m.group(0)
+            continue
+
+        b64 = encoded.get(hit.part)
+        if b64 is None:
+            b64 = encoded[hit.part] = _b64encode_str(data)
+
+        # Appended as separate pieces: the final join is the only copy of
+        # the (potentially large) base64 text.
+        out.append(html[pos : m.start(1)])
+        out.append(f"data:{hit._ct_lc or 'application/octet-stream'};base64,")
+        out.append(b64)
+        pos = m.end(1)
+
+    if not out:
+        return html
+    out.append(html[pos:])
+    return "".join(out)
+
+
+def _per_part_fetcher(fetch_part_bytes) -> PartsFetcher:
+    """Adapt a single-part fetcher to the batched PartsFetcher contract."""
 
-        ctype = (hit.content_type or "application/octet-stream").lower()
-        b64 = base64.b64encode(data).decode("ascii")
-        data_uri = f"data:{ctype};base64,{b64}"
-        return f"{prefix}{data_uri}{suffix}"
+    def fetch(conn: imaplib.IMAP4, *, uid: int, parts: Sequence[str]) -> Dict[str, bytes]:
+        out: Dict[str, bytes] = {}
+        for part in dict.fromkeys(parts):
+            try:
+                out[part] = fetch_part_bytes(conn, uid=uid, part=part)
+            except Exception:
+                continue
+        return out
 
-    return _IMG_SRC_RE.sub(repl, html)
+    return fetch
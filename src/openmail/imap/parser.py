@@ -1,31 +1,99 @@
 from __future__ import annotations
 
-import base64
-import email
+import hashlib
 import quopri
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from email import policy
 from email.header import decode_header, make_header
 from email.message import Message as PyMessage
-from email.parser import BytesParser
+from email.parser import BytesHeaderParser, BytesParser
+from email.policy import compat32
 from email.policy import default as default_policy
 from email.utils import getaddresses
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from openmail.errors import ParseError
-from openmail.models import Attachment, EmailAddress, EmailMessage, EmailOverview
+from openmail.models import (
+    Attachment,
+    EmailAddress,
+    EmailMessage,
+    EmailOverview,
+    EmailOverviewBatch,
+    LazyHeaders,
+)
 from openmail.types import EmailRef
 from openmail.utils import best_effort_date
+from openmail.utils.utils import _MONTHS, _fixed_offset
+
+try:  # SIMD base64 when installed (pip install "openmail[speedups]")
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    # base64.b64decode(validate=False) is a Python wrapper around this; the C
+    # decoder already skips line breaks, so no pre-scrub is needed.
+    from binascii import a2b_base64 as _b64decode
+
+# Parsers keep no state between parsebytes() calls, so one instance each is
+# shared. Only raw header values are read from the parsed messages (and
+# decoded by this module), so compat32 is enough: it builds no header
+# objects and parses several times faster than the default policy. Values
+# carrying undecodable 8-bit bytes come back as Header objects, hence str().
+_BYTES_PARSER = BytesParser(policy=compat32)
+# Stops at the header/body boundary; for MIME and HEADER blocks.
+_HDR_PARSER = BytesHeaderParser(policy=compat32)
 
 _INTERNALDATE_FMTS = [
     "%d-%b-%Y %H:%M:%S %z",  # standard INTERNALDATE
 ]
 
 
+def reset_caches() -> None:
+    """
+    Drop the module's memoised header/section decodes and interned attachment
+    payloads (for long-running processes).
+    """
+    global _att_intern_bytes
+    _decode_header_cached.cache_clear()
+    _addr_list_cached.cache_clear()
+    _section_codec.cache_clear()
+    with _ATT_INTERN_LOCK:
+        _ATT_INTERN.clear()
+        _att_intern_bytes = 0
+
+
+def _scan_internaldate(s: str) -> Optional[datetime]:
+    # "dd-Mon-yyyy hh:mm:ss +zzzz" by position; strptime interprets its
+    # format string on every call and is several times slower.
+    if len(s) == 26 and s[2] == "-" and s[6] == "-" and s[20] == " ":
+        mon = _MONTHS.get(s[3:6])
+        zone = s[21:]
+        if mon is not None and zone[0] in "+-":
+            return datetime(
+                int(s[7:11]),
+                mon,
+                int(s[:2]),
+                int(s[12:14]),
+                int(s[15:17]),
+                int(s[18:20]),
+                tzinfo=_fixed_offset(zone[:5]),
+            )
+    return None
+
+
 def parse_internaldate(internaldate_raw: Optional[str]) -> Optional[datetime]:
     if not internaldate_raw:
         return None
     s = internaldate_raw.strip().strip('"')
+    if len(s) == 25 and s[1] == "-":
+        s = "0" + s  # day is space-padded in the wire format; strip() ate the space
+    try:
+        dt = _scan_internaldate(s)
+    except ValueError:
+        dt = None
+    if dt is not None:
+        return dt
     for fmt in _INTERNALDATE_FMTS:
         try:
             return datetime.strptime(s, fmt)
@@ -34,43 +102,119 @@ def parse_internaldate(internaldate_raw: Optional[str]) -> Optional[datetime]:
     return None
 
 
-def _decode_header_value(value: Optional[str]) -> str:
-    if not value:
-        return ""
+@lru_cache(maxsize=8192)
+def _decode_header_cached(value: str) -> str:
     try:
         return str(make_header(decode_header(value)))
+    except Exception:
+        pass
+    # make_header() rejects raw 8-bit text next to an encoded word; the
+    # policy's header parser decodes that mix.
+    try:
+        return str(default_policy.header_factory("X-Unstructured", value))
     except Exception:
         return value
 
 
+def _decode_header_value(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    value = str(value)
+    # Without an encoded word decode_header() hands the value back as-is;
+    # returning early also keeps plain values out of the cache.
+    if "=?" not in value:
+        return value
+    # Header values repeat a lot across a mailbox (X-Mailer, thread subjects, ...)
+    return _decode_header_cached(value)
+
+
+def _qp_decode(payload: bytes) -> bytes:
+    # Without an "=" there is nothing to decode; skip the copy.
+    return quopri.decodestring(payload) if b"=" in payload else payload
+
+
+# Normalised Content-Transfer-Encoding -> decoder; identity encodings
+# (7bit, 8bit, binary) are simply absent.
+_CTE_DECODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "base64": _b64decode,
+    "quoted-printable": _qp_decode,
+    "quotedprintable": _qp_decode,
+    "quopri": _qp_decode,
+}
+
+
+def _unfold_raw_header(value: str) -> str:
+    """
+    Unfold a raw header value and repair 8-bit bytes; RFC 2047 words are kept.
+    """
+    if "\n" in value:
+        value = value.replace("\r\n", "").replace("\n", "")
+    value = value.strip()
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        # raw 8-bit bytes smuggled through as surrogates by email.parser
+        value = value.encode("utf-8", "surrogateescape").decode("utf-8", "replace")
+    return value
+
+
+def _decode_raw_header(value: str) -> str:
+    """
+    Decode a raw (possibly folded, possibly RFC 2047-encoded) header value.
+    """
+    value = _unfold_raw_header(value)
+    if "=?" in value:
+        return _decode_header_value(value)
+    return value
+
+
+def _raw_pairs(msg: PyMessage) -> List[Tuple[str, str]]:
+    """
+    msg's headers as unfolded (name, value) pairs, i.e. the same shape the
+    byte-level _parse_header_block produces.
+    """
+    return [(k, _unfold_raw_header(v)) for k, v in msg.raw_items()]
+
+
+def _header_map(pairs: Iterable[Tuple[str, str]], lazy: bool) -> Mapping[str, str]:
+    if lazy:
+        return LazyHeaders(list(pairs), _decode_raw_header)
+    return {k: _decode_raw_header(v) for k, v in pairs}
+
+
 def decode_transfer(payload: bytes, cte: str | None) -> bytes:
     if not cte:
         return payload
-    cte = cte.strip().lower()
+    decoder = _CTE_DECODERS.get(cte.strip().lower())
+    return decoder(payload) if decoder else payload
 
-    if cte == "base64":
-        return base64.b64decode(payload, validate=False)
-    if cte in ("quoted-printable", "quopri"):
-        return quopri.decodestring(payload)
-    return payload
 
+_Codec = Tuple[str, Optional[Callable[[bytes], bytes]]]
 
-def decode_body_chunk(chunk: bytes, msg: PyMessage) -> str:
+
+def _codec_for(msg: PyMessage) -> _Codec:
+    cte = str(msg.get("Content-Transfer-Encoding") or "").strip().lower()
+    return (msg.get_content_charset() or "utf-8", _CTE_DECODERS.get(cte))
+
+
+@lru_cache(maxsize=256)
+def _section_codec(mime_bytes: bytes) -> _Codec:
     """
-    Decode a body chunk using Content-Transfer-Encoding and charset
-    from the given (headers-only) message.
+    Codec for a fetched BODY[n.MIME] header block. Section headers repeat a
+    lot across messages, so the header parse is done once per distinct block.
     """
-    charset = msg.get_content_charset() or "utf-8"
-    cte = (msg.get("Content-Transfer-Encoding") or "").lower()
+    return _codec_for(_HDR_PARSER.parsebytes(mime_bytes))
+
+
+def _decode_with(chunk: bytes, codec: _Codec) -> str:
+    charset, decoder = codec
 
     raw = chunk
-    try:
-        if cte == "base64":
-            raw = base64.b64decode(raw, validate=False)
-        elif cte in ("quoted-printable", "quotedprintable"):
-            raw = quopri.decodestring(raw)
-    except Exception:
-        raw = chunk
+    if decoder is not None:
+        try:
+            raw = decoder(chunk)
+        except Exception:
+            raw = chunk
 
     try:
         return raw.decode(charset, errors="replace")
@@ -78,9 +222,70 @@ def decode_body_chunk(chunk: bytes, msg: PyMessage) -> str:
         return raw.decode("utf-8", errors="replace")
 
 
-def _parse_addr_list(header_val: Optional[str]) -> List[EmailAddress]:
-    if not header_val:
-        return []
+def decode_body_chunk(chunk: bytes, msg: PyMessage) -> str:
+    """
+    Decode a body chunk using Content-Transfer-Encoding and charset
+    from the given (headers-only) message.
+    """
+    return _decode_with(chunk, _codec_for(msg))
+
+
+# One mailbox, "Name <addr>" or bare "addr", with a dot-atom addr-spec and a
+# display name of plain words or one simple quoted string; anything fancier
+# (specials, comments, routes, whitespace inside the address) goes to
+# getaddresses.
+_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_ADDR_SPEC = rf"{_ATOM}(?:\.{_ATOM})*@{_ATOM}(?:\.{_ATOM})*"
+_NAME_WORD = r'[^\s"(),.:;<>@\[\]\\]+'
+_SIMPLE_ADDR_RE = re.compile(
+    rf'^\s*(?:"([^"\\]*)"|((?:{_NAME_WORD}\s+)*{_NAME_WORD})?)\s*<({_ADDR_SPEC})>\s*$'
+    rf"|^\s*({_ADDR_SPEC})\s*$"
+)
+
+
+def _fast_single_addr(header_val: str) -> Optional[EmailAddress]:
+    if "," in header_val or ";" in header_val:
+        return None
+    m = _SIMPLE_ADDR_RE.match(header_val)
+    if not m:
+        return None
+    quoted, words, addr, bare = m.groups()
+    if bare is not None:
+        return EmailAddress(email=bare, name=None)
+    # getaddresses joins the words of an unquoted name with single spaces
+    raw_name = quoted if quoted is not None else " ".join((words or "").split())
+    name = _decode_header_value(raw_name).strip()
+    return EmailAddress(email=addr, name=name or None)
+
+
+def _fast_addr_list(header_val: str) -> Optional[Tuple[EmailAddress, ...]]:
+    """
+    Comma-separated simple mailboxes without quoting, comments or groups, so
+    a plain split cannot cut through a display name; None otherwise.
+    """
+    if '"' in header_val or "(" in header_val or ";" in header_val or ":" in header_val:
+        return None
+    out: List[EmailAddress] = []
+    for item in header_val.split(","):
+        if not item.strip():
+            continue
+        addr = _fast_single_addr(item)
+        if addr is None:
+            return None
+        out.append(addr)
+    return tuple(out)
+
+
+@lru_cache(maxsize=4096)
+def _addr_list_cached(header_val: str) -> Tuple[EmailAddress, ...]:
+    # Sender and recipient lists repeat across a mailbox page; EmailAddress is
+    # frozen, so the parsed tuple is shared.
+    single = _fast_single_addr(header_val)
+    if single is not None:
+        return (single,)
+    fast = _fast_addr_list(header_val)
+    if fast is not None:
+        return fast
     out: List[EmailAddress] = []
     for name, addr in getaddresses([header_val]):
         name_decoded = _decode_header_value(name).strip()
@@ -88,47 +293,134 @@ def _parse_addr_list(header_val: Optional[str]) -> List[EmailAddress]:
         if not addr and not name_decoded:
             continue
         out.append(EmailAddress(email=addr or "", name=name_decoded or None))
-    return out
+    return tuple(out)
+
+
+def _parse_addr_list(header_val: Optional[str]) -> List[EmailAddress]:
+    if not header_val:
+        return []
+    return list(_addr_list_cached(header_val))
 
 
 def _parse_single_addr(header_val: Optional[str]) -> EmailAddress:
+    if header_val:
+        single = _fast_single_addr(header_val)
+        if single is not None:
+            return single
     addrs = _parse_addr_list(header_val)
     return addrs[0] if addrs else EmailAddress(email="", name=None)
 
 
-def _extract_parts(msg: PyMessage) -> Tuple[Optional[str], Optional[str], List[Attachment]]:
+def _part_payload(part: PyMessage) -> bytes:
+    """
+    Decoded payload of a leaf part. base64 goes through _b64decode rather than
+    the email package's own decoder; anything unusual falls back to the latter.
+    """
+    if str(part.get("Content-Transfer-Encoding") or "").strip().lower() == "base64":
+        raw = part.get_payload(decode=False)
+        if isinstance(raw, str):
+            try:
+                return _b64decode(raw.encode("ascii"))
+            except Exception:
+                pass
+    return part.get_payload(decode=True) or b""
+
+
+# Large attachment payloads keyed by SHA-256, so the same file forwarded or
+# quoted across a thread shares one buffer. bytes cannot be weakly referenced,
+# so this is a strong LRU bounded by total payload size instead.
+_ATT_INTERN_MIN_SIZE = 32 * 1024
+_ATT_INTERN_MAX_BYTES = 64 * 1024 * 1024
+_ATT_INTERN: OrderedDict[bytes, bytes] = OrderedDict()
+_att_intern_bytes = 0
+_ATT_INTERN_LOCK = threading.Lock()
+
+
+def _intern_payload(payload: bytes) -> bytes:
+    global _att_intern_bytes
+    n = len(payload)
+    if n < _ATT_INTERN_MIN_SIZE or n > _ATT_INTERN_MAX_BYTES:
+        return payload
+    key = hashlib.sha256(payload).digest()
+    with _ATT_INTERN_LOCK:
+        existing = _ATT_INTERN.get(key)
+        if existing is not None:
+            _ATT_INTERN.move_to_end(key)
+            return existing
+        _ATT_INTERN[key] = payload
+        _att_intern_bytes += n
+        while _att_intern_bytes > _ATT_INTERN_MAX_BYTES:
+            _, old = _ATT_INTERN.popitem(last=False)
+            _att_intern_bytes -= len(old)
+    return payload
+
+
+def _iter_leaf_parts(msg: PyMessage, prefix: str = "") -> Iterator[Tuple[str, PyMessage]]:
+    """
+    Yield (IMAP part number, leaf part) in document order, e.g. "1", "2.1".
+    An encapsulated message/rfc822 contributes its body's parts under its own number.
+    """
+    if not msg.is_multipart():
+        yield (prefix or "1"), msg
+        return
+
+    children = msg.get_payload()
+    if msg.get_content_maintype() == "message":
+        inner = children[0] if children else None
+        if inner is None:
+            return
+        if inner.is_multipart():
+            children = inner.get_payload()
+        else:
+            yield f"{prefix}.1" if prefix else "1", inner
+            return
+
+    for i, child in enumerate(children, start=1):
+        yield from _iter_leaf_parts(child, f"{prefix}.{i}" if prefix else str(i))
+
+
+def _extract_parts(
+    msg: PyMessage, *, include_attachments: bool = True
+) -> Tuple[Optional[str], Optional[str], List[Attachment]]:
+    """
+    (first text/plain, first text/html, attachments). Parts are classified
+    from their headers first and only decoded when kept: attachments are not
+    decoded at all without include_attachments, nor are later text parts
+    once one of that type was found.
+    """
     text: Optional[str] = None
     html: Optional[str] = None
     atts: List[Attachment] = []
     attachment_idx = 0
 
     if msg.is_multipart():
-        for part in msg.walk():
-            if part.is_multipart():
-                continue
-
+        for part_id, part in _iter_leaf_parts(msg):
             ctype = part.get_content_type()
-            disp = (part.get("Content-Disposition") or "").lower()
+            disp = str(part.get("Content-Disposition") or "").lower()
+            is_attachment = "attachment" in disp
 
             filename = part.get_filename()
-            if filename:
-                filename = _decode_header_value(filename)
-
-            payload = part.get_payload(decode=True) or b""
+            if filename or is_attachment:
+                # idx counts every attachment, kept or not, like the part walk
+                attachment_idx += 1
+                if not include_attachments:
+                    continue
 
-            content_id = part.get("Content-ID")
-            if content_id:
-                content_id = content_id.strip().strip("<>").strip() or None
+                if filename:
+                    filename = _decode_header_value(filename)
 
-            is_inline_image = ctype.startswith("image/") and (
-                ("inline" in disp) or bool(content_id)
-            )
+                content_id = part.get("Content-ID")
+                if content_id:
+                    content_id = str(content_id).strip().strip("<>").strip() or None
 
-            # Attachment (explicit disposition or filename)
-            if filename or "attachment" in disp:
+                is_inline_image = ctype.startswith("image/") and (
+                    "inline" in disp or bool(content_id)
+                )
+                payload = _intern_payload(_part_payload(part))
                 atts.append(
                     Attachment(
-                        idx=attachment_idx,
+                        idx=attachment_idx - 1,
+                        part=part_id,
                         filename=filename or "attachment",
                         content_type=ctype,
                         data=payload,
@@ -137,26 +429,21 @@ def _extract_parts(msg: PyMessage) -> Tuple[Optional[str], Optional[str], List[A
                         disposition=(
                             "inline"
                             if is_inline_image
-                            else ("attachment" if "attachment" in disp else None)
+                            else ("attachment" if is_attachment else None)
                         ),
                         is_inline=is_inline_image,
                     )
                 )
-                attachment_idx += 1
                 continue
 
-            if ctype in ("text/plain", "text/html"):
-                charset = part.get_content_charset() or "utf-8"
-                body = payload.decode(charset, errors="replace")
-
-                if ctype == "text/plain" and text is None:
-                    text = body
-                elif ctype == "text/html" and html is None:
-                    html = body
+            if ctype == "text/plain":
+                if text is None:
+                    text = _part_text(part)
+            elif ctype == "text/html":
+                if html is None:
+                    html = _part_text(part)
     else:
-        payload = msg.get_payload(decode=True) or b""
-        charset = msg.get_content_charset() or "utf-8"
-        body = payload.decode(charset, errors="replace")
+        body = _part_text(msg)
         if msg.get_content_type() == "text/html":
             html = body
         else:
@@ -165,6 +452,11 @@ def _extract_parts(msg: PyMessage) -> Tuple[Optional[str], Optional[str], List[A
     return text, html, atts
 
 
+def _part_text(part: PyMessage) -> str:
+    charset = part.get_content_charset() or "utf-8"
+    return _part_payload(part).decode(charset, errors="replace")
+
+
 def decode_section(mime_bytes: Optional[bytes], body_bytes: Optional[bytes]) -> str:
     if not body_bytes:
         return ""
@@ -174,8 +466,25 @@ def decode_section(mime_bytes: Optional[bytes], body_bytes: Optional[bytes]) ->
         except Exception:
             return body_bytes.decode("latin-1", errors="replace")
 
-    msg = BytesParser(policy=default_policy).parsebytes(mime_bytes)
-    return decode_body_chunk(body_bytes, msg)
+    return _decode_with(body_bytes, _section_codec(bytes(mime_bytes)))
+
+
+_ADDR_HEADERS = frozenset(("to", "cc", "bcc"))
+
+
+def _header_values(pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Lower-cased header name -> first raw value, like Message.get, except that
+    repeated To/Cc/Bcc headers are joined so no recipient is dropped.
+    """
+    out: Dict[str, str] = {}
+    for k, v in pairs:
+        lk = k.lower()
+        if lk not in out:
+            out[lk] = v
+        elif lk in _ADDR_HEADERS:
+            out[lk] = f"{out[lk]}, {v}"
+    return out
 
 
 def parse_rfc822(
@@ -184,39 +493,71 @@ def parse_rfc822(
     *,
     include_attachments: bool = False,
     internaldate_raw: Optional[str] = None,
+    lazy_headers: bool = True,
 ) -> EmailMessage:
     try:
-        pymsg: PyMessage = email.message_from_bytes(raw, policy=policy.default)
+        pymsg: PyMessage = _BYTES_PARSER.parsebytes(raw)
 
-        text, html, atts = _extract_parts(pymsg)
-        if not include_attachments:
-            atts = []
+        text, html, atts = _extract_parts(pymsg, include_attachments=include_attachments)
 
-        headers: Dict[str, str] = {k: _decode_header_value(str(v)) for k, v in pymsg.items()}
+        pairs = _raw_pairs(pymsg)
+        headers = _header_map(pairs, lazy_headers)
+        get = _header_values(pairs).get
 
-        raw_date = pymsg.get("Date")
+        raw_date = get("date")
         received_at = parse_internaldate(internaldate_raw)
         sent_at = best_effort_date(raw_date, None)
 
         return EmailMessage(
             ref=ref,
-            subject=_decode_header_value(pymsg.get("Subject")),
-            from_email=_parse_single_addr(pymsg.get("From")),
-            to=_parse_addr_list(pymsg.get("To")),
-            cc=_parse_addr_list(pymsg.get("Cc")),
-            bcc=_parse_addr_list(pymsg.get("Bcc")),
+            subject=_decode_header_value(get("subject")),
+            from_email=_parse_single_addr(get("from")),
+            to=_parse_addr_list(get("to")),
+            cc=_parse_addr_list(get("cc")),
+            bcc=_parse_addr_list(get("bcc")),
             text=text,
             html=html,
             attachments=atts,
             received_at=received_at,
             sent_at=sent_at,
-            message_id=_decode_header_value(pymsg.get("Message-ID")),
+            message_id=_decode_header_value(get("message-id")),
             headers=headers,
         )
     except Exception as e:
         raise ParseError(f"Failed to parse RFC822: {e}") from e
 
 
+def _parse_header_block(buf: bytes) -> List[Tuple[str, str]]:
+    """
+    Split a raw header block into (name, value) pairs, in order.
+
+    Line endings are normalised and folded lines unfolded with bytes.replace,
+    so the per-header work is a single split. Scanning stops at the first
+    empty line. Values are left RFC 2047-encoded.
+    """
+    if b"\r" in buf:
+        buf = buf.replace(b"\r\n", b"\n")
+    if buf[:1] == b"\n":
+        return []
+    end = buf.find(b"\n\n")
+    if end != -1:
+        buf = buf[:end]
+    buf = buf.replace(b"\n ", b" ").replace(b"\n\t", b"\t")
+
+    out: List[Tuple[str, str]] = []
+    for line in buf.split(b"\n"):
+        i = line.find(b":")
+        if i <= 0 or line[0] in (0x20, 0x09):
+            continue
+        out.append(
+            (
+                line[:i].rstrip().decode("ascii", "replace"),
+                line[i + 1 :].strip().decode("utf-8", "replace"),
+            )
+        )
+    return out
+
+
 def parse_headers_and_bodies(
     ref: EmailRef,
     header_bytes: bytes,
@@ -225,74 +566,148 @@ def parse_headers_and_bodies(
     html: str,
     attachments,
     internaldate_raw: Optional[str] = None,
+    lazy_headers: bool = True,
+    fast_headers: bool = True,
 ) -> EmailMessage:
     try:
-        msg_headers = BytesParser(policy=default_policy).parsebytes(header_bytes or b"")
+        if fast_headers:
+            pairs = _parse_header_block(bytes(header_bytes or b""))
+            get = _header_values(pairs).get
+        else:
+            pairs = _raw_pairs(_HDR_PARSER.parsebytes(header_bytes or b""))
+            get = _header_values(pairs).get
 
-        headers: Dict[str, str] = {k: _decode_header_value(str(v)) for k, v in msg_headers.items()}
-        raw_date = msg_headers.get("Date")
+        headers = _header_map(pairs, lazy_headers)
+        raw_date = get("date")
         received_at = parse_internaldate(internaldate_raw)
         sent_at = best_effort_date(raw_date, None)
 
         return EmailMessage(
             ref=ref,
-            subject=_decode_header_value(msg_headers.get("Subject")),
-            from_email=_parse_single_addr(msg_headers.get("From")),
-            to=_parse_addr_list(msg_headers.get("To")),
-            cc=_parse_addr_list(msg_headers.get("Cc")),
-            bcc=_parse_addr_list(msg_headers.get("Bcc")),
+            subject=_decode_header_value(get("subject")),
+            from_email=_parse_single_addr(get("from")),
+            to=_parse_addr_list(get("to")),
+            cc=_parse_addr_list(get("cc")),
+            bcc=_parse_addr_list(get("bcc")),
             text=text or None,
             html=html or None,
             attachments=attachments,
             received_at=received_at,
             sent_at=sent_at,
-            message_id=_decode_header_value(msg_headers.get("Message-ID")),
+            message_id=_decode_header_value(get("message-id")),
             headers=headers,
         )
     except Exception as e:
         raise ParseError(f"Failed to parse headers/bodies: {e}") from e
 
 
+_OverviewFields = Tuple[str, EmailAddress, List[EmailAddress], Optional[str], Mapping[str, str]]
+
+
+def _overview_fields(
+    header_bytes: bytes | bytearray, *, fast_headers: bool, lazy_headers: bool
+) -> _OverviewFields:
+    """
+    (subject, from, to, raw Date header, headers) from a HEADER.FIELDS block.
+    """
+    if not isinstance(header_bytes, (bytes, bytearray)):
+        return "", EmailAddress(email="", name=None), [], None, {}
+
+    pairs: List[Tuple[str, str]]
+    if fast_headers:
+        pairs = _parse_header_block(bytes(header_bytes))
+    else:
+        pairs = _raw_pairs(_HDR_PARSER.parsebytes(bytes(header_bytes)))
+
+    # One pass over the headers; Message.get would rescan the list per lookup.
+    subject_raw: Optional[str] = None
+    from_raw: Optional[str] = None
+    date_header_raw: Optional[str] = None
+    to_raw: List[str] = []
+    for k, v in pairs:
+        lk = k.lower()
+        if lk == "subject":
+            if subject_raw is None:
+                subject_raw = v
+        elif lk == "from":
+            if from_raw is None:
+                from_raw = v
+        elif lk == "date":
+            if date_header_raw is None:
+                date_header_raw = v
+        elif lk == "to":
+            to_raw.append(v)
+
+    headers = _header_map(pairs, lazy_headers)
+    subject = _decode_header_value(subject_raw)
+    from_addr = _parse_single_addr(from_raw)
+    to_addrs = _parse_addr_list(", ".join(to_raw)) if to_raw else []
+
+    return subject or "", from_addr, to_addrs, date_header_raw, headers
+
+
 def parse_overview(
     ref: EmailRef,
-    flags: set,
+    flags: AbstractSet[str],
     header_bytes: bytes | bytearray,
     *,
     internaldate_raw: Optional[str] = None,
+    fast_headers: bool = True,
+    lazy_headers: bool = True,
 ) -> EmailOverview:
-    try:
-        subject = ""
-        from_addr = EmailAddress(email="", name=None)
-        to_addrs: List[EmailAddress] = []
-        headers: Dict[str, str] = {}
-        date_header_raw: Optional[str] = None
-
-        if isinstance(header_bytes, (bytes, bytearray)):
-            msg_headers = BytesParser(policy=default_policy).parsebytes(bytes(header_bytes))
-
-            subject = _decode_header_value(msg_headers.get("Subject"))
-            from_addr = _parse_single_addr(msg_headers.get("From"))
-            date_header_raw = msg_headers.get("Date")
-
-            to_raw_list = msg_headers.get_all("To", [])
-            if to_raw_list:
-                to_addrs = _parse_addr_list(", ".join(to_raw_list))
-
-            for k, v in msg_headers.items():
-                headers[k] = _decode_header_value(str(v))
-
-        received_at = parse_internaldate(internaldate_raw)
-        sent_at = best_effort_date(date_header_raw, None)
+    """
+    Build an EmailOverview from a HEADER.FIELDS block.
 
+    fast_headers uses a plain byte-level header splitter; pass False to go
+    through email.parser instead. With lazy_headers the headers mapping is
+    only decoded when first read.
+    """
+    try:
+        subject, from_addr, to_addrs, date_header_raw, headers = _overview_fields(
+            header_bytes, fast_headers=fast_headers, lazy_headers=lazy_headers
+        )
         return EmailOverview(
             ref=ref,
-            subject=subject or "",
-            from_email=from_addr or EmailAddress(email="", name=None),
+            subject=subject,
+            from_email=from_addr,
             to=to_addrs,
             flags=flags,
-            received_at=received_at,
-            sent_at=sent_at,
+            received_at=parse_internaldate(internaldate_raw),
+            sent_at=best_effort_date(date_header_raw, None),
             headers=headers,
         )
     except Exception as e:
         raise ParseError(f"Failed to parse Email Overview: {e}") from e
+
+
+def parse_overview_batch(
+    items: Iterable[Tuple[EmailRef, AbstractSet[str], bytes, Optional[str]]],
+    *,
+    fast_headers: bool = True,
+    lazy_headers: bool = True,
+) -> EmailOverviewBatch:
+    """
+    Columnar counterpart of parse_overview.
+
+    items: (ref, flags, header_bytes, internaldate_raw) per message.
+    """
+    batch = EmailOverviewBatch()
+    for ref, flags, header_bytes, internaldate_raw in items:
+        try:
+            subject, from_addr, to_addrs, date_header_raw, headers = _overview_fields(
+                header_bytes, fast_headers=fast_headers, lazy_headers=lazy_headers
+            )
+            received_at = parse_internaldate(internaldate_raw)
+            sent_at = best_effort_date(date_header_raw, None)
+        except Exception as e:
+            raise ParseError(f"Failed to parse Email Overview: {e}") from e
+
+        batch.refs.append(ref)
+        batch.subjects.append(subject)
+        batch.senders.append(from_addr)
+        batch.tos.append(to_addrs)
+        batch.flags.append(flags)
+        batch.received_at.append(received_at)
+        batch.sent_at.append(sent_at)
+        batch.headers.append(headers)
+    return batch
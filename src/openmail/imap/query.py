@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import List, Sequence
 
 
 def _imap_date(iso_yyyy_mm_dd: str) -> str:
@@ -196,6 +196,10 @@ class IMAPQuery:
         return self._not("BODY", _q(s))
 
     def or_(self, *queries: IMAPQuery) -> IMAPQuery:
+        """
+        Replace this query with (self OR q1 OR q2 ...), as a balanced tree of
+        binary ORs so the nesting depth grows with log2 of the operands.
+        """
         qs = [q for q in (self, *queries) if q.parts]
 
         if len(qs) < 2:
@@ -203,14 +207,7 @@ class IMAPQuery:
                 "or_ requires at least two non-empty IMAPQuery instances (including self)"
             )
 
-        tokens: List[str] = list(qs[0].parts)
-
-        for q in qs[1:]:
-            right = list(q.parts)
-
-            tokens = ["OR", "("] + tokens + [")", "("] + right + [")"]
-
-        self.parts = tokens
+        self.parts = _or_tree(qs)
         return self
 
     # --- composition helpers ---
@@ -231,3 +228,10 @@ class IMAPQuery:
         s = " ".join(self.parts)
         s = s.replace("( ", "(").replace(" )", ")")
         return s
+
+
+def _or_tree(qs: Sequence[IMAPQuery]) -> List[str]:
+    if len(qs) == 1:
+        return list(qs[0].parts)
+    mid = (len(qs) + 1) // 2
+    return ["OR", "(", *_or_tree(qs[:mid]), ")", "(", *_or_tree(qs[mid:]), ")"]
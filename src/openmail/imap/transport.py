@@ -0,0 +1,31 @@
+# openmail/imap/transport.py
+from __future__ import annotations
+
+import imaplib
+
+from openmail.utils.net import tune_socket
+
+# imaplib reads through sock.makefile("rb") with the default 8 KiB buffer,
+# i.e. one recv() per 8 KiB of a large FETCH. A bigger buffer cuts syscalls.
+READ_BUFFER_SIZE = 128 * 1024
+
+
+class _TunedIMAP4Mixin:
+    def open(self, host: str = "", port: int = imaplib.IMAP4_PORT, timeout=None) -> None:
+        super().open(host, port, timeout)
+        tune_socket(self.sock)
+        # Nothing has been read yet (the greeting comes after open()), so the
+        # reader can be swapped without losing buffered bytes. Newer imaplib
+        # buffers its own reads and exposes file only as a property; leave
+        # that alone.
+        if "file" in vars(self):
+            self.file.close()
+            self.file = self.sock.makefile("rb", buffering=READ_BUFFER_SIZE)
+
+
+class TunedIMAP4(_TunedIMAP4Mixin, imaplib.IMAP4):
+    pass
+
+
+class TunedIMAP4_SSL(_TunedIMAP4Mixin, imaplib.IMAP4_SSL):
+    pass
@@ -1,7 +1,5 @@
 from typing import Type
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from pydantic import BaseModel
 
 
@@ -11,6 +9,8 @@ def get_claude(
     temperature: float = 0.1,
     timeout: int = 120,
 ):
+    from langchain_anthropic import ChatAnthropic
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
     base_llm = ChatAnthropic(
         model=model_name,
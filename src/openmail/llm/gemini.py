@@ -1,7 +1,5 @@
 from typing import Type
 
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel
 
 
@@ -11,6 +9,8 @@ def get_gemini(
     temperature: float = 0.1,
     timeout: int = 120,
 ):
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
     base_llm = ChatGoogleGenerativeAI(
         model=model_name,
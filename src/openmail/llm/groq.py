@@ -1,7 +1,5 @@
 from typing import Type
 
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_groq import ChatGroq
 from pydantic import BaseModel
 
 
@@ -11,6 +9,8 @@ def get_groq(
     temperature: float = 0.1,
     timeout: int = 120,
 ):
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain_groq import ChatGroq
 
     base_llm = ChatGroq(
         model=model_name,
@@ -1,5 +1,12 @@
 from openmail.models.attachment import Attachment, AttachmentMeta
-from openmail.models.message import EmailAddress, EmailMessage, EmailOverview
+from openmail.models.message import (
+    EmailAddress,
+    EmailMessage,
+    EmailOverview,
+    EmailOverviewBatch,
+    LazyHeaders,
+    to_json_array,
+)
 from openmail.models.subscription import (
     UnsubscribeActionResult,
     UnsubscribeCandidate,
@@ -11,10 +18,13 @@ __all__ = [
     "EmailAddress",
     "EmailMessage",
     "EmailOverview",
+    "EmailOverviewBatch",
+    "LazyHeaders",
     "AttachmentMeta",
     "Attachment",
     "UnsubscribeMethod",
     "UnsubscribeCandidate",
     "UnsubscribeActionResult",
     "Task",
+    "to_json_array",
 ]
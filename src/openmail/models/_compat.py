@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Mapping, Set
+from typing import Any, Callable, Sequence
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain dataclasses.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+try:  # serialises dataclasses natively in C (pip install "openmail[speedups]")
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    # orjson handles dataclasses, lists, dicts and datetimes itself; this
+    # covers LazyHeaders and frozenset flags.
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Set):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(obj: Any, to_dict: Callable[[], dict], *, native: bool = True) -> bytes:
+    """
+    JSON bytes for a model. With orjson and native=True the dataclass is
+    serialised directly; otherwise to_dict() is dumped.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj if native else to_dict(), default=_json_default)
+    return json.dumps(to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_json_many(objs: Sequence[Any], *, native: bool = True) -> bytes:
+    """
+    One JSON array for many models. With orjson and native=True the whole
+    list is encoded in a single C call; otherwise each model's
+    to_json_bytes() is joined.
+    """
+    if orjson is not None and native:
+        return orjson.dumps(objs, default=_json_default)
+    return b"[" + b",".join(obj.to_json_bytes() for obj in objs) + b"]"
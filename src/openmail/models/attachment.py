@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Optional, Union
+
+from openmail.models._compat import DATACLASS_SLOTS
 
 
 def _normalize_content_id(cid: Optional[str]) -> Optional[str]:
@@ -23,7 +25,7 @@ def _normalize_disposition(d: Optional[str]) -> Optional[str]:
     return d2 or None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AttachmentMeta:
     idx: int
     part: str
@@ -34,9 +36,12 @@ class AttachmentMeta:
     disposition: Optional[str] = None
     is_inline: bool = False
     content_location: Optional[str] = None
+    # content_type lower-cased once, for the is_image / inline-CID checks
+    _ct_lc: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # frozen=True, so use object.__setattr__
+        object.__setattr__(self, "_ct_lc", (self.content_type or "").lower())
         object.__setattr__(self, "content_id", _normalize_content_id(self.content_id))
         object.__setattr__(self, "disposition", _normalize_disposition(self.disposition))
 
@@ -44,12 +49,16 @@ class AttachmentMeta:
         # - explicit inline disposition OR
         # - has content_id and is an image (typical CID-inline case)
         inferred_inline = (self.disposition == "inline") or (
-            self.content_id is not None and self.content_type.lower().startswith("image/")
+            self.content_id is not None and self.is_image
         )
         # Only override if it looks unset / default
         if self.is_inline is False and inferred_inline:
             object.__setattr__(self, "is_inline", True)
 
+    @property
+    def is_image(self) -> bool:
+        return self._ct_lc.startswith("image/")
+
     def __repr__(self) -> str:
         extra = []
         if self.disposition:
@@ -63,7 +72,7 @@ class AttachmentMeta:
 
         extra_s = (", " + ", ".join(extra)) if extra else ""
         return (
-            f"AttachmentMeta("
+            f"{type(self).__name__}("
             f"idx={self.idx!r}, "
             f"part={self.part!r}, "
             f"filename={self.filename!r}, "
@@ -87,42 +96,12 @@ class AttachmentMeta:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, repr=False, **DATACLASS_SLOTS)
 class Attachment(AttachmentMeta):
+    # __repr__ / to_dict are inherited; the repr picks up the class name.
     data: bytes = b""
-
-    def __repr__(self) -> str:
-        # Keep Attachment repr aligned with AttachmentMeta, but still indicate it’s Attachment.
-        extra = []
-        if self.disposition:
-            extra.append(f"disposition={self.disposition!r}")
-        if self.is_inline:
-            extra.append("is_inline=True")
-        if self.content_id:
-            extra.append(f"content_id={self.content_id!r}")
-        if self.content_location:
-            extra.append(f"content_location={self.content_location!r}")
-
-        extra_s = (", " + ", ".join(extra)) if extra else ""
-        return (
-            f"Attachment("
-            f"idx={self.idx!r}, "
-            f"part={self.part!r}, "
-            f"filename={self.filename!r}, "
-            f"content_type={self.content_type!r}, "
-            f"size={self.size} bytes"
-            f"{extra_s})"
-        )
-
-    def to_dict(self) -> dict:
-        return {
-            "idx": self.idx,
-            "part": self.part,
-            "filename": self.filename,
-            "content_type": self.content_type,
-            "size": self.size,
-            "content_id": self.content_id,
-            "disposition": self.disposition,
-            "is_inline": self.is_inline,
-            "content_location": self.content_location,
-        }
+    # Outgoing only: a binary file object, or a callable that opens one, read
+    # in chunks when the message is built instead of passing data.
+    stream: Optional[Union[BinaryIO, Callable[[], BinaryIO]]] = field(
+        default=None, repr=False, compare=False
+    )
@@ -1,16 +1,79 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set
-
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from openmail.models._compat import DATACLASS_SLOTS, dumps_json, dumps_json_many
 from openmail.types import EmailRef
 
 if TYPE_CHECKING:
     from openmail.models.attachment import Attachment
 
 
-@dataclass(frozen=True)
+class LazyHeaders(Mapping[str, str]):
+    """
+    Read-only header mapping over raw (name, value) pairs. A value is only
+    decoded when that header is read, so looking up Message-ID does not pay
+    for decoding Received or DKIM-Signature. Later duplicates win, as with a
+    plain dict built in order.
+    """
+
+    __slots__ = ("_raw", "_decode", "_index", "_data")
+
+    def __init__(self, raw: Sequence[Tuple[str, str]], decode: Callable[[str], str]) -> None:
+        self._raw = raw
+        self._decode = decode
+        self._index: Optional[Dict[str, str]] = None
+        self._data: Dict[str, str] = {}
+
+    def _raw_index(self) -> Dict[str, str]:
+        index = self._index
+        if index is None:
+            index = self._index = dict(self._raw)
+            self._raw = ()
+        return index
+
+    def __getitem__(self, key: str) -> str:
+        data = self._data
+        try:
+            return data[key]
+        except KeyError:
+            value = data[key] = self._decode(self._raw_index()[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_index())
+
+    def __len__(self) -> int:
+        return len(self._raw_index())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw_index()
+
+    def _materialize(self) -> Dict[str, str]:
+        return {k: self[k] for k in self._raw_index()}
+
+    def __repr__(self) -> str:
+        return f"LazyHeaders({self._materialize()!r})"
+
+    def __reduce__(self):
+        return (dict, (self._materialize(),))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EmailAddress:
     email: str
     name: Optional[str] = None
@@ -34,7 +97,7 @@ class EmailAddress:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EmailMessage:
     ref: EmailRef
     subject: str
@@ -50,7 +113,7 @@ class EmailMessage:
     received_at: Optional[datetime] = None
     sent_at: Optional[datetime] = None
     message_id: Optional[str] = None
-    headers: Dict[str, str] = field(default_factory=dict)
+    headers: Mapping[str, str] = field(default_factory=dict)
 
     def __repr__(self) -> str:
         return (
@@ -62,32 +125,47 @@ class EmailMessage:
             f"attachments={len(self.attachments)})"
         )
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Same document as to_dict(), as UTF-8 JSON bytes, without building the
+        intermediate dicts when orjson is installed.
+        """
+        return dumps_json(self, self.to_dict, native=_native_json(self))
+
     def to_dict(self) -> dict:
+        addr = EmailAddress.to_dict
+        received_at, sent_at = self.received_at, self.sent_at
         return {
             "ref": self.ref.to_dict(),
             "subject": self.subject,
-            "from_email": self.from_email.to_dict(),
-            "to": [addr.to_dict() for addr in self.to],
-            "cc": [addr.to_dict() for addr in self.cc],
-            "bcc": [addr.to_dict() for addr in self.bcc],
+            "from_email": addr(self.from_email),
+            "to": [addr(a) for a in self.to],
+            "cc": [addr(a) for a in self.cc],
+            "bcc": [addr(a) for a in self.bcc],
             "text": self.text,
             "html": self.html,
             "attachments": [att.to_dict() for att in self.attachments],
-            "received_at": self.received_at.isoformat() if self.received_at else None,
-            "sent_at": self.sent_at.isoformat() if self.sent_at else None,
+            "received_at": received_at.isoformat() if received_at else None,
+            "sent_at": sent_at.isoformat() if sent_at else None,
             "message_id": self.message_id,
-            "headers": self.headers,
+            "headers": dict(self.headers),
         }
 
 
-@dataclass(frozen=True)
+def _native_json(msg: EmailMessage) -> bool:
+    # Attachment.data is bytes and is not part of to_dict(); those go the
+    # to_dict route so the output is identical.
+    return not any(hasattr(a, "data") for a in msg.attachments)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EmailOverview:
     ref: EmailRef
     subject: str
     from_email: EmailAddress
     to: Sequence[EmailAddress]
-    flags: Set[str]
-    headers: Dict[str, str]
+    flags: AbstractSet[str]
+    headers: Mapping[str, str]
     received_at: Optional[datetime] = None
     sent_at: Optional[datetime] = None
 
@@ -107,7 +185,71 @@ class EmailOverview:
             "from_email": self.from_email.to_dict(),
             "to": [addr.to_dict() for addr in self.to],
             "flags": list(self.flags),
-            "headers": self.headers,
+            "headers": dict(self.headers),
             "received_at": self.received_at.isoformat() if self.received_at else None,
             "sent_at": self.sent_at.isoformat() if self.sent_at else None,
         }
+
+    def to_json_bytes(self) -> bytes:
+        """Same document as to_dict(), as UTF-8 JSON bytes."""
+        return dumps_json(self, self.to_dict)
+
+
+def to_json_array(items: Sequence[EmailMessage | EmailOverview]) -> bytes:
+    """
+    A JSON array of each item's to_dict() document, as UTF-8 bytes. With
+    orjson installed the list is serialised in one call instead of one
+    to_json_bytes() per item.
+    """
+    native = all(not isinstance(m, EmailMessage) or _native_json(m) for m in items)
+    return dumps_json_many(items, native=native)
+
+
+@dataclass
+class EmailOverviewBatch:
+    """
+    Column-oriented overviews: one list per field, aligned by index.
+
+    Cheaper than a list of EmailOverview when only a few columns are read
+    (e.g. subjects for a listing); row(i) builds the full object on demand.
+    """
+
+    refs: List[EmailRef] = field(default_factory=list)
+    subjects: List[str] = field(default_factory=list)
+    senders: List[EmailAddress] = field(default_factory=list)
+    tos: List[List[EmailAddress]] = field(default_factory=list)
+    flags: List[AbstractSet[str]] = field(default_factory=list)
+    received_at: List[Optional[datetime]] = field(default_factory=list)
+    sent_at: List[Optional[datetime]] = field(default_factory=list)
+    headers: List[Mapping[str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def row(self, i: int) -> EmailOverview:
+        return EmailOverview(
+            ref=self.refs[i],
+            subject=self.subjects[i],
+            from_email=self.senders[i],
+            to=self.tos[i],
+            flags=self.flags[i],
+            headers=self.headers[i],
+            received_at=self.received_at[i],
+            sent_at=self.sent_at[i],
+        )
+
+    def rows(self) -> List[EmailOverview]:
+        return [self.row(i) for i in range(len(self.refs))]
+
+    def take(self, indices: Sequence[int]) -> EmailOverviewBatch:
+        """
+        A new batch of the given rows, in that order: sort or filter on one
+        column and reorder the rest without building row objects, e.g.
+        batch.take(sorted(range(len(batch)), key=batch.received_at.__getitem__)).
+        """
+        return EmailOverviewBatch(
+            *([col[i] for i in indices] for col in attrgetter(*_BATCH_COLUMNS)(self))
+        )
+
+
+_BATCH_COLUMNS = tuple(f.name for f in fields(EmailOverviewBatch))
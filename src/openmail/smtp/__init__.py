@@ -1,7 +1,11 @@
+from openmail.smtp.async_client import AsyncSMTPClient
 from openmail.smtp.client import SMTPClient
+from openmail.smtp.queued import QueuedSMTPSender
 from openmail.smtp.templates import RenderedTemplate
 
 __all__ = [
+    "AsyncSMTPClient",
     "SMTPClient",
+    "QueuedSMTPSender",
     "RenderedTemplate",
 ]
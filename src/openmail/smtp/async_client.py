@@ -0,0 +1,219 @@
+# openmail/smtp/async_client.py
+from __future__ import annotations
+
+import asyncio
+import base64
+from dataclasses import dataclass, field
+from email.message import EmailMessage as PyEmailMessage
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
+
+from openmail import SMTPConfig
+from openmail.auth import NoAuth, OAuth2Auth, PasswordAuth
+from openmail.errors import AuthError, ConfigError, SMTPError
+from openmail.smtp.client import _SMTPBase, _ssl_context, validated_config
+from openmail.types import SendResult
+
+if TYPE_CHECKING:
+    import aiosmtplib
+
+
+def _aiosmtplib():
+    try:
+        import aiosmtplib
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ConfigError('AsyncSMTPClient needs aiosmtplib (pip install "openmail[async]")') from e
+    return aiosmtplib
+
+
+@dataclass
+class AsyncSMTPClient(_SMTPBase):
+    """
+    asyncio counterpart of SMTPClient on top of aiosmtplib.
+
+    send() reuses one lazily opened connection; send_many() spreads a batch
+    over up to `concurrency` connections, so TCP/TLS/AUTH and the SMTP
+    transactions of different messages overlap instead of queueing.
+    """
+
+    config: SMTPConfig
+    _server: Optional[aiosmtplib.SMTP] = field(default=None, init=False, repr=False)
+    _lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_config(cls, config: SMTPConfig) -> AsyncSMTPClient:
+        return cls(validated_config(config))
+
+    async def _authenticate(self, server: aiosmtplib.SMTP) -> None:
+        auth = self.config.auth
+        if auth is None:
+            raise ConfigError("SMTPConfig.auth is required (PasswordAuth or OAuth2Auth)")
+        if isinstance(auth, NoAuth):
+            return
+        if isinstance(auth, PasswordAuth):
+            await server.login(auth.username, auth.password)
+            return
+        if isinstance(auth, OAuth2Auth):
+            token = auth._access_token()
+            if not token:
+                raise AuthError("OAuth2 token provider returned empty token")
+            raw = auth._raw_xoauth2(token).encode("utf-8")
+            resp = await server.execute_command(b"AUTH", b"XOAUTH2", base64.b64encode(raw))
+            if resp.code != 235:
+                auth._forget_token()
+                raise AuthError(f"SMTP XOAUTH2 auth failed: {resp.code} {resp.message!r}")
+            return
+        raise ConfigError(f"AsyncSMTPClient does not support {type(auth).__name__}")
+
+    async def _open_new_server(self) -> aiosmtplib.SMTP:
+        lib = _aiosmtplib()
+        cfg = self.config
+        server = lib.SMTP(
+            hostname=cfg.host,
+            port=cfg.port,
+            use_tls=cfg.use_ssl,
+            start_tls=cfg.use_starttls,
+            timeout=cfg.timeout,
+            tls_context=_ssl_context(),
+        )
+        try:
+            await server.connect()
+            try:
+                await self._authenticate(server)
+            except lib.SMTPAuthenticationError as e:
+                raise AuthError(f"SMTP auth failed: {e}") from e
+            except AuthError:
+                raise
+            except lib.SMTPException as e:
+                raise AuthError(f"SMTP auth failed: {e}") from e
+        except AuthError:
+            await self._quit_quietly(server)
+            raise
+        except lib.SMTPException as e:
+            await self._quit_quietly(server)
+            raise SMTPError(f"SMTP connection failed: {e}") from e
+        except OSError as e:
+            raise SMTPError(f"SMTP network error: {e}") from e
+        return server
+
+    @staticmethod
+    async def _quit_quietly(server: aiosmtplib.SMTP) -> None:
+        try:
+            await server.quit()
+        except Exception:
+            server.close()
+
+    async def _deliver(
+        self, server: aiosmtplib.SMTP, msg: PyEmailMessage, from_email: str, rcpts: List[str]
+    ) -> SendResult:
+        lib = _aiosmtplib()
+        try:
+            await server.send_message(msg, sender=from_email, recipients=rcpts)
+        except lib.SMTPAuthenticationError as e:
+            raise AuthError(f"SMTP auth failed during send: {e}") from e
+        except (lib.SMTPRecipientsRefused, lib.SMTPSenderRefused, lib.SMTPDataError) as e:
+            return SendResult(ok=False, message_id=str(msg["Message-ID"]), detail=f"{e}")
+        return SendResult(ok=True, message_id=str(msg["Message-ID"]))
+
+    async def _send_on(
+        self, get_server, reset, msg: PyEmailMessage, from_email: str, rcpts: List[str]
+    ) -> SendResult:
+        """Send on get_server(); reconnect and retry once if the server dropped us."""
+        lib = _aiosmtplib()
+        last_exc: Optional[BaseException] = None
+        for _ in range(2):
+            server = await get_server()
+            try:
+                return await self._deliver(server, msg, from_email, rcpts)
+            except lib.SMTPServerDisconnected as e:
+                last_exc = e
+                await reset()
+            except AuthError:
+                raise
+            except lib.SMTPException as e:
+                raise SMTPError(f"SMTP operation failed: {e}") from e
+        raise SMTPError(f"SMTP connection repeatedly disconnected: {last_exc}") from last_exc
+
+    async def _get_server(self) -> aiosmtplib.SMTP:
+        if self._server is None or not self._server.is_connected:
+            self._server = await self._open_new_server()
+        return self._server
+
+    async def _reset_server(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            await self._quit_quietly(server)
+
+    async def send(
+        self, msg: PyEmailMessage, recipients: List[str], *, mutate_ok: bool = False
+    ) -> SendResult:
+        if not recipients:
+            raise ConfigError("send(): recipients list is empty")
+        msg, from_email = self._prepare(msg, mutate_ok=mutate_ok)
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await self._send_on(
+                self._get_server, self._reset_server, msg, from_email, list(recipients)
+            )
+
+    async def send_many(
+        self,
+        batch: Iterable[Tuple[PyEmailMessage, Iterable[str]]],
+        *,
+        concurrency: int = 10,
+        mutate_ok: bool = False,
+    ) -> List[SendResult]:
+        """
+        Send a batch over up to `concurrency` connections of its own; results
+        are returned in batch order. Rejected messages come back as ok=False.
+        """
+        prepared: List[Tuple[PyEmailMessage, str, List[str]]] = []
+        for msg, rcpts_iter in batch:
+            rcpts = list(rcpts_iter)
+            if not rcpts:
+                raise ConfigError("send_many(): one of the messages has no recipients")
+            final_msg, from_email = self._prepare(msg, mutate_ok=mutate_ok)
+            prepared.append((final_msg, from_email, rcpts))
+        if not prepared:
+            return []
+
+        results: List[Any] = [None] * len(prepared)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(len(prepared)):
+            queue.put_nowait(i)
+
+        async def worker() -> None:
+            server: Optional[aiosmtplib.SMTP] = None
+
+            async def get_server() -> aiosmtplib.SMTP:
+                nonlocal server
+                if server is None or not server.is_connected:
+                    server = await self._open_new_server()
+                return server
+
+            async def reset() -> None:
+                nonlocal server
+                if server is not None:
+                    await self._quit_quietly(server)
+                server = None
+
+            try:
+                while not queue.empty():
+                    i = queue.get_nowait()
+                    results[i] = await self._send_on(get_server, reset, *prepared[i])
+            finally:
+                await reset()
+
+        n_workers = max(1, min(concurrency, len(prepared)))
+        await asyncio.gather(*(worker() for _ in range(n_workers)))
+        return results
+
+    async def close(self) -> None:
+        await self._reset_server()
+
+    async def __aenter__(self) -> AsyncSMTPClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
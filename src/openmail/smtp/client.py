@@ -4,53 +4,178 @@ import copy
 import smtplib
 import ssl
 import threading
-from dataclasses import dataclass, field
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from email.message import EmailMessage as PyEmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from email.policy import SMTPUTF8 as SMTPUTF8_POLICY
 from email.utils import parseaddr
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence
 
 from openmail import SMTPConfig
 from openmail.auth import AuthContext
 from openmail.errors import AuthError, ConfigError, SMTPError
+from openmail.logger import get_logger
+from openmail.smtp.pipelining import PipelinedSMTP, PipelinedSMTP_SSL
+from openmail.smtp.pool import SMTPConnectionPool
 from openmail.types import SendResult
 
+logger = get_logger()
+
+IMPLICIT_TLS_PORT = 465
+
+
+@lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Shared client context: building one parses the whole CA store, and a
+    context is safe to reuse across sockets and threads.
+    """
+    return ssl.create_default_context()
+
+
+# Per-message rejections in send_many(); the connection itself is fine.
+_MESSAGE_REJECTED = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+
+def validated_config(config: SMTPConfig) -> SMTPConfig:
+    """
+    Check config and normalise it (STARTTLS on 465 becomes implicit TLS).
+    Shared by the sync and async clients.
+    """
+    if not config.host:
+        raise ConfigError("SMTP host required")
+    if config.use_ssl and config.use_starttls:
+        raise ConfigError("Choose use_ssl or use_starttls (not both)")
+    if config.use_starttls and config.port == IMPLICIT_TLS_PORT:
+        # 465 speaks TLS from the first byte; STARTTLS there cannot work.
+        logger.warning("SMTP port 465 is implicit TLS; using use_ssl instead of STARTTLS")
+        config = replace(config, use_starttls=False, use_ssl=True)
+    return config
+
+
+def _flatten(
+    msg: PyEmailMessage, from_email: str, recipients: Sequence[str]
+) -> tuple[bytes, tuple[str, ...]]:
+    """
+    (wire bytes, MAIL options) for msg, as send_message() would produce them:
+    Bcc/Resent-Bcc are left out and SMTPUTF8 is requested when an envelope
+    address is not ASCII. Rendering once up front lets retries and repeated
+    transactions hand the same bytes to sendmail().
+    """
+    if "Bcc" in msg or "Resent-Bcc" in msg:
+        # never transmit Bcc; copy.copy is enough because deleting a header
+        # rebinds the header list.
+        msg = copy.copy(msg)
+        del msg["Bcc"]
+        del msg["Resent-Bcc"]
+
+    if all(a.isascii() for a in (from_email, *recipients)):
+        return msg.as_bytes(policy=SMTP_POLICY), ()
+    return msg.as_bytes(policy=SMTPUTF8_POLICY), ("SMTPUTF8", "BODY=8BITMIME")
+
+
+class _SMTPBase:
+    """Sender/header handling shared by SMTPClient and AsyncSMTPClient."""
+
+    config: SMTPConfig
+
+    def _from_email(self) -> str:
+        if self.config.from_email:
+            return self.config.from_email
+        raise ConfigError("No from_email set")
+
+    def _prepare(
+        self, msg: PyEmailMessage, *, mutate_ok: bool = False
+    ) -> tuple[PyEmailMessage, str]:
+        """
+        (message to send, envelope sender). The From header wins; without one,
+        config.from_email is used and injected into the message: in place when
+        mutate_ok, otherwise into a deep copy so the caller's object is untouched.
+        """
+        hdr_from = msg.get("From")
+        if hdr_from:
+            _, from_email = parseaddr(hdr_from)
+            if not from_email:
+                from_email = self._from_email()
+            return msg, from_email
+
+        from_email = self._from_email()
+        # keep the message self-consistent for debugging/logging
+        if not mutate_ok:
+            msg = copy.deepcopy(msg)
+        msg["From"] = from_email
+        return msg, from_email
+
 
 @dataclass
-class SMTPClient:
+class SMTPClient(_SMTPBase):
     config: SMTPConfig
     _server: smtplib.SMTP | None = field(default=None, init=False, repr=False)
     _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
     _sent_since_connect: int = field(default=0, init=False, repr=False)
+    _pool: SMTPConnectionPool | None = field(default=None, init=False, repr=False)
+    # prefer_implicit_tls probe result: None until the first connect
+    _implicit_tls_ok: bool | None = field(default=None, init=False, repr=False)
+
+    # monotonic time of the last successful ping; see ping_interval
+    _last_ping_ok: float = field(default=float("-inf"), init=False, repr=False)
 
     max_messages_per_connection: int = 100
+    # >0: ping() reuses a success at most this many seconds old instead of a NOOP
+    ping_interval: float = 0.0
 
     @classmethod
     def from_config(cls, config: SMTPConfig) -> SMTPClient:
-        if not config.host:
-            raise ConfigError("SMTP host required")
-        if config.use_ssl and config.use_starttls:
-            raise ConfigError("Choose use_ssl or use_starttls (not both)")
-        return cls(config)
+        return cls(validated_config(config))
 
-    def _from_email(self) -> str:
-        if self.config.from_email:
-            return self.config.from_email
-        raise ConfigError("No from_email set")
+    def _open_transport(self) -> smtplib.SMTP:
+        """
+        Connected, TLS-protected (unless configured otherwise) and EHLO'd server.
+
+        Implicit TLS starts the handshake immediately; STARTTLS first costs an
+        EHLO + STARTTLS round trip in clear text. With prefer_implicit_tls a
+        STARTTLS config tries port 465 first and remembers the outcome.
+        """
+        cfg = self.config
+        if cfg.use_ssl:
+            return self._open_implicit_tls(cfg.port)
+
+        if cfg.use_starttls and cfg.prefer_implicit_tls and self._implicit_tls_ok is not False:
+            try:
+                server = self._open_implicit_tls(IMPLICIT_TLS_PORT)
+            except (smtplib.SMTPException, OSError):
+                # Never worked: stop probing. Worked before: just fall back.
+                if self._implicit_tls_ok is None:
+                    self._implicit_tls_ok = False
+            else:
+                self._implicit_tls_ok = True
+                return server
+
+        server = PipelinedSMTP(cfg.host, cfg.port, timeout=cfg.timeout)
+        if cfg.use_starttls:
+            # starttls() sends the initial EHLO itself; only the post-TLS one
+            # (RFC 3207) is ours.
+            server.starttls(context=_ssl_context())
+        server.ehlo()
+        return server
+
+    def _open_implicit_tls(self, port: int) -> smtplib.SMTP:
+        cfg = self.config
+        server = PipelinedSMTP_SSL(cfg.host, port, timeout=cfg.timeout, context=_ssl_context())
+        server.ehlo()
+        return server
 
     def _open_new_server(self) -> smtplib.SMTP:
         cfg = self.config
         try:
-            if cfg.use_ssl:
-                ctx = ssl.create_default_context()
-                server = smtplib.SMTP_SSL(cfg.host, cfg.port, timeout=cfg.timeout, context=ctx)
-                server.ehlo()
-            else:
-                server = smtplib.SMTP(cfg.host, cfg.port, timeout=cfg.timeout)
-                server.ehlo()
-                if cfg.use_starttls:
-                    ctx = ssl.create_default_context()
-                    server.starttls(context=ctx)
-                    server.ehlo()
+            server = self._open_transport()
 
             if cfg.auth is None:
                 raise ConfigError("SMTPConfig.auth is required (PasswordAuth or OAuth2Auth)")
@@ -92,14 +217,30 @@ class SMTPClient:
         self._server = None
         self._sent_since_connect = 0
 
+    def _get_pool(self) -> SMTPConnectionPool | None:
+        if self.config.pool_size <= 1:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = SMTPConnectionPool(
+                    self._open_new_server,
+                    max_connections=self.config.pool_size,
+                    max_messages_per_connection=self.max_messages_per_connection,
+                )
+            return self._pool
+
     def _run_with_server(self, op):
         """
         Run an operation with a server, handling:
-        - thread-safety (RLock)
+        - thread-safety (RLock, or one pooled connection per caller)
         - reconnect-on-disconnect (retry once)
 
         `op` is a callable taking a single `smtplib.SMTP` argument.
         """
+        pool = self._get_pool()
+        if pool is not None:
+            return self._run_pooled(pool, op)
+
         last_exc: BaseException | None = None
 
         for _ in range(2):
@@ -122,40 +263,102 @@ class SMTPClient:
         # If we get here, we had repeated disconnects
         raise SMTPError(f"SMTP connection repeatedly disconnected: {last_exc}") from last_exc
 
+    def _run_pooled(self, pool: SMTPConnectionPool, op):
+        last_exc: BaseException | None = None
+
+        for _ in range(2):
+            try:
+                with pool.acquire() as server:
+                    return op(server)
+            except smtplib.SMTPServerDisconnected as e:
+                # The pool dropped that connection; the retry gets another.
+                last_exc = e
+            except AuthError:
+                raise
+            except smtplib.SMTPException as e:
+                raise SMTPError(f"SMTP operation failed: {e}") from e
+
+        raise SMTPError(f"SMTP connection repeatedly disconnected: {last_exc}") from last_exc
+
     def _send_with_known_server(
         self, server: smtplib.SMTP, msg: PyEmailMessage, from_email: str, recipients: list[str]
+    ) -> SendResult:
+        raw, mail_options = _flatten(msg, from_email, recipients)
+        return self._sendmail(server, raw, mail_options, from_email, recipients, msg["Message-ID"])
+
+    def _sendmail(
+        self,
+        server: smtplib.SMTP,
+        raw: bytes,
+        mail_options: Sequence[str],
+        from_email: str,
+        recipients: list[str],
+        message_id: object,
     ) -> SendResult:
         try:
-            server.send_message(msg, from_addr=from_email, to_addrs=recipients)
+            server.sendmail(from_email, recipients, raw, mail_options)
         except smtplib.SMTPAuthenticationError as e:
             raise AuthError(f"SMTP auth failed during send: {e}") from e
 
         self._sent_since_connect += 1
-        return SendResult(ok=True, message_id=str(msg["Message-ID"]))
+        return SendResult(ok=True, message_id=str(message_id))
+
+    @contextmanager
+    def session(self) -> Iterator[smtplib.SMTP]:
+        """
+        Hold the client's persistent connection for a series of raw commands
+        (with pool_size > 1, a pooled connection instead).
 
-    def send(self, msg: PyEmailMessage, recipients: List[str]) -> SendResult:
+        The lock is held for the whole block, so other threads' sends wait. A
+        dropped connection is discarded so the next use reconnects; the
+        connection otherwise stays open for later sends (see close()).
+        """
+        pool = self._get_pool()
+        if pool is not None:
+            with pool.acquire() as server:
+                yield server
+            return
+
+        with self._lock:
+            server = self._get_server()
+            try:
+                yield server
+            except smtplib.SMTPServerDisconnected:
+                self._reset_server()
+                raise
+
+    def send(
+        self, msg: PyEmailMessage, recipients: List[str], *, mutate_ok: bool = False
+    ) -> SendResult:
+        """
+        Send msg to recipients. Pass mutate_ok=True when msg was built just for
+        this send, so a missing From is filled in without copying the message.
+        """
         if not recipients:
             raise ConfigError("send(): recipients list is empty")
 
-        hdr_from = msg.get("From")
-        if hdr_from:
-            _, from_email = parseaddr(hdr_from)
-            if not from_email:
-                from_email = self._from_email()
-        else:
-            from_email = self._from_email()
-            # keep the message self-consistent for debugging/logging
-            msg = copy.deepcopy(msg)
-            msg["From"] = from_email
+        msg, from_email = self._prepare(msg, mutate_ok=mutate_ok)
+        raw, mail_options = _flatten(msg, from_email, recipients)
+        message_id = msg["Message-ID"]
 
         def _impl(server: smtplib.SMTP) -> SendResult:
-            return self._send_with_known_server(server, msg, from_email, recipients)
+            return self._sendmail(server, raw, mail_options, from_email, recipients, message_id)
 
         return self._run_with_server(_impl)
 
-    def send_many(self, batch: Iterable[tuple[PyEmailMessage, Iterable[str]]]) -> list[SendResult]:
+    def send_many(
+        self,
+        batch: Iterable[tuple[PyEmailMessage, Iterable[str]]],
+        *,
+        mutate_ok: bool = False,
+    ) -> list[SendResult]:
         """
-        Send multiple messages in a single (or minimal) SMTP session.
+        Send multiple messages over the one persistent SMTP session.
+
+        A message the server rejects (sender/recipients refused, DATA error)
+        gets SendResult(ok=False, detail=...) and the batch carries on; a
+        dropped connection is reopened once and sending resumes where it
+        stopped. Auth failures still raise.
         """
         prepared: list[tuple[PyEmailMessage, str, list[str]]] = []
 
@@ -164,51 +367,114 @@ class SMTPClient:
             if not rcpts:
                 raise ConfigError("send_many(): one of the messages has no recipients")
 
-            hdr_from = msg.get("From")
-            if hdr_from:
-                _, from_email = parseaddr(hdr_from)
-                if not from_email:
-                    from_email = self._from_email()
-                final_msg = msg
-            else:
-                from_email = self._from_email()
-                final_msg = copy.deepcopy(msg)
-                final_msg["From"] = from_email
-
+            final_msg, from_email = self._prepare(msg, mutate_ok=mutate_ok)
             prepared.append((final_msg, from_email, rcpts))
 
+        pool = self._get_pool()
+        if pool is not None:
+            # One pooled connection per message, so the per-connection cap
+            # holds mid-batch and concurrent callers share the pool.
+            return [
+                self._run_pooled(pool, lambda server, p=p: self._send_or_reject(server, *p))
+                for p in prepared
+            ]
+
         results: list[SendResult] = []
         i = 0
 
         def _impl(server: smtplib.SMTP) -> list[SendResult]:
-            nonlocal i, results
+            nonlocal i
             while i < len(prepared):
-                msg, from_email, recipients = prepared[i]
-                res = self._send_with_known_server(server, msg, from_email, recipients)
-                results.append(res)
+                results.append(self._send_or_reject(server, *prepared[i]))
                 i += 1
             return results
 
         return self._run_with_server(_impl)
 
-    def ping(self) -> None:
+    def _send_or_reject(
+        self, server: smtplib.SMTP, msg: PyEmailMessage, from_email: str, recipients: list[str]
+    ) -> SendResult:
+        try:
+            return self._send_with_known_server(server, msg, from_email, recipients)
+        except _MESSAGE_REJECTED as e:
+            # The session is still usable; reset the envelope and move on.
+            try:
+                server.rset()
+            except smtplib.SMTPException:
+                pass
+            return SendResult(ok=False, message_id=str(msg["Message-ID"]), detail=f"{e}")
+
+    def send_broadcast(
+        self,
+        msg: PyEmailMessage,
+        recipients: Sequence[str],
+        *,
+        chunk: int = 100,
+    ) -> list[SendResult]:
         """
-        Minimal SMTP health check.
+        Send one message to many recipients, chunk recipients per transaction.
+
+        The message is serialised once and the same bytes are handed to
+        sendmail() for every chunk (send_message would re-flatten it each
+        time). Returns one SendResult per chunk; a chunk the server rejects
+        is reported as ok=False and the rest still go out.
         """
+        if not recipients:
+            raise ConfigError("send_broadcast(): recipients list is empty")
+        if chunk < 1:
+            raise ConfigError("send_broadcast(): chunk must be >= 1")
+
+        msg, from_email = self._prepare(msg)
+        raw, mail_options = _flatten(msg, from_email, recipients)
+        message_id = str(msg["Message-ID"])
 
-        def _impl(server: smtplib.SMTP) -> None:
+        def _send_chunk(server: smtplib.SMTP, rcpts: Sequence[str]) -> SendResult:
             try:
-                code, reply = server.noop()
+                refused = server.sendmail(from_email, list(rcpts), raw, mail_options)
             except smtplib.SMTPAuthenticationError as e:
-                raise AuthError(f"SMTP auth failed during ping: {e}") from e
-            if code != 250:
-                raise SMTPError(f"SMTP NOOP failed: {code} {reply!r}")
+                raise AuthError(f"SMTP auth failed during send: {e}") from e
+            except _MESSAGE_REJECTED as e:
+                try:
+                    server.rset()
+                except smtplib.SMTPException:
+                    pass
+                return SendResult(ok=False, message_id=message_id, detail=f"{e}")
+            self._sent_since_connect += 1
+            detail = f"refused: {sorted(refused)}" if refused else None
+            return SendResult(ok=True, message_id=message_id, detail=detail)
+
+        return [
+            self._run_with_server(
+                lambda server, r=recipients[i : i + chunk]: _send_chunk(server, r)
+            )
+            for i in range(0, len(recipients), chunk)
+        ]
+
+    def _noop(self, server: smtplib.SMTP) -> None:
+        try:
+            code, reply = server.noop()
+        except smtplib.SMTPAuthenticationError as e:
+            raise AuthError(f"SMTP auth failed during ping: {e}") from e
+        if code != 250:
+            raise SMTPError(f"SMTP NOOP failed: {code} {reply!r}")
 
-        self._run_with_server(_impl)
+    def ping(self) -> None:
+        """
+        Minimal SMTP health check: NOOP on an authenticated connection.
+
+        With ping_interval > 0, a success within that many seconds is
+        reused without any I/O.
+        """
+        if self.ping_interval > 0 and time.monotonic() - self._last_ping_ok < self.ping_interval:
+            return
+        self._run_with_server(self._noop)
+        self._last_ping_ok = time.monotonic()
 
     def close(self) -> None:
         with self._lock:
             self._reset_server()
+            if self._pool is not None:
+                self._pool.close()
 
     def __enter__(self) -> SMTPClient:
         # lazy connect;
@@ -0,0 +1,137 @@
+# openmail/smtp/pool.py
+from __future__ import annotations
+
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+
+@dataclass
+class _PooledConn:
+    server: smtplib.SMTP
+    sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def _quit_quietly(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        pass
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP connections.
+
+    At most max_connections are open at once; acquire() blocks when all are
+    in use. Idle connections are kept LIFO so the hottest one is reused and
+    the rest age out. A connection is retired after max_messages_per_connection
+    uses (providers cap messages per session), and one idle for longer than
+    idle_ttl is NOOP-checked before being handed out. Connections idle for
+    longer than max_idle are closed without a NOOP (servers drop idle
+    sessions after a few minutes anyway); they are reaped from the cold end
+    of the stack whenever a connection is returned.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP],
+        *,
+        max_connections: int = 4,
+        max_messages_per_connection: int = 100,
+        idle_ttl: float = 30.0,
+        max_idle: float = 100.0,
+    ) -> None:
+        self._connect = connect
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_ttl = idle_ttl
+        self.max_idle = max_idle
+        self._idle: queue.LifoQueue[_PooledConn] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def _is_alive(self, conn: _PooledConn) -> bool:
+        if getattr(conn.server, "sock", True) is None:
+            return False
+        idle = time.monotonic() - conn.last_used
+        if idle < self.idle_ttl:
+            return True
+        if idle >= self.max_idle:
+            return False
+        try:
+            code, _ = conn.server.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _checkout(self) -> _PooledConn:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledConn(self._connect())
+            if self._is_alive(conn):
+                return conn
+            _quit_quietly(conn.server)
+
+    def _checkin(self, conn: _PooledConn) -> None:
+        conn.sent += 1
+        conn.last_used = time.monotonic()
+        if conn.sent >= self.max_messages_per_connection:
+            _quit_quietly(conn.server)
+        else:
+            self._idle.put(conn)
+        self._reap(conn.last_used)
+
+    def _reap(self, now: float) -> None:
+        # LIFO: the least recently used connections sit at the bottom.
+        stale = []
+        with self._idle.mutex:
+            idle = self._idle.queue
+            while idle and now - idle[0].last_used >= self.max_idle:
+                stale.append(idle.pop(0))
+        for conn in stale:
+            _quit_quietly(conn.server)
+
+    @contextmanager
+    def acquire(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection for one use (normally one message). A connection
+        that drops or hits a socket error is discarded instead of returned.
+        """
+        self._slots.acquire()
+        try:
+            conn = self._checkout()
+            try:
+                yield conn.server
+            except smtplib.SMTPServerDisconnected:
+                _quit_quietly(conn.server)
+                raise
+            except smtplib.SMTPException:
+                # a command was refused; the session itself is still usable
+                self._checkin(conn)
+                raise
+            except BaseException:
+                # socket errors or anything unexpected: state unknown
+                _quit_quietly(conn.server)
+                raise
+            else:
+                self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    def idle_count(self) -> int:
+        return self._idle.qsize()
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _quit_quietly(conn.server)
@@ -0,0 +1,127 @@
+# openmail/smtp/queued.py
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from email.message import EmailMessage as PyEmailMessage
+from typing import Iterable, List, Tuple
+
+from openmail.errors import ConfigError, SMTPError
+from openmail.logger import get_logger
+from openmail.smtp.client import SMTPClient
+from openmail.types import SendResult
+
+logger = get_logger()
+
+_Item = Tuple[PyEmailMessage, List[str], "Future[SendResult]"]
+_STOP = object()
+
+
+class QueuedSMTPSender(threading.Thread):
+    """
+    Background sender: submit() queues a message and returns at once, and a
+    worker thread sends queued messages in batches of up to max_batch with
+    client.send_many(), so bursts share one connection (connect + AUTH once)
+    and flattening/transmitting happens off the caller's thread.
+
+    The worker waits up to batch_window_ms for the first message of a batch,
+    then takes whatever else is already queued. Each Future resolves to that
+    message's SendResult (ok=False when the server rejected it); if the batch
+    fails outright (auth, connection), every Future in it gets the exception.
+    send_many() already reconnects on a dropped connection and resumes with
+    the messages not yet sent.
+    """
+
+    def __init__(
+        self,
+        client: SMTPClient,
+        *,
+        max_batch: int = 100,
+        batch_window_ms: int = 1000,
+        mutate_ok: bool = False,
+    ) -> None:
+        if max_batch < 1:
+            raise ConfigError("QueuedSMTPSender: max_batch must be >= 1")
+        super().__init__(name="openmail-smtp-queue", daemon=True)
+        self.client = client
+        self.max_batch = max_batch
+        self.batch_window_ms = batch_window_ms
+        self.mutate_ok = mutate_ok
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._submit_lock = threading.Lock()
+
+    def submit(self, msg: PyEmailMessage, recipients: Iterable[str]) -> Future[SendResult]:
+        rcpts = list(recipients)
+        if not rcpts:
+            raise ConfigError("submit(): recipients list is empty")
+
+        fut: Future[SendResult] = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise SMTPError("QueuedSMTPSender is closed")
+            if not self.is_alive():
+                self.start()
+            self._queue.put((msg, rcpts, fut))
+        return fut
+
+    def _next_batch(self) -> Tuple[List[_Item], bool]:
+        """Collect one batch; the bool is True once the stop marker was seen."""
+        try:
+            first = self._queue.get(timeout=self.batch_window_ms / 1000)
+        except queue.Empty:
+            return [], False
+        if first is _STOP:
+            return [], True
+
+        batch: List[_Item] = [first]
+        while len(batch) < self.max_batch:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush(self, batch: List[_Item]) -> None:
+        live = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not live:
+            return
+        try:
+            results = self.client.send_many(
+                ((msg, rcpts) for msg, rcpts, _ in live), mutate_ok=self.mutate_ok
+            )
+        except BaseException as e:
+            logger.warning("Queued SMTP batch of %d failed: %s", len(live), e)
+            for _, _, fut in live:
+                fut.set_exception(e)
+            return
+        for (_, _, fut), result in zip(live, results):
+            fut.set_result(result)
+
+    def run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop accepting messages, send what is queued, then stop the worker."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            started = self.is_alive()
+            self._queue.put(_STOP)
+        if started:
+            self.join(timeout)
+
+    def __enter__(self) -> QueuedSMTPSender:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Mapping, Optional
 
 from openmail.imap import IMAPClient, IMAPQuery
 from openmail.models import UnsubscribeCandidate
@@ -18,20 +18,29 @@ class SubscriptionDetector:
         limit: int = 200,
         since: Optional[str] = None,
         unseen_only: bool = False,
+        parallelism: int = 1,
     ) -> List[UnsubscribeCandidate]:
+        """
+        parallelism > 1 splits the header fetch across that many connections,
+        which pays off for large pages on high-latency servers.
+        """
         q = IMAPQuery()
         if unseen_only:
             q.unseen()
         if since:
             q.since(since)
+        # Let the server drop messages without the header; only headers are fetched.
+        q.header("List-Unsubscribe", "")
 
         page = self.imap.search_page_cached(mailbox=mailbox, query=q, page_size=limit)
-        msgs = self.imap.fetch(page.refs)
+        if parallelism > 1:
+            overviews = self.imap.fetch_overview_parallel(page.refs, parallelism=parallelism)
+        else:
+            overviews = self.imap.fetch_overview(page.refs)
 
         out: List[UnsubscribeCandidate] = []
-        for ref, msg in zip(page.refs, msgs):
-            headers = msg.headers
-            lu = _get_header(headers, "List-Unsubscribe")
+        for ov in overviews:
+            lu = _get_header(ov.headers, "List-Unsubscribe")
             if not lu:
                 continue
 
@@ -41,18 +50,23 @@ class SubscriptionDetector:
 
             out.append(
                 UnsubscribeCandidate(
-                    ref=ref,
-                    from_email=msg.from_email,
-                    subject=msg.subject,
+                    ref=ov.ref,
+                    from_email=ov.from_email,
+                    subject=ov.subject,
                     methods=methods,
                 )
             )
         return out
 
 
-def _get_header(headers: dict, name: str) -> str:
+def _get_header(headers: Mapping[str, str], name: str) -> str:
+    # Headers are nearly always stored under their canonical spelling; only
+    # otherwise scan, over names only so LazyHeaders decodes a single value.
+    value = headers.get(name)
+    if value is not None:
+        return value
     name = name.lower()
-    for k, v in headers.items():
+    for k in headers:
         if k.lower() == name:
-            return v
+            return headers[k]
     return ""
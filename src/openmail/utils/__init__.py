@@ -3,6 +3,7 @@ from openmail.utils.utils import (
     build_email_context,
     build_references,
     dedup_addrs,
+    dedup_envelope,
     ensure_forward_subject,
     ensure_reply_subject,
     get_header,
@@ -24,6 +25,7 @@ __all__ = [
     "ensure_reply_subject",
     "parse_addrs",
     "dedup_addrs",
+    "dedup_envelope",
     "remove_addr",
     "get_header",
     "build_references",
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import socket
+
+
+def tune_socket(sock: socket.socket) -> None:
+    """
+    Socket options for request/response mail protocols.
+
+    TCP_NODELAY: commands are small writes that wait for a reply (and
+    pipelined batches are written in one go), so Nagle's algorithm only adds
+    latency, notably around IMAP literals and SMTP DATA terminators.
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):  # not TCP (e.g. a test double)
+        pass
@@ -1,11 +1,14 @@
 import html as _html
 import re
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 from email.utils import formataddr, getaddresses, parsedate_to_datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
 
 from openmail.models import EmailMessage
 
+_T = TypeVar("_T")
+
 
 def iso_days_ago(days: int) -> str:
     return (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
@@ -32,24 +35,44 @@ def ensure_reply_subject(subj: Optional[str]) -> str:
     return f"Re: {subj}"
 
 
+@lru_cache(maxsize=2048)
+def _getaddresses_cached(value: str) -> Tuple[Tuple[str, str], ...]:
+    return tuple(getaddresses([value]))
+
+
 def parse_addrs(*values: Optional[str]) -> List[tuple[str, str]]:
+    # Replies and forwards re-parse the same From/To/Cc headers on every
+    # action; getaddresses is costly, so results are memoised per value.
     out: List[tuple[str, str]] = []
     for v in values:
         if v:
-            out.extend(getaddresses([v]))
+            out.extend(_getaddresses_cached(v))
     return out
 
 
+def _first_per_addr(addrs: Sequence[str], items: Sequence[_T]) -> List[_T]:
+    """
+    items (parallel to addrs), deduplicated by case-insensitive address in
+    first-seen order; entries with an empty address are dropped.
+    """
+    norms = [a.strip().lower() for a in addrs]
+    # Built back to front, so each key ends up holding its first item.
+    first = dict(zip(reversed(norms), reversed(items)))
+    first.pop("", None)
+    return [first[k] for k in dict.fromkeys(norms) if k]
+
+
 def dedup_addrs(pairs: List[tuple[str, str]]) -> List[str]:
-    seen: set[str] = set()
-    result: List[str] = []
-    for name, addr in pairs:
-        addr_norm = addr.strip().lower()
-        if not addr_norm or addr_norm in seen:
-            continue
-        seen.add(addr_norm)
-        result.append(formataddr((name, addr)) if name else addr)
-    return result
+    return [
+        formataddr((name, addr)) if name else addr
+        for name, addr in _first_per_addr([a for _, a in pairs], pairs)
+    ]
+
+
+def dedup_envelope(pairs: List[tuple[str, str]]) -> List[str]:
+    """Bare addresses from (name, addr) pairs, deduplicated case-insensitively."""
+    addrs = [a for _, a in pairs]
+    return _first_per_addr(addrs, addrs)
 
 
 def remove_addr(pairs: List[tuple[str, str]], remove: Optional[str]) -> List[tuple[str, str]]:
@@ -257,39 +280,73 @@ def looks_binary(text: str) -> bool:
     return (control_chars / len(text)) > 0.3
 
 
+_MONTHS = {
+    m: i
+    for i, m in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+
+
+@lru_cache(maxsize=64)
+def _fixed_offset(zone: str) -> tzinfo:
+    """+hhmm / -hhmm -> tzinfo; a mailbox only ever uses a handful of offsets."""
+    minutes = int(zone[1:3]) * 60 + int(zone[3:5])
+    return timezone(timedelta(minutes=-minutes if zone[0] == "-" else minutes))
+
+
+# The usual shape of a Date header: "[Tue, ]17 Jul 1996 02:44:25 -0700[ (PDT)]".
+_DATE_RE = re.compile(
+    r"\s*(?:[A-Za-z]{3},\s*)?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) "
+    r"(\d{2}):(\d{2})(?::(\d{2}))? ([+-]\d{4})(?:\s*\([^)]*\))?\s*$"
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _parse_date_utc(raw: str | None) -> datetime | None:
+    if not raw:
+        return None
+    m = _DATE_RE.match(raw)
+    if m is not None:
+        mon = _MONTHS.get(m.group(2).title())
+        if mon is not None:
+            day, _, year, hh, mm, ss, zone = m.groups()
+            try:
+                return datetime(
+                    int(year),
+                    mon,
+                    int(day),
+                    int(hh),
+                    int(mm),
+                    int(ss or 0),
+                    tzinfo=_fixed_offset(zone),
+                ).astimezone(timezone.utc)
+            except ValueError:
+                pass  # e.g. a leap second; let the email package decide
+    try:
+        dt = parsedate_to_datetime(raw)
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            dt = dt.astimezone(timezone.utc)
+        return dt
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
 def best_effort_date(date_header: str | None, internaldate_raw: str | None) -> datetime | None:
     """
     Pick the best possible date for an email, trying:
     1. Header Date
     2. IMAP INTERNALDATE
     """
-
-    def _parse_one(raw: str | None) -> datetime | None:
-        if not raw:
-            return None
-        try:
-            dt = parsedate_to_datetime(raw)
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            else:
-                dt = dt.astimezone(timezone.utc)
-            return dt
-        except (TypeError, ValueError, OverflowError):
-            return None
-
-    header_dt = _parse_one(date_header)
-    internal_dt = _parse_one(internaldate_raw)
+    header_dt = _parse_date_utc(date_header)
 
     # Prefer header date if it looks sane
     if header_dt is not None:
-        earliest = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        latest = datetime.now(timezone.utc) + timedelta(days=1)
-        if earliest <= header_dt <= latest:
+        if _EPOCH <= header_dt <= datetime.now(timezone.utc) + timedelta(days=1):
             return header_dt
 
-    if internal_dt is not None:
-        return internal_dt
-
-    return None
+    return _parse_date_utc(internaldate_raw)
@@ -3,13 +3,14 @@ from __future__ import annotations
 from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from email.message import EmailMessage as PyEmailMessage
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from openmail.errors import IMAPError
 from openmail.imap.pagination import PagedSearchResult
 from openmail.imap.parser import parse_overview, parse_rfc822
 from openmail.imap.query import IMAPQuery
 from openmail.models import EmailMessage, EmailOverview
+from openmail.smtp.builder import build_mime_message
 from openmail.types import EmailRef
 
 
@@ -17,6 +18,66 @@ from openmail.types import EmailRef
 class _StoredMessage:
     msg: EmailMessage
     flags: Set[str]
+    # lower-cased header name -> value, built on first search (headers never change)
+    _hdr_lc: Optional[Dict[str, str]] = field(default=None, repr=False)
+
+    def headers_lc(self) -> Dict[str, str]:
+        if self._hdr_lc is None:
+            self._hdr_lc = {k.lower(): v for k, v in self.msg.headers.items()}
+        return self._hdr_lc
+
+
+# SEARCH key -> (flag, whether it must be set)
+_FLAG_KEYS: Dict[str, Tuple[str, bool]] = {
+    "SEEN": (r"\Seen", True),
+    "UNSEEN": (r"\Seen", False),
+    "DELETED": (r"\Deleted", True),
+    "UNDELETED": (r"\Deleted", False),
+    "DRAFT": (r"\Draft", True),
+    "UNDRAFT": (r"\Draft", False),
+    "FLAGGED": (r"\Flagged", True),
+    "UNFLAGGED": (r"\Flagged", False),
+}
+
+
+@dataclass(frozen=True)
+class _SearchPreds:
+    """
+    IMAPQuery.parts parsed once per search, so matching each stored message
+    is a couple of set operations.
+    """
+
+    required: FrozenSet[str]
+    forbidden: FrozenSet[str]
+    # (lower-cased header name, lower-cased substring); "" means present
+    headers: Tuple[Tuple[str, str], ...]
+
+
+def _compile_query(parts: Sequence[str]) -> _SearchPreds:
+    """
+    Very small subset of IMAP SEARCH semantics:
+
+    - UNSEEN / SEEN
+    - DELETED / UNDELETED
+    - DRAFT / UNDRAFT
+    - FLAGGED / UNFLAGGED
+    - HEADER "List-Unsubscribe" "<value>" (header present / contains value)
+
+    Everything else is ignored (accept).
+    """
+    required: Set[str] = set()
+    forbidden: Set[str] = set()
+    headers: List[Tuple[str, str]] = []
+    for i, token in enumerate(parts):
+        flag_key = _FLAG_KEYS.get(token)
+        if flag_key is not None:
+            flag, must_be_set = flag_key
+            (required if must_be_set else forbidden).add(flag)
+        elif token == "HEADER" and i + 2 < len(parts):
+            name = parts[i + 1].strip('"').lower()
+            if name == "list-unsubscribe":
+                headers.append((name, parts[i + 2].strip('"').lower()))
+    return _SearchPreds(frozenset(required), frozenset(forbidden), tuple(headers))
 
 
 @dataclass
@@ -34,19 +95,44 @@ class FakeIMAPClient:
 
     # mailbox -> uid -> _StoredMessage
     _mailboxes: Dict[str, Dict[int, _StoredMessage]] = field(default_factory=dict)
+    # mailbox -> its UIDs in ascending order, kept in step with _mailboxes
+    _uids_sorted: Dict[str, List[int]] = field(default_factory=dict)
     _next_uid: int = 1
 
     # cache key: (mailbox, criteria_str) -> ascending UID list
     _search_cache: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+    # cache key -> its parsed criteria, so mutations update results in place
+    _search_preds: Dict[Tuple[str, str], _SearchPreds] = field(default_factory=dict)
 
     # If True, the next IMAP operation will raise IMAPError (for error paths).
     fail_next: bool = False
 
+    # Matches IMAPClient.fetch_batch_size: fetch() works through refs in chunks.
+    fetch_batch_size: int = 100
+
     # --- internal helpers -------------------------------------------------
 
     def _ensure_mailbox(self, name: str) -> Dict[int, _StoredMessage]:
+        self._uids_sorted.setdefault(name, [])
         return self._mailboxes.setdefault(name, {})
 
+    def _put(self, mailbox: str, uid: int, stored: _StoredMessage) -> None:
+        # uid comes fresh from _alloc_uid(), so it sorts last: a plain append,
+        # both here and in every cached search it matches.
+        self._ensure_mailbox(mailbox)[uid] = stored
+        self._uids_sorted[mailbox].append(uid)
+        for uids, preds in self._cached_searches(mailbox):
+            if self._matches_query(stored, preds):
+                uids.append(uid)
+
+    def _discard(self, mailbox: str, uid: int) -> Optional[_StoredMessage]:
+        stored = self._mailboxes.get(mailbox, {}).pop(uid, None)
+        if stored is not None:
+            uids = self._uids_sorted[mailbox]
+            del uids[bisect_left(uids, uid)]
+            self._uncache_uids(mailbox, (uid,))
+        return stored
+
     def _alloc_uid(self) -> int:
         uid = self._next_uid
         self._next_uid += 1
@@ -60,10 +146,48 @@ class FakeIMAPClient:
     def _invalidate_search_cache(self, mailbox: Optional[str] = None) -> None:
         if mailbox is None:
             self._search_cache.clear()
+            self._search_preds.clear()
             return
         keys = [k for k in self._search_cache.keys() if k[0] == mailbox]
         for k in keys:
             self._search_cache.pop(k, None)
+            self._search_preds.pop(k, None)
+
+    def _cached_searches(self, mailbox: str) -> List[Tuple[List[int], _SearchPreds]]:
+        return [
+            (uids, self._search_preds[k])
+            for k, uids in self._search_cache.items()
+            if k[0] == mailbox
+        ]
+
+    def _uncache_uids(self, mailbox: str, removed: Iterable[int]) -> None:
+        """Drop removed UIDs from the mailbox's cached searches."""
+        for uids, _ in self._cached_searches(mailbox):
+            for uid in removed:
+                i = bisect_left(uids, uid)
+                if i < len(uids) and uids[i] == uid:
+                    del uids[i]
+
+    def _recheck_cached(self, mailbox: str, refs: Sequence[EmailRef]) -> None:
+        """
+        Re-match messages whose flags changed, against only the cached
+        searches that test flags.
+        """
+        box = self._mailboxes.get(mailbox, {})
+        for uids, preds in self._cached_searches(mailbox):
+            if not preds.required and not preds.forbidden:
+                continue
+            for r in refs:
+                stored = box.get(r.uid)
+                if stored is None:
+                    continue
+                i = bisect_left(uids, r.uid)
+                cached = i < len(uids) and uids[i] == r.uid
+                if self._matches_query(stored, preds):
+                    if not cached:
+                        uids.insert(i, r.uid)
+                elif cached:
+                    del uids[i]
 
     def _assert_same_mailbox(self, refs: Sequence[EmailRef], op_name: str) -> str:
         if not refs:
@@ -110,13 +234,11 @@ class FakeIMAPClient:
         Seed a mailbox with an existing EmailMessage model. Returns the EmailRef used to store it.
         """
         self._maybe_fail()
-        box = self._ensure_mailbox(mailbox)
         uid = self._alloc_uid()
         ref = EmailRef(uid=uid, mailbox=mailbox)
 
         stored_msg = self._clone_message_with_ref(msg, ref)
-        box[uid] = _StoredMessage(stored_msg, set(flags or set()))
-        self._invalidate_search_cache(mailbox)
+        self._put(mailbox, uid, _StoredMessage(stored_msg, set(flags or set())))
         return ref
 
     # --- SEARCH + pagination (matches current IMAPClient surface) ---------
@@ -130,15 +252,16 @@ class FakeIMAPClient:
         cache_key = (mailbox, criteria)
 
         box = self._mailboxes.get(mailbox, {})
-        parts = query.parts
+        preds = _compile_query(query.parts)
 
         # Ascending old->new, like real client cache.
         uids: List[int] = []
-        for uid in sorted(box.keys()):
-            if self._matches_query(box[uid], parts):
+        for uid in self._uids_sorted.get(mailbox, ()):
+            if self._matches_query(box[uid], preds):
                 uids.append(uid)
 
         self._search_cache[cache_key] = uids
+        self._search_preds[cache_key] = preds
         return uids
 
     def search_page_cached(
@@ -222,55 +345,16 @@ class FakeIMAPClient:
         )
         return page.refs
 
-    def _matches_query(self, stored: _StoredMessage, parts: List[str]) -> bool:
-        """
-        Very small subset of IMAP SEARCH semantics:
-
-        - UNSEEN / SEEN
-        - DELETED / UNDELETED
-        - DRAFT / UNDRAFT
-        - FLAGGED / UNFLAGGED
-        - HEADER "List-Unsubscribe" "" (header present)
-
-        Everything else is ignored (accept).
-        """
+    def _matches_query(self, stored: _StoredMessage, preds: _SearchPreds) -> bool:
         flags = stored.flags
-        msg = stored.msg
-
-        # Flags-based filters
-        if "UNSEEN" in parts and r"\Seen" in flags:
-            return False
-        if "SEEN" in parts and r"\Seen" not in flags:
-            return False
-        if "DELETED" in parts and r"\Deleted" not in flags:
-            return False
-        if "UNDELETED" in parts and r"\Deleted" in flags:
+        if not preds.required <= flags or not preds.forbidden.isdisjoint(flags):
             return False
-        if "DRAFT" in parts and r"\Draft" not in flags:
-            return False
-        if "UNDRAFT" in parts and r"\Draft" in flags:
-            return False
-        if "FLAGGED" in parts and r"\Flagged" not in flags:
-            return False
-        if "UNFLAGGED" in parts and r"\Flagged" in flags:
-            return False
-
-        # Simple header presence check:
-        # IMAPQuery.header("List-Unsubscribe", "")
-        for i, token in enumerate(parts):
-            if token == "HEADER" and i + 2 < len(parts):
-                name_token = parts[i + 1].strip('"')
-                value_token = parts[i + 2].strip('"')
-                if name_token.lower() == "list-unsubscribe":
-                    has_header = any(k.lower() == "list-unsubscribe" for k in msg.headers.keys())
-                    if value_token == "":
-                        if not has_header:
-                            return False
-                    else:
-                        header_val = msg.headers.get("List-Unsubscribe", "")
-                        if value_token.lower() not in header_val.lower():
-                            return False
-
+        if preds.headers:
+            headers = stored.headers_lc()
+            for name, value in preds.headers:
+                header_val = headers.get(name)
+                if header_val is None or value not in header_val.lower():
+                    return False
         return True
 
     # --- FETCH full message ----------------------------------------------
@@ -286,6 +370,16 @@ class FakeIMAPClient:
             return []
 
         mailbox = self._assert_same_mailbox(refs, "fetch")
+        bs = self.fetch_batch_size
+        if 0 < bs < len(refs):
+            return [
+                m
+                for i in range(0, len(refs), bs)
+                for m in self.fetch(
+                    refs[i : i + bs], include_attachment_meta=include_attachment_meta
+                )
+            ]
+
         box = self._mailboxes.get(mailbox, {})
 
         out: List[EmailMessage] = []
@@ -319,6 +413,59 @@ class FakeIMAPClient:
 
     # --- FETCH overview ---------------------------------------------------
 
+    def search_pages_cached(
+        self,
+        searches: Sequence[Tuple[str, IMAPQuery, int]],
+        *,
+        refresh: bool = False,
+    ) -> List[PagedSearchResult]:
+        """
+        Matches IMAPClient.search_pages_cached, run sequentially.
+        """
+        return [
+            self.search_page_cached(
+                mailbox=mailbox, query=query, page_size=page_size, refresh=refresh
+            )
+            for mailbox, query, page_size in searches
+        ]
+
+    def fetch_overview_parallel(
+        self, refs: Sequence[EmailRef], *, parallelism: int
+    ) -> List[EmailOverview]:
+        """
+        Matches IMAPClient.fetch_overview_parallel, run as a single fetch.
+        """
+        return self.fetch_overview(refs)
+
+    def fetch_many(
+        self,
+        refs: Sequence[EmailRef],
+        *,
+        include_attachment_meta: bool = False,
+    ) -> List[EmailMessage]:
+        """
+        Matches IMAPClient.fetch_many: refs may span mailboxes, results keep ref order.
+        """
+        groups: Dict[str, List[EmailRef]] = {}
+        for r in refs:
+            groups.setdefault(r.mailbox, []).append(r)
+        by_ref = {
+            (m.ref.mailbox, m.ref.uid): m
+            for group in groups.values()
+            for m in self.fetch(group, include_attachment_meta=include_attachment_meta)
+        }
+        return [by_ref[k] for k in ((r.mailbox, r.uid) for r in refs) if k in by_ref]
+
+    def fetch_raw(self, ref: EmailRef) -> bytes:
+        """
+        Matches IMAPClient.fetch_raw: RFC822 source, rebuilt from the stored model.
+        """
+        self._maybe_fail()
+        stored = self._mailboxes.get(ref.mailbox, {}).get(ref.uid)
+        if stored is None:
+            raise IMAPError(f"FETCH raw: UID {ref.uid} not found in {ref.mailbox!r}")
+        return build_mime_message(stored.msg).as_bytes()
+
     def fetch_overview(self, refs: Sequence[EmailRef]) -> List[EmailOverview]:
         """
         Mirrors IMAPClient.fetch_overview() surface by returning EmailOverview.
@@ -411,6 +558,16 @@ class FakeIMAPClient:
 
         raise IMAPError(f"Attachment part not found: uid={ref.uid} part={attachment_part}")
 
+    def fetch_attachments(self, ref: EmailRef, parts: Sequence[str]) -> Dict[str, bytes]:
+        out: Dict[str, bytes] = {}
+        for part in parts:
+            try:
+                out[part] = self.fetch_attachment(ref, part)
+            except IMAPError:
+                if ref.uid not in self._mailboxes.get(ref.mailbox, {}):
+                    raise
+        return out
+
     # --- Mutations --------------------------------------------------------
 
     def append(
@@ -424,14 +581,30 @@ class FakeIMAPClient:
         Behaves similarly to IMAPClient.append(): parses RFC822 and stores with a new UID.
         """
         self._maybe_fail()
-        box = self._ensure_mailbox(mailbox)
         uid = self._alloc_uid()
         ref = EmailRef(uid=uid, mailbox=mailbox)
 
         raw = msg.as_bytes()
         parsed = parse_rfc822(ref, raw, include_attachments=True)
-        box[uid] = _StoredMessage(parsed, set(flags or set()))
-        self._invalidate_search_cache(mailbox)
+        self._put(mailbox, uid, _StoredMessage(parsed, set(flags or set())))
+        return ref
+
+    def append_raw(
+        self,
+        mailbox: str,
+        raw: bytes,
+        *,
+        flags: Optional[Set[str]] = None,
+    ) -> EmailRef:
+        """
+        Matches IMAPClient.append_raw: stores already serialised RFC822 bytes.
+        """
+        self._maybe_fail()
+        uid = self._alloc_uid()
+        ref = EmailRef(uid=uid, mailbox=mailbox)
+
+        parsed = parse_rfc822(ref, raw, include_attachments=True)
+        self._put(mailbox, uid, _StoredMessage(parsed, set(flags or set())))
         return ref
 
     def add_flags(self, refs: Sequence[EmailRef], *, flags: Set[str]) -> None:
@@ -444,7 +617,25 @@ class FakeIMAPClient:
             stored = box.get(r.uid)
             if stored:
                 stored.flags |= set(flags)
-        self._invalidate_search_cache(mailbox)
+        self._recheck_cached(mailbox, refs)
+
+    def add_flags_matching(
+        self,
+        *,
+        mailbox: str,
+        query: IMAPQuery,
+        flags: Set[str],
+        ranges_per_store: int = 500,
+        uids_per_store: Optional[int] = None,
+    ) -> int:
+        """
+        Matches IMAPClient.add_flags_matching: flag every match, return the match count.
+        """
+        uids = self.refresh_search_cache(mailbox=mailbox, query=query)
+        # add_flags() may update the cached list uids refers to
+        refs = [EmailRef(uid=u, mailbox=mailbox) for u in uids]
+        self.add_flags(refs, flags=flags)
+        return len(refs)
 
     def remove_flags(self, refs: Sequence[EmailRef], *, flags: Set[str]) -> None:
         self._maybe_fail()
@@ -456,7 +647,7 @@ class FakeIMAPClient:
             stored = box.get(r.uid)
             if stored:
                 stored.flags -= set(flags)
-        self._invalidate_search_cache(mailbox)
+        self._recheck_cached(mailbox, refs)
 
     # --- mailbox maintenance ---------------------------------------------
 
@@ -469,7 +660,9 @@ class FakeIMAPClient:
         to_delete = [uid for uid, s in box.items() if r"\Deleted" in s.flags]
         for uid in to_delete:
             del box[uid]
-        self._invalidate_search_cache(mailbox)
+        if to_delete:
+            self._uids_sorted[mailbox] = [u for u in self._uids_sorted[mailbox] if u in box]
+            self._uncache_uids(mailbox, to_delete)
 
     def list_mailboxes(self) -> List[str]:
         self._maybe_fail()
@@ -498,22 +691,18 @@ class FakeIMAPClient:
             if r.mailbox != src_mailbox:
                 raise IMAPError("All EmailRef.mailbox must match src_mailbox for move()")
 
-        src = self._mailboxes.get(src_mailbox, {})
-        dst = self._ensure_mailbox(dst_mailbox)
+        self._ensure_mailbox(dst_mailbox)
 
         # move: remove from src, create new UID+ref in dst, update message ref
         for r in refs:
-            stored = src.pop(r.uid, None)
+            stored = self._discard(src_mailbox, r.uid)
             if not stored:
                 continue
 
             new_uid = self._alloc_uid()
             new_ref = EmailRef(uid=new_uid, mailbox=dst_mailbox)
             new_msg = self._clone_message_with_ref(stored.msg, new_ref)
-            dst[new_uid] = _StoredMessage(new_msg, set(stored.flags))
-
-        self._invalidate_search_cache(src_mailbox)
-        self._invalidate_search_cache(dst_mailbox)
+            self._put(dst_mailbox, new_uid, _StoredMessage(new_msg, set(stored.flags)))
 
     def copy(
         self,
@@ -530,7 +719,7 @@ class FakeIMAPClient:
                 raise IMAPError("All EmailRef.mailbox must match src_mailbox for copy()")
 
         src = self._mailboxes.get(src_mailbox, {})
-        dst = self._ensure_mailbox(dst_mailbox)
+        self._ensure_mailbox(dst_mailbox)
 
         for r in refs:
             stored = src.get(r.uid)
@@ -540,19 +729,17 @@ class FakeIMAPClient:
             new_uid = self._alloc_uid()
             new_ref = EmailRef(uid=new_uid, mailbox=dst_mailbox)
             new_msg = self._clone_message_with_ref(stored.msg, new_ref)
-            dst[new_uid] = _StoredMessage(new_msg, set(stored.flags))
-
-        self._invalidate_search_cache(dst_mailbox)
+            self._put(dst_mailbox, new_uid, _StoredMessage(new_msg, set(stored.flags)))
 
     def create_mailbox(self, name: str) -> None:
         self._maybe_fail()
         self._ensure_mailbox(name)
-        self._invalidate_search_cache()
 
     def delete_mailbox(self, name: str) -> None:
         self._maybe_fail()
         self._mailboxes.pop(name, None)
-        self._invalidate_search_cache()
+        self._uids_sorted.pop(name, None)
+        self._invalidate_search_cache(name)
 
     def ping(self) -> None:
         """
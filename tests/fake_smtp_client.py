@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import copy
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from email.message import EmailMessage as PyEmailMessage
 from email.utils import make_msgid, parseaddr
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from openmail.config import SMTPConfig
 from openmail.errors import ConfigError, SMTPError
@@ -31,6 +32,8 @@ class FakeSMTPClient:
     - Public API compatibility:
         - send(msg, recipients)
         - send_many(batch)
+        - send_broadcast(msg, recipients, chunk=...)
+        - session()
         - ping(), close()
         - context manager
     - Behaviors mirrored:
@@ -83,7 +86,9 @@ class FakeSMTPClient:
         if msg.get("Message-ID") is None:
             msg["Message-ID"] = make_msgid()
 
-    def _prepare_from_and_msg(self, msg: PyEmailMessage) -> tuple[PyEmailMessage, str]:
+    def _prepare_from_and_msg(
+        self, msg: PyEmailMessage, *, mutate_ok: bool = False
+    ) -> tuple[PyEmailMessage, str]:
         """
         Mirrors SMTPClient.send()/send_many() behavior:
 
@@ -92,7 +97,7 @@ class FakeSMTPClient:
             do NOT deepcopy; message left as-is.
         - If "From" missing:
             from_email := config.from_email (required)
-            deepcopy msg and inject From header
+            deepcopy msg (unless mutate_ok) and inject From header
         """
         hdr_from = msg.get("From")
         if hdr_from:
@@ -102,7 +107,7 @@ class FakeSMTPClient:
             return msg, from_email
 
         from_email = self._from_email()
-        final_msg = copy.deepcopy(msg)
+        final_msg = msg if mutate_ok else copy.deepcopy(msg)
         final_msg["From"] = from_email
         return final_msg, from_email
 
@@ -133,7 +138,9 @@ class FakeSMTPClient:
             raise ConfigError("SMTP config required")
         return cls(config=config)
 
-    def send(self, msg: PyEmailMessage, recipients: List[str]) -> SendResult:
+    def send(
+        self, msg: PyEmailMessage, recipients: List[str], *, mutate_ok: bool = False
+    ) -> SendResult:
         """
         Matches SMTPClient.send signature and validation:
           - recipients must be provided and non-empty
@@ -149,10 +156,15 @@ class FakeSMTPClient:
 
         self._ensure_connected()
 
-        final_msg, from_email = self._prepare_from_and_msg(msg)
+        final_msg, from_email = self._prepare_from_and_msg(msg, mutate_ok=mutate_ok)
         return self._record_send(final_msg, from_email, list(recipients))
 
-    def send_many(self, batch: Iterable[tuple[PyEmailMessage, Iterable[str]]]) -> List[SendResult]:
+    def send_many(
+        self,
+        batch: Iterable[tuple[PyEmailMessage, Iterable[str]]],
+        *,
+        mutate_ok: bool = False,
+    ) -> List[SendResult]:
         """
         Matches SMTPClient.send_many(batch):
           - validates each message has recipients
@@ -168,7 +180,7 @@ class FakeSMTPClient:
             if not rcpts:
                 raise ConfigError("send_many(): one of the messages has no recipients")
 
-            final_msg, from_email = self._prepare_from_and_msg(msg)
+            final_msg, from_email = self._prepare_from_and_msg(msg, mutate_ok=mutate_ok)
             prepared.append((final_msg, from_email, rcpts))
 
         results: List[SendResult] = []
@@ -180,6 +192,33 @@ class FakeSMTPClient:
 
         return results
 
+    def send_broadcast(
+        self, msg: PyEmailMessage, recipients: List[str], *, chunk: int = 100
+    ) -> List[SendResult]:
+        """
+        Matches SMTPClient.send_broadcast: one recorded send per recipient chunk.
+        """
+        self._maybe_fail()
+        if not recipients:
+            raise ConfigError("send_broadcast(): recipients list is empty")
+        self._ensure_connected()
+
+        final_msg, from_email = self._prepare_from_and_msg(msg)
+        return [
+            self._record_send(final_msg, from_email, list(recipients[i : i + chunk]))
+            for i in range(0, len(recipients), chunk)
+        ]
+
+    @contextmanager
+    def session(self) -> Iterator[FakeSMTPClient]:
+        """
+        Matches SMTPClient.session(); there is no server object, so the fake
+        yields itself while "connected".
+        """
+        self._maybe_fail()
+        self._ensure_connected()
+        yield self
+
     def ping(self) -> None:
         """
         Minimal SMTP health check.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from email.message import EmailMessage as PyEmailMessage
 
@@ -151,6 +152,26 @@ def test_compose_text_html_attachments(manager: EmailManager):
     assert "test.txt" in filenames
 
 
+def test_compose_long_line_html_uses_base64_only_with_fast_cte(manager: EmailManager):
+    html = "<p>" + "word " * 400 + "</p>"
+    kw = dict(subject="s", to=["x@example.com"], text="short\nlines", html=html)
+
+    _, default_html = manager.compose(**kw).get_payload()
+    assert default_html["Content-Transfer-Encoding"] != "base64"
+
+    text_part, html_part = manager.compose(**kw, fast_cte=True).get_payload()
+    assert text_part["Content-Transfer-Encoding"] == "7bit"
+    assert html_part["Content-Transfer-Encoding"] == "base64"
+    assert html_part.get_content() == html + "\n"
+
+
+def test_body_cte_measures_encoded_line_length():
+    from openmail.smtp.builder import body_cte
+
+    assert body_cte("é" * 30) is None
+    assert body_cte("é" * 50) == "base64"  # 50 characters, 100 bytes
+
+
 def test_compose_and_send_requires_some_recipient(manager: EmailManager):
     # compose_and_send enforces at least one of to/cc/bcc non-empty
     with pytest.raises(ValueError):
@@ -172,6 +193,100 @@ def test_send_and_compose_and_send_records_email(manager: EmailManager, fake_smt
     assert record.recipients == ["to@example.com"]
 
 
+def test_send_many_uses_one_smtp_batch(manager: EmailManager, fake_smtp: FakeSMTPClient):
+    msgs = [
+        manager.compose(subject=f"m{i}", to=[f"to{i}@example.com"], bcc=["b@example.com"], text="x")
+        for i in range(3)
+    ]
+
+    results = manager.send_many(msgs)
+
+    assert [r.ok for r in results] == [True, True, True]
+    assert [r.recipients for r in fake_smtp.sent] == [
+        [f"to{i}@example.com", "b@example.com"] for i in range(3)
+    ]
+    assert all("Bcc" not in r.msg for r in fake_smtp.sent)
+
+
+def test_compose_and_send_many(manager: EmailManager, fake_smtp: FakeSMTPClient):
+    results = manager.compose_and_send_many(
+        [
+            {"subject": "a", "to": ["x@example.com"], "from_addr": "me@example.com"},
+            {"subject": "b", "to": ["y@example.com"], "from_addr": "me@example.com"},
+        ]
+    )
+
+    assert all(r.ok for r in results)
+    assert [r.msg["Subject"] for r in fake_smtp.sent] == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        manager.compose_and_send_many([{"subject": "c", "to": []}])
+
+
+def test_compile_template_renders_per_recipient(manager: EmailManager):
+    opened: list[int] = []
+
+    def open_report():
+        import io
+
+        opened.append(1)
+        return io.BytesIO(b"report")
+
+    att = Attachment(
+        idx=0, part="", filename="r.txt", content_type="text/plain", size=0, stream=open_report
+    )
+    render = manager.compile_template(
+        subject="Hi {name}",
+        from_addr="me@example.com",
+        text="Dear {name}",
+        html="<p>Dear {name}</p>",
+        attachments=[att],
+        extra_headers={"Reply-To": "help@example.com"},
+    )
+
+    a = render(["a@example.com"], {"name": "Ann"})
+    b = render(["b@example.com"], {"name": "Bob"}, bcc=["audit@example.com"])
+
+    assert opened == [1]
+    assert (a["To"], a["Subject"], a["Reply-To"]) == ("a@example.com", "Hi Ann", "help@example.com")
+    assert (b["To"], b["Bcc"], b["Subject"]) == ("b@example.com", "audit@example.com", "Hi Bob")
+    text, html = get_text_and_html_from_pymsg(b)
+    assert (text or "").strip() == "Dear Bob"
+    assert "<p>Dear Bob</p>" in (html or "")
+    for m in (a, b):
+        (part,) = m.iter_attachments()
+        assert (part.get_filename(), part.get_content()) == ("r.txt", "report")
+
+
+def test_compile_template_unescapes_braces_with_or_without_variables(manager: EmailManager):
+    render = manager.compile_template(
+        subject="Update",
+        html="<style>p {{ color: red; }}</style><p>Hello</p>",
+    )
+
+    for msg in (render(["a@example.com"]), render(["a@example.com"], {"name": "Ann"})):
+        _, html = get_text_and_html_from_pymsg(msg)
+        assert "<style>p { color: red; }</style>" in (html or "")
+
+
+def test_compose_streamed_attachment_matches_buffered(manager: EmailManager):
+    import io
+
+    data = bytes(range(256)) * 600
+
+    def compose(att: Attachment):
+        msg = manager.compose(subject="s", to=["x@example.com"], text="t", attachments=[att])
+        return next(msg.iter_attachments())
+
+    common = dict(idx=0, part="", filename="r.bin", content_type="application/pdf", size=0)
+    buffered = compose(Attachment(**common, data=data))
+    streamed = compose(Attachment(**common, stream=lambda: io.BytesIO(data)))
+
+    assert streamed.get_content() == data
+    assert streamed.get_payload() == buffered.get_payload()
+    assert streamed.get_filename() == "r.bin"
+
+
 def test_save_draft_appends_to_drafts_with_flag(manager: EmailManager, fake_imap: FakeIMAPClient):
     ref = manager.save_draft(
         subject="Draft",
@@ -225,6 +340,48 @@ def test_fetch_message_by_ref_and_multi_refs(manager: EmailManager, fake_imap: F
     texts = {m.text for m in msgs}
     assert texts == {"m1", "m2"}
 
+    ref3 = fake_imap.add_parsed_message("Archive", make_email_message(uid=3, text="m3"))
+    msgs = manager.fetch_messages_by_multi_refs([ref2, ref3, ref1])
+    assert [m.text for m in msgs] == ["m2", "m3", "m1"]
+
+
+def test_iter_messages_by_multi_refs_fetches_lazily_in_chunks(
+    manager: EmailManager, fake_imap: FakeIMAPClient, monkeypatch: pytest.MonkeyPatch
+):
+    refs = [
+        fake_imap.add_parsed_message("INBOX", make_email_message(uid=i, text=f"m{i}"))
+        for i in range(1, 6)
+    ]
+    calls: list[int] = []
+    fetch_many = fake_imap.fetch_many
+
+    def counting_fetch_many(chunk, **kw):
+        calls.append(len(chunk))
+        return fetch_many(chunk, **kw)
+
+    monkeypatch.setattr(fake_imap, "fetch_many", counting_fetch_many)
+
+    it = manager.iter_messages_by_multi_refs(refs, chunk_size=2)
+    assert calls == []
+    assert next(it).text == "m1"
+    assert calls == [2]
+    assert [m.text for m in it] == ["m2", "m3", "m4", "m5"]
+    assert calls == [2, 2, 1]
+
+
+def test_fetch_attachments_by_ref(manager: EmailManager, fake_imap: FakeIMAPClient):
+    atts = [
+        Attachment(
+            idx=i, part=f"{i}", filename=f"{i}.txt", content_type="text/plain", data=d, size=len(d)
+        )
+        for i, d in ((2, b"two"), (3, b"three"))
+    ]
+    ref = fake_imap.add_parsed_message("INBOX", make_email_message(attachments=atts))
+
+    assert manager.fetch_attachments_by_ref(ref, ["2", "3"]) == {"2": b"two", "3": b"three"}
+    with pytest.raises(ValueError):
+        manager.fetch_attachments_by_ref(ref, ["2", "9"])
+
 
 def test_fetch_message_by_ref_missing_raises(manager: EmailManager):
     with pytest.raises(ValueError):
@@ -358,12 +515,55 @@ def test_forward_include_original_and_attachments(manager: EmailManager, fake_sm
     assert "file.txt" in filenames
 
 
+def test_forward_without_html_stays_plain_text(manager: EmailManager, fake_smtp: FakeSMTPClient):
+    original = make_email_message(text="Original body", html=None)
+
+    manager.forward(original, to=["dest@example.com"], text="FYI", include_attachments=False)
+
+    msg = fake_smtp.sent[-1].msg
+    assert not msg.is_multipart()
+    assert msg.get_content_type() == "text/plain"
+
+
+def test_forward_escapes_text_in_html_intro(manager: EmailManager, fake_smtp: FakeSMTPClient):
+    original = make_email_message(text="Original body", html="<p>Original</p>")
+
+    manager.forward(
+        original,
+        to=["dest@example.com"],
+        text="a < b & \"c\" 'd'",
+        include_original=True,
+        include_attachments=False,
+    )
+
+    _, html = get_text_and_html_from_pymsg(fake_smtp.sent[-1].msg)
+    assert "<p>a &lt; b &amp; &quot;c&quot; &#x27;d&#x27;</p>" in (html or "")
+
+
 def test_forward_requires_to(manager: EmailManager):
     original = make_email_message()
     with pytest.raises(ValueError):
         manager.forward(original, to=[], text="x")
 
 
+def test_forward_as_attachment_attaches_original_source(
+    manager: EmailManager, fake_imap: FakeIMAPClient, fake_smtp: FakeSMTPClient
+):
+    ref = fake_imap.add_parsed_message("INBOX", make_email_message(subject="Orig", text="orig"))
+    original = manager.fetch_message_by_ref(ref)
+
+    manager.forward_as_attachment(
+        original, to=["dest@example.com"], from_addr="me@example.com", text="FYI"
+    )
+
+    msg = fake_smtp.sent[-1].msg
+    assert msg["Subject"] == ensure_forward_subject("Orig")
+    (part,) = msg.iter_attachments()
+    assert part.get_content_type() == "message/rfc822"
+    assert part.get_filename() == "forwarded.eml"
+    assert b"Subject: Orig" in part.as_bytes()
+
+
 # ---------------------------------------------------------------------------
 # fetch_latest / fetch_thread
 # ---------------------------------------------------------------------------
@@ -374,7 +574,7 @@ def test_fetch_latest_unseen_and_limit(manager: EmailManager, fake_imap: FakeIMA
     m2 = make_email_message(uid=2, text="m2")
     m3 = make_email_message(uid=3, text="m3")
     fake_imap.add_parsed_message("INBOX", m1)
-    fake_imap.add_parsed_message("INBOX", m2)
+    r2 = fake_imap.add_parsed_message("INBOX", m2)
     r3 = fake_imap.add_parsed_message("INBOX", m3)
 
     # mark newest as seen
@@ -386,6 +586,11 @@ def test_fetch_latest_unseen_and_limit(manager: EmailManager, fake_imap: FakeIMA
     assert "m3" not in texts  # seen excluded
     assert texts == ["m2", "m1"]
 
+    # flag changes show up in the next page
+    fake_imap.add_flags([r2], flags={r"\Seen"})
+    _, msgs = manager.fetch_latest(mailbox="INBOX", n=2, unseen_only=True)
+    assert [m.text for m in msgs] == ["m1"]
+
 
 def test_fetch_thread_includes_root_once(manager: EmailManager, fake_imap: FakeIMAPClient):
     root = make_email_message(
@@ -410,6 +615,25 @@ def test_fetch_thread_includes_root_once(manager: EmailManager, fake_imap: FakeI
     assert len(msgs) >= 2
 
 
+def test_fetch_thread_overview_puts_root_first(manager: EmailManager, fake_imap: FakeIMAPClient):
+    root_ref = fake_imap.add_parsed_message(
+        "INBOX", make_email_message(message_id="<root@example.com>", subject="root")
+    )
+    fake_imap.add_parsed_message(
+        "INBOX",
+        make_email_message(
+            message_id="<reply@example.com>",
+            subject="Re: root",
+            headers={"In-Reply-To": "<root@example.com>"},
+        ),
+    )
+    root = manager.fetch_message_by_ref(root_ref)
+
+    overviews = manager.fetch_thread_overview(root)
+
+    assert [o.subject for o in overviews] == ["root", "Re: root"]
+
+
 # ---------------------------------------------------------------------------
 # flag / mailbox operations
 # ---------------------------------------------------------------------------
@@ -453,6 +677,32 @@ def test_flagging_and_expunge_and_mark_all_seen(
     assert r"\Seen" in fake_imap._mailboxes["INBOX"][r1.uid].flags
 
 
+def test_cached_searches_follow_mutations(fake_imap: FakeIMAPClient):
+    from openmail.imap import IMAPQuery
+
+    queries = [IMAPQuery(), IMAPQuery().unseen(), IMAPQuery().header("List-Unsubscribe", "")]
+    r1 = fake_imap.add_parsed_message("INBOX", make_email_message(text="m1"))
+    for q in queries:
+        fake_imap.search_page_cached(mailbox="INBOX", query=q)
+
+    r2 = fake_imap.add_parsed_message(
+        "INBOX", make_email_message(headers={"List-Unsubscribe": "<mailto:u@x.com>"})
+    )
+    r3 = fake_imap.add_parsed_message("INBOX", make_email_message(text="m3"))
+    fake_imap.add_flags([r1, r3], flags={r"\Seen"})
+    fake_imap.remove_flags([r3], flags={r"\Seen"})
+    fake_imap.add_flags([r2], flags={r"\Deleted"})
+    fake_imap.expunge("INBOX")
+    fake_imap.move([r3], src_mailbox="INBOX", dst_mailbox="Archive")
+    fake_imap.copy([r1], src_mailbox="INBOX", dst_mailbox="INBOX")
+
+    for q in queries:
+        cached = fake_imap.search_page_cached(mailbox="INBOX", query=q).refs
+        assert cached == fake_imap.search_page_cached(mailbox="INBOX", query=q, refresh=True).refs
+    assert fake_imap.search_page_cached(mailbox="INBOX", query=queries[1]).refs == []
+    assert len(fake_imap.search_page_cached(mailbox="INBOX", query=queries[0]).refs) == 2
+
+
 def test_list_mailboxes_status_move_copy_create_delete(
     manager: EmailManager, fake_imap: FakeIMAPClient
 ):
@@ -491,8 +741,8 @@ def test_list_unsubscribe_candidates_uses_detector(manager: EmailManager, monkey
         def __init__(self, imap):
             self.imap = imap
 
-        def find(self, *, mailbox, limit, since, unseen_only):
-            seen_args.append((mailbox, limit, since, unseen_only))
+        def find(self, *, mailbox, limit, since, unseen_only, parallelism):
+            seen_args.append((mailbox, limit, since, unseen_only, parallelism))
             method = UnsubscribeMethod(kind="mailto", value="list@example.com")
             cand = UnsubscribeCandidate(
                 ref=EmailRef(uid=1, mailbox=mailbox),
@@ -509,7 +759,7 @@ def test_list_unsubscribe_candidates_uses_detector(manager: EmailManager, monkey
     )
     assert len(cands) == 1
     assert cands[0].from_email == "newsletter@example.com"
-    assert seen_args == [("INBOX", 10, "2026-01-01", True)]
+    assert seen_args == [("INBOX", 10, "2026-01-01", True, 1)]
 
 
 def test_unsubscribe_selected_uses_service(manager: EmailManager, monkeypatch):
@@ -562,3 +812,32 @@ def test_health_check_with_failures(
 
     status = manager.health_check()
     assert status == {"imap": False, "smtp": False}
+
+
+def test_health_check_async(manager: EmailManager, fake_smtp: FakeSMTPClient):
+    import asyncio
+
+    fake_smtp.fail_next = True
+    status = asyncio.run(manager.health_check_async())
+    assert status == {"imap": True, "smtp": False}
+
+
+def test_health_check_async_pings_imap_from_one_thread(
+    manager: EmailManager, fake_imap: FakeIMAPClient
+):
+    import asyncio
+
+    threads = set()
+    ping = fake_imap.ping
+
+    def recording_ping():
+        threads.add(threading.get_ident())
+        ping()
+
+    fake_imap.ping = recording_ping
+
+    async def run():
+        return await asyncio.gather(*(manager.health_check_async() for _ in range(20)))
+
+    assert all(s == {"imap": True, "smtp": True} for s in asyncio.run(run()))
+    assert len(threads) == 1
@@ -132,6 +132,16 @@ def test_from_any_multiple_arguments_uses_or():
     assert '"b@example.com"' in built
 
 
+def test_from_any_is_anded_with_existing_filters():
+    mgr = FakeEmailManager()
+    easy = EmailQuery(mgr)
+
+    easy.query.unseen()
+    easy.from_any("a@example.com", "b@example.com")
+
+    assert easy.query.build() == 'UNSEEN OR (FROM "a@example.com") (FROM "b@example.com")'
+
+
 def test_to_any_behaviour():
     mgr = FakeEmailManager()
     easy = EmailQuery(mgr)
@@ -374,3 +384,13 @@ def test_fetch_overview_calls_search_then_fetch_overview():
     assert len(mgr.imap.search_page_cached_calls) == 1
     assert len(mgr.imap.fetch_overview_calls) == 1
     assert mgr.imap.fetch_overview_calls[0] == ["ref-1", "ref-2"]
+
+
+def test_from_any_puts_full_addresses_and_longer_needles_first():
+    easy = EmailQuery(FakeEmailManager())
+
+    easy.from_any("@example.com", "bob@example.com", "al@x.io")
+
+    assert easy.query.build() == (
+        'OR (OR (FROM "bob@example.com") (FROM "al@x.io")) (FROM "@example.com")'
+    )
@@ -0,0 +1,321 @@
+import threading
+
+from openmail import IMAPConfig
+from openmail.imap import IMAPQuery
+from openmail.imap.client import IMAPClient
+from openmail.types import EmailRef
+
+
+def _raw(i: int) -> bytes:
+    return (
+        f"From: a{i}@example.com\r\nTo: b@example.com\r\nSubject: m{i}\r\n"
+        f"Message-ID: <m{i}@example.com>\r\n\r\nbody {i}\r\n"
+    ).encode()
+
+
+def test_fetch_rfc822_parses_in_worker_processes_in_ref_order():
+    refs = [EmailRef(uid=u, mailbox="INBOX") for u in (5, 3, 9, 4)]
+    raws = {r.uid: (_raw(r.uid), '"01-Jan-2025 10:00:00 +0000"') for r in refs if r.uid != 9}
+
+    inline = IMAPClient(IMAPConfig(host="imap.example.com"))
+    pooled = IMAPClient(IMAPConfig(host="imap.example.com"), parse_processes=2)
+    for client in (inline, pooled):
+        client._fetch_raw_many = lambda refs: raws
+
+    try:
+        got = pooled.fetch_rfc822(refs)
+    finally:
+        pooled.close()
+
+    assert [m.subject for m in got] == ["m5", "m3", "m4"]
+    assert [m.text for m in got] == [m.text for m in inline.fetch_rfc822(refs)]
+    assert got[0].headers["Message-ID"] == "<m5@example.com>"
+
+
+class _SearchConn:
+    def __init__(self, barrier: threading.Barrier, uids: bytes):
+        self.barrier = barrier
+        self.uids = uids
+
+    def select(self, mailbox, readonly=False):
+        return "OK", [b"1"]
+
+    def uid(self, command, *args):
+        assert command == "SEARCH"
+        self.barrier.wait()  # both searches must be in flight at once
+        return "OK", [self.uids]
+
+
+def test_search_pages_cached_runs_searches_concurrently():
+    client = IMAPClient(IMAPConfig(host="imap.example.com"))
+    barrier = threading.Barrier(2, timeout=5)
+    uids = iter([b"1 2 3", b"1 2 3"])
+    local = threading.local()
+
+    def get_conn():
+        if not hasattr(local, "conn"):
+            local.conn = _SearchConn(barrier, next(uids))
+        return local.conn
+
+    client._get_conn = get_conn
+    try:
+        pages = client.search_pages_cached(
+            [("INBOX", IMAPQuery().unseen(), 2), ("Sent", IMAPQuery(), 50)]
+        )
+    finally:
+        client.close()
+
+    assert [(r.mailbox, r.uid) for r in pages[0].refs] == [("INBOX", 3), ("INBOX", 2)]
+    assert pages[0].has_next
+    assert [r.uid for r in pages[1].refs] == [3, 2, 1]
+    assert pages[1].refs[0].mailbox == "Sent"
+
+
+class _OverviewConn:
+    def __init__(self, barrier: threading.Barrier, fetched: list):
+        self.barrier = barrier
+        self.fetched = fetched
+
+    def select(self, mailbox, readonly=False):
+        return "OK", [b"3"]
+
+    def uid(self, command, uid_set, attrs):
+        assert command == "FETCH"
+        self.fetched.append(uid_set)
+        self.barrier.wait()  # both slices must be in flight at once
+        data = []
+        for uid in uid_set.split(","):
+            hdr = f"Subject: s{uid}\r\n\r\n".encode()
+            meta = f"1 (UID {uid} FLAGS () BODY[HEADER.FIELDS (SUBJECT)] {{{len(hdr)}}}"
+            data += [(meta.encode(), hdr), b")"]
+        return "OK", data
+
+
+def test_fetch_overview_parallel_splits_refs_across_connections():
+    client = IMAPClient(IMAPConfig(host="imap.example.com"))
+    barrier = threading.Barrier(2, timeout=5)
+    fetched: list = []
+    local = threading.local()
+
+    def get_conn():
+        if not hasattr(local, "conn"):
+            local.conn = _OverviewConn(barrier, fetched)
+        return local.conn
+
+    client._get_conn = get_conn
+    refs = [EmailRef(uid=u, mailbox="INBOX") for u in (9, 7, 5)]
+    try:
+        got = client.fetch_overview_parallel(refs, parallelism=2)
+    finally:
+        client.close()
+
+    assert sorted(fetched) == ["5", "7,9"]
+    assert [ov.ref.uid for ov in got] == [9, 7, 5]
+    assert [ov.subject for ov in got] == ["s9", "s7", "s5"]
+
+
+def test_search_cache_is_bounded_and_expires(monkeypatch):
+    import openmail.imap.client as client_mod
+
+    searches = []
+
+    class Conn:
+        def select(self, mailbox, readonly=False):
+            return "OK", [b"1"]
+
+        def uid(self, command, charset, criteria):
+            searches.append(criteria)
+            return "OK", [b"1 2"]
+
+    now = [100.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    client = IMAPClient(IMAPConfig(host="imap.example.com"), search_cache_size=2)
+    conn = Conn()
+    client._get_conn = lambda: conn
+
+    a, b, c = IMAPQuery().seen(), IMAPQuery().unseen(), IMAPQuery().flagged()
+    for q in (a, b, a, c, a, b):
+        client.search_page_cached(mailbox="INBOX", query=q)
+    # a stays hot; b is evicted when c arrives
+    assert searches == ["SEEN", "UNSEEN", "FLAGGED", "UNSEEN"]
+
+    client.search_cache_ttl = 30
+    now[0] += 29
+    client.search_page_cached(mailbox="INBOX", query=a)
+    now[0] += 1
+    client.search_page_cached(mailbox="INBOX", query=a)
+    assert searches[4:] == ["SEEN"]
+
+
+def test_iter_fetch_pieces_takes_detached_payload_only_for_literals():
+    from openmail.imap.fetch_response import iter_fetch_pieces
+
+    data = [
+        (b"1 (UID 1 BODY[1] {3}", b"abc"),
+        b")",
+        (b"2 (UID 2 BODY[1] {3}", None),
+        b"def",
+        (b"3 (UID 3 FLAGS ())", None),
+        b")",
+    ]
+
+    pieces = [(p.meta.split()[2], p.payload) for p in iter_fetch_pieces(data)]
+
+    assert pieces == [("1", b"abc"), ("2", b"def"), ("3", None)]
+
+
+def test_fetch_issues_one_uid_fetch_per_batch():
+    commands = []
+
+    class Conn:
+        def select(self, mailbox, readonly=False):
+            return "OK", [b"3"]
+
+        def uid(self, command, uid_set, attrs):
+            commands.append(uid_set)
+            data = []
+            for uid in uid_set.replace(":", ",").split(","):
+                data.append(
+                    (f"{uid} (UID {uid} BODY[HEADER] {{14}}".encode(), b"Subject: s\r\n\r\n")
+                )
+                data.append(b")")
+            return "OK", data
+
+    client = IMAPClient(IMAPConfig(host="imap.example.com"), fetch_batch_size=2)
+    conn = Conn()
+    client._get_conn = lambda: conn
+
+    refs = [EmailRef(uid=u, mailbox="INBOX") for u in (9, 1, 2)]
+    got = client.fetch(refs)
+
+    assert commands == ["1,9", "2"]
+    assert [m.ref.uid for m in got] == [9, 1, 2]
+
+
+class _PipelineConn:
+    """imaplib-shaped connection recording when commands are sent and completed."""
+
+    BS = b'BODYSTRUCTURE ("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 5 1 NIL NIL NIL)'
+
+    def __init__(self):
+        self.log = []
+        self.untagged_responses = {}
+
+    def select(self, mailbox, readonly=False):
+        return "OK", [b"2"]
+
+    def uid(self, command, uid_set, attrs):
+        lo, _, hi = uid_set.partition(":")
+        data = []
+        for uid in range(int(lo), int(hi or lo) + 1):
+            meta = f"{uid} (UID {uid} ".encode() + self.BS + b" BODY[HEADER] {14}"
+            data += [(meta, b"Subject: s\r\n\r\n"), b")"]
+        return "OK", data
+
+    def _command(self, name, command, uid, attrs):
+        self.log.append(("send", uid))
+        body = f"body{uid}".encode()
+        self.untagged_responses.setdefault("FETCH", []).extend(
+            [(f"{uid} (UID {uid} BODY[1.MIME] {{0}}".encode(), b""), (b" BODY[1] {5}", body), b")"]
+        )
+        return uid
+
+    def _command_complete(self, name, tag):
+        self.log.append(("done", tag))
+        return "OK", [b"done"]
+
+    def _untagged_response(self, typ, dat, name):
+        return typ, self.untagged_responses.pop(name, [None])
+
+
+def test_fetch_pipelines_body_section_commands():
+    client = IMAPClient(IMAPConfig(host="imap.example.com"))
+    conn = _PipelineConn()
+    client._get_conn = lambda: conn
+
+    got = client.fetch([EmailRef(uid=u, mailbox="INBOX") for u in (7, 8)])
+
+    assert [m.text for m in got] == ["body7", "body8"]
+    assert conn.log == [("send", "7"), ("send", "8"), ("done", "7"), ("done", "8")]
+
+
+def test_add_flags_matching_caps_messages_per_store():
+    stores = []
+
+    class Conn:
+        def select(self, mailbox, readonly=False):
+            return "OK", [b"6"]
+
+        def uid(self, command, *args):
+            if command == "SEARCH":
+                return "OK", [b"1 2 3 4 5 9"]
+            stores.append(args[0])
+            return "OK", [None]
+
+    client = IMAPClient(IMAPConfig(host="imap.example.com"))
+    conn = Conn()
+    client._get_conn = lambda: conn
+
+    n = client.add_flags_matching(
+        mailbox="INBOX", query=IMAPQuery().unseen(), flags={r"\Seen"}, uids_per_store=4
+    )
+
+    assert n == 6
+    assert stores == ["1:4", "5,9"]
+
+
+def test_fetch_bad_reply_blanks_only_that_message():
+    import imaplib
+
+    class Conn(_PipelineConn):
+        def _command(self, name, command, uid, attrs):
+            if uid == "8":
+                self.log.append(("send", uid))
+                return uid  # BAD: no FETCH data
+            return super()._command(name, command, uid, attrs)
+
+        def _command_complete(self, name, tag):
+            super()._command_complete(name, tag)
+            if tag == "8":
+                raise imaplib.IMAP4.error("UID command error: BAD")
+            return "OK", [b"done"]
+
+        def select(self, mailbox, readonly=False):
+            return "OK", [b"3"]
+
+    client = IMAPClient(IMAPConfig(host="imap.example.com"))
+    client._get_conn = lambda: Conn()
+
+    got = client.fetch([EmailRef(uid=u, mailbox="INBOX") for u in (7, 8, 9)])
+
+    assert [m.text for m in got] == ["body7", None, "body9"]
+
+
+def test_tuned_imap4_connects_to_local_server():
+    import socket
+
+    from openmail.imap.transport import TunedIMAP4
+
+    srv = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        conn, _ = srv.accept()
+        with conn, conn.makefile("rb") as rfile:
+            conn.sendall(b"* OK ready\r\n")
+            for line in rfile:
+                tag, command = line.split()[:2]
+                if command.upper() == b"CAPABILITY":
+                    conn.sendall(b"* CAPABILITY IMAP4rev1\r\n")
+                conn.sendall(tag + b" OK done\r\n")
+                if command.upper() == b"LOGOUT":
+                    break
+
+    t = threading.Thread(target=serve, daemon=True)
+    t.start()
+    try:
+        imap = TunedIMAP4("127.0.0.1", srv.getsockname()[1], timeout=5)
+        assert imap.noop()[0] == "OK"
+        imap.logout()
+    finally:
+        srv.close()
+    t.join(5)
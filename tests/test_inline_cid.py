@@ -0,0 +1,68 @@
+from openmail.imap.attachment_parts import fetch_part_bytes
+from openmail.imap.inline_cid import inline_cids_as_data_uris
+from openmail.models import AttachmentMeta
+
+
+class _FakeConn:
+    def __init__(self):
+        self.calls = []
+
+    def uid(self, cmd, uid, want):
+        self.calls.append(want)
+        return "OK", [
+            (b"1 (UID 5 BODY[2.MIME] {37}", b"Content-Transfer-Encoding: base64\r\n\r\n"),
+            (b" BODY[2] {4}", b"aGk="),
+            (b" BODY[3.MIME] {2}", b"\r\n"),
+            (b" BODY[3] {2}", b"yo"),
+            b")",
+        ]
+
+
+METAS = [
+    AttachmentMeta(
+        idx=0, part="2", filename="a.png", content_type="image/png", size=2, content_id="<a@x>"
+    ),
+    AttachmentMeta(
+        idx=1, part="3", filename="b.gif", content_type="IMAGE/GIF", size=2, content_id="b"
+    ),
+]
+
+
+def test_inline_cids_are_fetched_in_one_batch():
+    conn = _FakeConn()
+    html = '<img src="cid:a@x"><IMG SRC="cid:b@host"><img src="cid:a@x">'
+
+    out = inline_cids_as_data_uris(conn=conn, uid=5, html=html, attachment_metas=METAS)
+
+    assert len(conn.calls) == 1
+    assert out == (
+        '<img src="data:image/png;base64,aGk=">'
+        '<IMG SRC="data:image/gif;base64,eW8=">'
+        '<img src="data:image/png;base64,aGk=">'
+    )
+
+
+def test_legacy_single_part_fetcher_still_works():
+    out = inline_cids_as_data_uris(
+        conn=None,
+        uid=5,
+        html='<img src="cid:b">',
+        attachment_metas=METAS,
+        fetch_part_bytes=lambda conn, *, uid, part: b"yo",
+    )
+    assert out == '<img src="data:image/gif;base64,eW8=">'
+
+
+def test_html_without_inline_images_is_returned_untouched():
+    conn = _FakeConn()
+    html = '<img src="https://example.com/x.png">'
+
+    assert inline_cids_as_data_uris(conn=conn, uid=5, html=html, attachment_metas=METAS) is html
+    assert conn.calls == []
+
+
+def test_fetch_part_bytes_uses_one_fetch_for_mime_and_body():
+    conn = _FakeConn()
+
+    assert fetch_part_bytes(conn, uid=5, part="2") == b"hi"
+    assert conn.calls == ["(UID BODY.PEEK[2.MIME] BODY.PEEK[2])"]
@@ -1,4 +1,5 @@
 import base64
+import imaplib
 from typing import Callable
 
 import pytest
@@ -182,3 +183,57 @@ def test_smtp_failure_when_provider_raises():
 
     assert "SMTP XOAUTH2 auth failed:" in str(excinfo.value)
     assert "kaboom" in str(excinfo.value)
+
+
+def make_counting_provider(result):
+    calls = []
+
+    def provider():
+        calls.append(1)
+        return result
+
+    return provider, calls
+
+
+def test_token_with_expiry_is_reused_across_imap_and_smtp():
+    provider, calls = make_counting_provider(("tok", 3600))
+    auth = OAuth2Auth(username="user@example.com", token_provider=provider)
+
+    auth.apply_imap(FakeIMAPConnection(), ctx=None)
+    auth.apply_smtp(FakeSMTPServer(), ctx=None)
+
+    assert len(calls) == 1
+
+
+def test_bare_token_is_not_cached_without_ttl_and_rejection_invalidates():
+    provider, calls = make_counting_provider("tok")
+    auth = OAuth2Auth(username="user@example.com", token_provider=provider)
+    auth.apply_smtp(FakeSMTPServer(), ctx=None)
+    auth.apply_smtp(FakeSMTPServer(), ctx=None)
+    assert len(calls) == 2
+
+    cached = OAuth2Auth(username="user@example.com", token_provider=provider, token_ttl=600)
+    cached.apply_smtp(FakeSMTPServer(), ctx=None)
+    with pytest.raises(AuthError):
+        cached.apply_smtp(FakeSMTPServer(code=535), ctx=None)
+    cached.apply_smtp(FakeSMTPServer(), ctx=None)
+    assert len(calls) == 4
+
+
+class RaisingIMAPConnection:
+    """Like imaplib.IMAP4: a NO to AUTHENTICATE raises instead of returning."""
+
+    def authenticate(self, mechanism: str, auth_cb: Callable[[bytes], bytes]):
+        auth_cb(None)
+        raise imaplib.IMAP4.error("AUTHENTICATE failed")
+
+
+def test_imap_rejection_raised_by_imaplib_invalidates_cached_token():
+    provider, calls = make_counting_provider(("tok", 3600))
+    auth = OAuth2Auth(username="reject@example.com", token_provider=provider)
+
+    for _ in range(3):
+        with pytest.raises(AuthError, match="AUTHENTICATE failed"):
+            auth.apply_imap(RaisingIMAPConnection(), ctx=None)
+
+    assert len(calls) == 3
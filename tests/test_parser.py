@@ -0,0 +1,346 @@
+from openmail.imap import parser as parser_mod
+from openmail.imap.parser import (
+    decode_transfer,
+    parse_internaldate,
+    parse_overview,
+    parse_overview_batch,
+    parse_rfc822,
+)
+from openmail.models import EmailAddress, LazyHeaders
+from openmail.types import EmailRef
+
+HEADER_BYTES = (
+    b"From: =?utf-8?q?J=C3=B6rg?= <joerg@example.com>\r\n"
+    b"To: a@example.com,\r\n"
+    b' "Bob, B" <bob@example.com>\r\n'
+    b"Subject: =?utf-8?b?SGVsbG8gd29ybGQ=?=\r\n"
+    b"Date: Tue, 1 Jul 2025 10:00:00 +0000\r\n"
+    b"Message-ID: <abc@example.com>\r\n"
+    b"\r\n"
+)
+
+
+def test_parse_overview_fast_and_email_parser_paths_agree():
+    ref = EmailRef(uid=1, mailbox="INBOX")
+
+    fast = parse_overview(ref, frozenset({r"\Seen"}), HEADER_BYTES)
+    slow = parse_overview(ref, frozenset({r"\Seen"}), HEADER_BYTES, fast_headers=False)
+
+    for ov in (fast, slow):
+        assert ov.subject == "Hello world"
+        assert ov.from_email == EmailAddress(email="joerg@example.com", name="Jörg")
+        assert [a.email for a in ov.to] == ["a@example.com", "bob@example.com"]
+        assert ov.to[1].name == "Bob, B"
+        assert ov.sent_at is not None and ov.sent_at.year == 2025
+        assert ov.headers["Message-ID"] == "<abc@example.com>"
+        assert r"\Seen" in ov.flags
+
+
+def test_lazy_headers_decode_on_access_and_serialise_as_dict():
+    ov = parse_overview(EmailRef(uid=1), frozenset(), HEADER_BYTES)
+
+    assert isinstance(ov.headers, LazyHeaders)
+    assert ov.headers["From"] == "Jörg <joerg@example.com>"
+    assert (
+        ov.headers
+        == parse_overview(EmailRef(uid=1), frozenset(), HEADER_BYTES, lazy_headers=False).headers
+    )
+    assert type(ov.to_dict()["headers"]) is dict
+
+
+def test_lazy_headers_decode_only_the_headers_read():
+    decoded = []
+
+    def decode(v):
+        decoded.append(v)
+        return v.upper()
+
+    h = LazyHeaders([("Subject", "a"), ("X-Big", "b"), ("Subject", "c")], decode)
+
+    assert list(h) == ["Subject", "X-Big"] and "X-Big" in h
+    assert decoded == []
+    assert h["Subject"] == h["Subject"] == "C"
+    assert decoded == ["c"]
+    assert dict(h) == {"Subject": "C", "X-Big": "B"}
+
+
+def test_parse_overview_batch_columns_match_rows():
+    items = [
+        (EmailRef(uid=1), frozenset(), HEADER_BYTES, "17-Jul-2025 02:44:25 -0700"),
+        (EmailRef(uid=2), frozenset({r"\Flagged"}), b"Subject: second\r\n\r\n", None),
+    ]
+
+    batch = parse_overview_batch(items)
+
+    assert len(batch) == 2
+    assert batch.subjects == ["Hello world", "second"]
+    assert batch.received_at[0] is not None and batch.received_at[1] is None
+
+    row = batch.row(1)
+    assert row.ref.uid == 2
+    assert row.subject == "second"
+    assert r"\Flagged" in row.flags
+    assert row == parse_overview(*items[1][:3])
+
+    flipped = batch.take([1, 0])
+    assert flipped.subjects == ["second", "Hello world"]
+    assert flipped.rows() == batch.rows()[::-1]
+
+
+def test_single_address_fast_path_matches_getaddresses():
+    from openmail.imap.parser import _parse_addr_list, _parse_single_addr
+
+    assert _parse_single_addr('"John Doe" <j@x.com>') == EmailAddress(
+        email="j@x.com", name="John Doe"
+    )
+    assert _parse_single_addr("j@x.com") == EmailAddress(email="j@x.com", name=None)
+    assert _parse_addr_list('"Doe, John" <j@x.com>') == [
+        EmailAddress(email="j@x.com", name="Doe, John")
+    ]
+    assert _parse_single_addr("  Bob   Smith  <b@x.com>") == EmailAddress(
+        email="b@x.com", name="Bob Smith"
+    )
+    assert _parse_single_addr("Bob <b @x.com>") == EmailAddress(email="b@x.com", name="Bob")
+    assert _parse_addr_list("Bob [work] <b@x.com>") == [
+        EmailAddress(email="Bob", name=None),
+        EmailAddress(email="work", name=None),
+        EmailAddress(email="b@x.com", name=None),
+    ]
+
+
+def test_address_list_fast_path_matches_getaddresses():
+    from openmail.imap.parser import _fast_addr_list, _parse_addr_list
+
+    assert _parse_addr_list("a@x.com, Bob <b@x.com>,, =?utf-8?q?J=C3=B6rg?= <j@x.de>") == [
+        EmailAddress(email="a@x.com", name=None),
+        EmailAddress(email="b@x.com", name="Bob"),
+        EmailAddress(email="j@x.de", name="Jörg"),
+    ]
+    assert _parse_addr_list("  Bob   Smith  <b@x.com>, Ann <a @x.com>") == [
+        EmailAddress(email="b@x.com", name="Bob Smith"),
+        EmailAddress(email="a@x.com", name="Ann"),
+    ]
+    assert _fast_addr_list("a@x.com, Bob [work] <b@x.com>") is None
+    # an unquoted comma in a display name needs the full parser
+    assert _fast_addr_list("Doe, John <j@x.com>, k@x.com") is None
+    assert _parse_addr_list("Doe, John <j@x.com>") == [
+        EmailAddress(email="Doe", name=None),
+        EmailAddress(email="j@x.com", name="John"),
+    ]
+
+
+def test_mixed_8bit_and_encoded_word_header_is_decoded():
+    from openmail.imap.parser import parse_rfc822
+
+    raw = "Subject: café =?utf-8?q?na=C3=AFve?=\r\nFrom: a@x.com\r\n\r\nbody\r\n".encode()
+    ref = EmailRef(uid=1)
+    for fast in (True, False):
+        ov = parse_overview(ref, frozenset(), raw, fast_headers=fast)
+        assert ov.subject == "café naïve"
+        assert ov.headers["Subject"] == "café naïve"
+    assert parse_rfc822(ref, raw).subject == "café naïve"
+
+
+def test_email_message_to_dict_covers_every_field():
+    from openmail.imap.parser import parse_rfc822
+
+    msg = parse_rfc822(EmailRef(uid=7, mailbox="INBOX"), HEADER_BYTES + b"body\r\n")
+    d = msg.to_dict()
+
+    assert d["ref"] == {"uid": 7, "mailbox": "INBOX"}
+    assert d["from_email"] == {"email": "joerg@example.com", "name": "Jörg"}
+    assert [a["email"] for a in d["to"]] == ["a@example.com", "bob@example.com"]
+    assert d["cc"] == [] and d["bcc"] == [] and d["attachments"] == []
+    assert d["sent_at"].startswith("2025-07-01")
+    assert d["message_id"] == "<abc@example.com>"
+    assert type(d["headers"]) is dict
+
+
+def test_header_block_unfolds_and_stops_at_blank_line():
+    from openmail.imap.parser import _parse_header_block
+
+    buf = b"A: 1\r\nB: x\r\n y\r\n\r\nC: body"
+    assert _parse_header_block(buf) == [("A", "1"), ("B", "x y")]
+    assert _parse_header_block(b"\r\nA: 1") == []
+
+
+def test_folded_headers_agree_across_parser_paths():
+    from openmail.imap.parser import parse_rfc822
+
+    hb = (
+        b'From: "Long\r\n Name" <a@example.com>\r\n'
+        b"Subject: hello\r\n there\r\n"
+        b"Date: Tue, 1 Jul 2025\r\n 10:00:00 +0000\r\n\r\n"
+    )
+    ref = EmailRef(uid=1)
+    msgs = [
+        parse_rfc822(ref, hb + b"body"),
+        parse_overview(ref, frozenset(), hb),
+        parse_overview(ref, frozenset(), hb, fast_headers=False),
+    ]
+
+    for m in msgs:
+        assert m.subject == "hello there"
+        assert m.from_email == EmailAddress(email="a@example.com", name="Long Name")
+        assert m.sent_at is not None and m.sent_at.hour == 10
+
+
+def test_to_json_bytes_matches_to_dict(monkeypatch):
+    import json
+
+    from openmail.imap.parser import parse_rfc822
+    from openmail.models import _compat, to_json_array
+
+    ref = EmailRef(uid=1, mailbox="INBOX")
+    objs = [
+        parse_rfc822(ref, HEADER_BYTES + b"body\r\n"),
+        parse_overview(ref, frozenset({r"\Seen"}), HEADER_BYTES, internaldate_raw=None),
+    ]
+
+    for obj in objs:
+        assert json.loads(obj.to_json_bytes()) == obj.to_dict()
+        monkeypatch.setattr(_compat, "orjson", None)
+        assert json.loads(obj.to_json_bytes()) == obj.to_dict()
+        monkeypatch.undo()
+
+    expected = [obj.to_dict() for obj in objs]
+    assert json.loads(to_json_array(objs)) == expected
+    monkeypatch.setattr(_compat, "orjson", None)
+    assert json.loads(to_json_array(objs)) == expected
+
+
+def test_decode_transfer():
+    plain = b"no escapes here\r\n"
+    assert decode_transfer(plain, "Quoted-Printable") is plain
+    assert decode_transfer(b"caf=C3=A9 =\r\nbar", "quoted-printable") == "café bar".encode()
+    assert decode_transfer(b"aGVs\r\nbG8=\r\n", " BASE64 ") == b"hello"
+    assert decode_transfer(plain, "8bit") is plain
+
+
+def _mixed_message() -> bytes:
+    from email.message import EmailMessage as PyEmailMessage
+
+    m = PyEmailMessage()
+    m["Subject"] = "s"
+    m.set_content("plain")
+    m.add_alternative("<p>html</p>", subtype="html")
+    m.add_attachment(b"A" * 100, maintype="application", subtype="pdf", filename="a.pdf")
+    m.add_attachment(b"B" * 100, maintype="image", subtype="png", filename="b.png")
+    return m.as_bytes()
+
+
+def test_parse_rfc822_only_decodes_parts_it_keeps(monkeypatch):
+    raw = _mixed_message()
+    decoded = []
+    part_payload = parser_mod._part_payload
+    monkeypatch.setattr(parser_mod, "_part_payload", lambda p: decoded.append(1) or part_payload(p))
+
+    msg = parse_rfc822(EmailRef(uid=1), raw)
+    assert (msg.text, msg.html, msg.attachments) == ("plain\n", "<p>html</p>\n", [])
+    assert len(decoded) == 2
+
+    msg = parse_rfc822(EmailRef(uid=1), raw, include_attachments=True)
+    assert [(a.idx, a.filename, a.data[:1]) for a in msg.attachments] == [
+        (0, "a.pdf", b"A"),
+        (1, "b.png", b"B"),
+    ]
+
+
+def test_repeated_recipient_headers_are_joined():
+    ref = EmailRef(uid=1, mailbox="INBOX")
+    raw = (
+        b"From: a@example.com\r\n"
+        b"To: Bob <b@example.com>\r\n"
+        b"To: c@example.com, d@example.com\r\n"
+        b"Subject: x\r\n\r\nbody"
+    )
+    msg = parse_rfc822(ref, raw)
+    assert [a.email for a in msg.to] == ["b@example.com", "c@example.com", "d@example.com"]
+    assert msg.to[0].name == "Bob"
+    # cached parse results are shared, the returned lists are not
+    assert parse_rfc822(ref, raw).to is not msg.to
+
+
+def test_parse_internaldate_matches_strptime():
+    from datetime import datetime
+
+    fmt = "%d-%b-%Y %H:%M:%S %z"
+    assert parser_mod._scan_internaldate("17-Jul-1996 02:44:25 -0700") is not None
+    for raw in ('"17-Jul-1996 02:44:25 -0700"', "01-Jan-2025 10:00:00 +0530"):
+        assert parse_internaldate(raw) == datetime.strptime(raw.strip('"'), fmt)
+        assert (
+            parse_internaldate(raw).utcoffset()
+            == datetime.strptime(raw.strip('"'), fmt).utcoffset()
+        )
+    assert parse_internaldate('" 7-Jul-1996 02:44:25 +0000"') == datetime.strptime(
+        "07-Jul-1996 02:44:25 +0000", fmt
+    )
+    assert parse_internaldate("31-Foo-2025 10:00:00 +0000") is None
+    assert parse_internaldate("32-Jan-2025 10:00:00 +0000") is None
+    assert parse_internaldate("") is None
+
+
+def test_parse_rfc822_attachment_headers():
+    ref = EmailRef(uid=1, mailbox="INBOX")
+    raw = (
+        b"From: a@example.com\r\nSubject: x\r\nMIME-Version: 1.0\r\n"
+        b'Content-Type: multipart/mixed; boundary="b"\r\n\r\n'
+        b"--b\r\nContent-Type: text/plain; charset=utf-8\r\n"
+        b"Content-Transfer-Encoding: 8bit\r\n\r\nh\xc3\xa9llo\r\n"
+        b"--b\r\nContent-Type: application/pdf\r\n"
+        b'Content-Disposition: attachment; filename="=?utf-8?q?r=C3=A9sum=C3=A9.pdf?="\r\n'
+        b"Content-Transfer-Encoding: base64\r\n\r\nAAEC\r\n"
+        b"--b\r\nContent-Type: image/png\r\n"
+        b"Content-Disposition: inline; filename*=utf-8''%C3%A9.png\r\n"
+        b"Content-ID: <img\xc3\xa9@x>\r\n"
+        b"Content-Transfer-Encoding: base64\r\n\r\nAAEC\r\n"
+        b"--b--\r\n"
+    )
+
+    msg = parse_rfc822(ref, raw, include_attachments=True)
+
+    assert msg.text.strip() == "h\u00e9llo"
+    pdf, png = msg.attachments
+    assert (pdf.filename, pdf.data, pdf.disposition) == (
+        "r\u00e9sum\u00e9.pdf",
+        b"\0\1\2",
+        "attachment",
+    )
+    assert (png.filename, png.is_inline) == ("\u00e9.png", True)
+    assert png.content_id and png.content_id.startswith("img")
+
+
+def test_flag_mask():
+    from openmail.imap.fetch_response import (
+        FLAG_FLAGGED,
+        FLAG_SEEN,
+        flag_mask,
+        parse_flag_list,
+    )
+
+    mask = flag_mask(parse_flag_list(r"\Seen \flagged $Important"))
+    assert mask == FLAG_SEEN | FLAG_FLAGGED
+    assert flag_mask(frozenset()) == 0
+
+
+def test_best_effort_date_fast_path_matches_email_utils():
+    from datetime import timezone
+    from email.utils import parsedate_to_datetime
+
+    from openmail.utils import best_effort_date
+
+    for raw in (
+        "Tue, 17 Jul 1996 02:44:25 -0700",
+        "17 Jul 1996 02:44:25 +0530 (IST)",
+        "Wed, 1 JAN 2025 23:59 -0000",
+        " Fri, 31 Dec 1999 23:59:59 +1400",
+    ):
+        expected = parsedate_to_datetime(raw)
+        if expected.tzinfo is None:
+            expected = expected.replace(tzinfo=timezone.utc)
+        got = best_effort_date(raw, None)
+        assert got == expected and got.tzinfo == timezone.utc
+
+    assert best_effort_date("31 Feb 2024 10:00:00 +0000", None) is None
+    assert best_effort_date("Tue, 17 Jul 96 02:44:25 GMT", None) is not None
+    assert best_effort_date(None, None) is None
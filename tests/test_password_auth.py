@@ -97,3 +97,13 @@ def test_password_auth_with_wrong_username():
 
     with pytest.raises(AuthError, match="IMAP login failed"):
         auth.apply_imap(imap_conn, ctx=None)
+
+
+def test_password_auth_equality_hash_and_redacted_repr():
+    a = PasswordAuth(username="u@example.com", password="s3cret")
+
+    assert a == PasswordAuth(username="u@example.com", password="s3cret")
+    assert hash(a) == hash(PasswordAuth(username="u@example.com", password="s3cret"))
+    assert a != PasswordAuth(username="u@example.com", password="other")
+    assert a != PasswordAuth(username="v@example.com", password="s3cret")
+    assert "s3cret" not in repr(a) and "u@example.com" in repr(a)
@@ -204,6 +204,14 @@ def test_or_with_multiple_and_clauses():
     assert "ANSWERED" in built
 
 
+def test_or_builds_balanced_tree():
+    qs = [IMAPQuery().subject(s) for s in "abcd"]
+
+    built = qs[0].or_(*qs[1:]).build()
+
+    assert built == ('OR (OR (SUBJECT "a") (SUBJECT "b")) (OR (SUBJECT "c") (SUBJECT "d"))')
+
+
 def test_or_requires_at_least_two_queries():
     q = IMAPQuery()
     one = IMAPQuery().from_("a@example.com")
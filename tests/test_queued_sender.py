@@ -0,0 +1,53 @@
+from email.message import EmailMessage
+
+import pytest
+
+from openmail.errors import SMTPError
+from openmail.smtp import QueuedSMTPSender
+from tests.fake_smtp_client import FakeSMTPClient
+
+
+class _Cfg:
+    from_email = "me@example.com"
+
+
+class _BatchRecorder(FakeSMTPClient):
+    def __init__(self):
+        super().__init__(config=_Cfg())
+        self.batch_sizes = []
+
+    def send_many(self, batch, *, mutate_ok=False):
+        batch = list(batch)
+        self.batch_sizes.append(len(batch))
+        return super().send_many(batch, mutate_ok=mutate_ok)
+
+
+def _msg(i: int) -> EmailMessage:
+    m = EmailMessage()
+    m["Subject"] = f"msg {i}"
+    m.set_content("hi")
+    return m
+
+
+def test_queued_sender_batches_and_resolves_futures():
+    client = _BatchRecorder()
+    with QueuedSMTPSender(client, max_batch=3, batch_window_ms=50) as sender:
+        futs = [sender.submit(_msg(i), ["a@example.com"]) for i in range(7)]
+        results = [f.result(timeout=5) for f in futs]
+
+    assert all(r.ok for r in results)
+    assert sum(client.batch_sizes) == 7 and max(client.batch_sizes) <= 3
+    assert [r.msg["Subject"] for r in client.sent] == [f"msg {i}" for i in range(7)]
+
+
+def test_queued_sender_propagates_batch_failure_and_rejects_after_close():
+    client = _BatchRecorder()
+    client.fail_next = True
+    with QueuedSMTPSender(client, batch_window_ms=10) as sender:
+        fut = sender.submit(_msg(0), ["a@example.com"])
+        with pytest.raises(SMTPError):
+            fut.result(timeout=5)
+        assert sender.submit(_msg(1), ["a@example.com"]).result(timeout=5).ok
+
+    with pytest.raises(SMTPError):
+        sender.submit(_msg(2), ["a@example.com"])
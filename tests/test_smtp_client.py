@@ -0,0 +1,81 @@
+import smtplib
+from email.message import EmailMessage
+
+from openmail import SMTPConfig
+from openmail.smtp.client import SMTPClient
+
+
+class _Server:
+    def __init__(self, drop_first: bool = False):
+        self.sock = object()
+        self.drop_first = drop_first
+        self.sent = []
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=()):
+        if self.drop_first:
+            self.drop_first = False
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.append((from_addr, to_addrs, msg, tuple(mail_options)))
+        return {}
+
+    def noop(self):
+        self.noops = getattr(self, "noops", 0) + 1
+        return 250, b"OK"
+
+    def quit(self):
+        self.sock = None
+
+
+def _client(servers):
+    client = SMTPClient(SMTPConfig(host="smtp.example.com", from_email="me@example.com"))
+    client._open_new_server = lambda: servers.pop(0)
+    return client
+
+
+def test_send_renders_once_and_strips_bcc(monkeypatch):
+    msg = EmailMessage()
+    msg["To"] = "to@example.com"
+    msg["Bcc"] = "hidden@example.com"
+    msg["Subject"] = "hi"
+    msg.set_content("body")
+
+    renders = []
+    as_bytes = EmailMessage.as_bytes
+    monkeypatch.setattr(
+        EmailMessage, "as_bytes", lambda self, **kw: renders.append(1) or as_bytes(self, **kw)
+    )
+
+    dropped, fresh = _Server(drop_first=True), _Server()
+    result = _client([dropped, fresh]).send(msg, ["to@example.com", "hidden@example.com"])
+
+    assert result.ok
+    assert renders == [1]
+    ((from_addr, rcpts, raw, opts),) = fresh.sent
+    assert (from_addr, rcpts, opts) == (
+        "me@example.com",
+        ["to@example.com", "hidden@example.com"],
+        (),
+    )
+    assert b"\r\nSubject: hi\r\n" in raw
+    assert b"Bcc" not in raw
+    assert msg["Bcc"] == "hidden@example.com"
+
+
+def test_ping_noops_every_call_unless_interval_set(monkeypatch):
+    import openmail.smtp.client as client_mod
+
+    now = [100.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    server = _Server()
+    client = _client([server])
+    client.ping()
+    client.ping()
+    assert server.noops == 2
+
+    client.ping_interval = 30
+    client.ping()
+    assert server.noops == 2
+    now[0] += 31
+    client.ping()
+    client.ping()
+    assert server.noops == 3
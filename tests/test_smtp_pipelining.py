@@ -0,0 +1,45 @@
+import smtplib
+
+import pytest
+
+from openmail.smtp.pipelining import _PipeliningMixin
+
+
+class _ScriptedSMTP(_PipeliningMixin, smtplib.SMTP):
+    """No socket: records writes and plays back canned replies."""
+
+    def __init__(self, replies, extensions=("pipelining",)):
+        super().__init__()
+        self.esmtp_features = {e: "" for e in extensions}
+        self.does_esmtp = True
+        self.ehlo_resp = b"ok"
+        self.replies = list(replies)
+        self.writes = []
+
+    def send(self, s):
+        self.writes.append(s)
+
+    def getreply(self):
+        return self.replies.pop(0)
+
+    def _rset(self):
+        self.writes.append("RSET")
+
+
+def test_commands_are_written_in_one_batch():
+    smtp = _ScriptedSMTP([(250, b""), (250, b""), (550, b"no"), (354, b""), (250, b"")])
+
+    refused = smtp.sendmail("a@x", ["b@x", "c@x"], b"Subject: hi\r\n\r\n.line\r\n")
+
+    assert refused == {"c@x": (550, b"no")}
+    assert smtp.writes[0] == "MAIL FROM:<a@x>\r\nRCPT TO:<b@x>\r\nRCPT TO:<c@x>\r\nDATA\r\n"
+    assert smtp.writes[1] == b"Subject: hi\r\n\r\n..line\r\n.\r\n"
+
+
+def test_all_recipients_refused_ends_data_and_resets():
+    smtp = _ScriptedSMTP([(250, b""), (550, b"no"), (354, b""), (250, b"")])
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        smtp.sendmail("a@x", ["b@x"], b"body")
+
+    assert smtp.writes[1:] == [b".\r\n", "RSET"]
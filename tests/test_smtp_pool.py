@@ -0,0 +1,77 @@
+import smtplib
+
+import pytest
+
+from openmail.smtp.pool import SMTPConnectionPool
+
+
+class _Server:
+    def __init__(self):
+        self.sock = object()
+        self.quit_called = False
+
+    def noop(self):
+        return 250, b"ok"
+
+    def quit(self):
+        self.quit_called = True
+        self.sock = None
+
+
+def test_pool_reuses_hot_connection_and_retires_at_cap():
+    opened = []
+
+    def connect():
+        opened.append(_Server())
+        return opened[-1]
+
+    pool = SMTPConnectionPool(connect, max_connections=2, max_messages_per_connection=3)
+
+    for _ in range(4):
+        with pool.acquire():
+            pass
+
+    assert len(opened) == 2
+    assert opened[0].quit_called and not opened[1].quit_called
+
+
+def test_pool_discards_dropped_connection_but_keeps_refused_one():
+    opened = []
+
+    def connect():
+        opened.append(_Server())
+        return opened[-1]
+
+    pool = SMTPConnectionPool(connect, max_connections=1)
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        with pool.acquire():
+            raise smtplib.SMTPRecipientsRefused({})
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        with pool.acquire() as server:
+            assert server is opened[0]
+            raise smtplib.SMTPServerDisconnected()
+    with pool.acquire() as server:
+        assert server is opened[1]
+
+
+def test_pool_reaps_connections_idle_past_max_idle():
+    opened = []
+
+    def connect():
+        opened.append(_Server())
+        return opened[-1]
+
+    pool = SMTPConnectionPool(connect, max_connections=2, max_idle=100.0)
+
+    with pool.acquire():
+        with pool.acquire():
+            pass
+    assert pool.idle_count() == 2
+
+    pool._idle.queue[0].last_used -= 200  # the colder of the two
+    with pool.acquire():
+        pass
+
+    assert pool.idle_count() == 1
+    assert sum(s.quit_called for s in opened) == 1
@@ -7,6 +7,7 @@ import openmail.subscription.detector as detector_mod
 import openmail.subscription.service as service_mod
 from openmail.models import (
     EmailMessage,
+    LazyHeaders,
     UnsubscribeActionResult,
     UnsubscribeCandidate,
     UnsubscribeMethod,
@@ -43,6 +44,7 @@ class RecordingFakeIMAPClient(FakeIMAPClient):
         super().__init__()
         self.search_page_cached_calls = []
         self.fetch_calls = []
+        self.fetch_overview_calls = []
 
     def search_page_cached(
         self,
@@ -70,6 +72,10 @@ class RecordingFakeIMAPClient(FakeIMAPClient):
         self.fetch_calls.append((list(refs), include_attachment_meta))
         return super().fetch(refs, include_attachment_meta=include_attachment_meta)
 
+    def fetch_overview(self, refs):
+        self.fetch_overview_calls.append(list(refs))
+        return super().fetch_overview(refs)
+
 
 def _mk_email_message(*, subject: str, from_email: str, headers: dict) -> EmailMessage:
     # FakeIMAPClient.add_parsed_message() will overwrite the ref.
@@ -154,7 +160,7 @@ def test_subscription_detector_builds_candidates_and_uses_query(monkeypatch):
     cand = cands[0]
     assert isinstance(cand, UnsubscribeCandidate)
     assert cand.ref == ref1
-    assert cand.from_email == "sender1@example.com"
+    assert cand.from_email.email == "sender1@example.com"
     assert cand.subject == "Subject 1"
     assert len(cand.methods) == 1
     assert cand.methods[0].kind == "mailto"
@@ -173,11 +179,12 @@ def test_subscription_detector_builds_candidates_and_uses_query(monkeypatch):
     # IMAPQuery.since("YYYY-MM-DD") formats to SINCE DD-Mon-YYYY
     assert "SINCE 01-Jan-2025" in built
 
-    # fetch called once with the refs returned by search_page_cached
-    assert len(imap.fetch_calls) == 1
-    fetched_refs, include_attachment_meta = imap.fetch_calls[0]
-    assert include_attachment_meta is False
-    assert set(fetched_refs) == {ref1, ref2, ref3}
+    # the server filters on the header; only headers of the matches are fetched
+    assert 'HEADER "List-Unsubscribe" ""' in built
+    assert imap.fetch_calls == []
+    assert len(imap.fetch_overview_calls) == 1
+    assert set(imap.fetch_overview_calls[0]) == {ref1, ref3}
+    assert ref2 not in imap.fetch_overview_calls[0]
 
 
 def test_get_header_is_case_insensitive():
@@ -343,3 +350,13 @@ def test_unsubscribe_no_supported_method_goes_to_skipped():
     assert r.method is None
     assert r.sent is False
     assert r.note == "No supported unsubscribe method"
+
+
+def test_get_header_decodes_only_the_header_it_returns():
+    decoded = []
+    h = LazyHeaders(
+        [("Received", "r"), ("list-unsubscribe", "<mailto:x@example.com>")],
+        lambda v: decoded.append(v) or v,
+    )
+    assert detector_mod._get_header(h, "List-Unsubscribe") == "<mailto:x@example.com>"
+    assert decoded == ["<mailto:x@example.com>"]